@@ -1,16 +1,25 @@
 """ABSORB Stage — Classify files to target organ/org/repo using 7 priority rules."""
 
+import os
+import re
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 from alchemia.absorb.name_variants import (
-    DIR_TO_ORGAN,
     INSORT_TARGET,
     MET4_TARGET,
-    NAME_VARIANTS,
     PROCESS_CONTAINER_TARGET,
-    STAGING_DIR_TO_ORG,
 )
-from alchemia.absorb.registry_loader import load_registry
+from alchemia.absorb.registry_loader import build_toplevel_dispatch, load_registry
+
+try:
+    import ahocorasick
+except ImportError:  # optional: pip install alchemia[fast]
+    ahocorasick = None
 
 # Organ-level keyword patterns for Rule 6 (content-keyword heuristic)
 ORGAN_KEYWORDS = {
@@ -152,16 +161,58 @@
 }
 
 
+# Rule 4 markers; group order is rule priority (processCONTAINER > inSORT > MET4)
+_RULE4_RE = re.compile(r"(processCONTAINER)|(inSORT)|(MET4)")
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every organ keyword, or None if unavailable."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw_info in ORGAN_KEYWORDS.values():
+        for kw in kw_info["keywords"]:
+            automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+_KEYWORD_SETS = {organ: frozenset(info["keywords"]) for organ, info in ORGAN_KEYWORDS.items()}
+
+
+def _keyword_scores(content: str) -> dict[str, int]:
+    """Count the distinct keywords of each organ that appear in content.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, otherwise
+    one substring search per keyword.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return {
+            organ: sum(1 for kw in kw_info["keywords"] if kw in content)
+            for organ, kw_info in ORGAN_KEYWORDS.items()
+        }
+    matched = {kw for _end, kw in _KEYWORD_AUTOMATON.iter(content)}
+    if not matched:
+        return dict.fromkeys(ORGAN_KEYWORDS, 0)
+    return {
+        organ: 0 if kws.isdisjoint(matched) else len(kws & matched)
+        for organ, kws in _KEYWORD_SETS.items()
+    }
+
+
 def _get_toplevel_dir(entry: dict) -> str:
     """Get the top-level workspace directory name from a file path."""
-    parts = Path(entry["path"]).parts
-    try:
-        ws_idx = parts.index("Workspace")
-        if ws_idx + 1 < len(parts):
-            return parts[ws_idx + 1]
-    except ValueError:
-        pass
-    return ""
+    path = entry["path"]
+    if path.startswith("Workspace/"):
+        start = len("Workspace/")
+    else:
+        idx = path.find("/Workspace/")
+        if idx < 0:
+            return ""
+        start = idx + len("/Workspace/")
+    end = path.find("/", start)
+    return path[start:] if end < 0 else path[start:end]
 
 
 def _subdir_for_ext(ext: str) -> str:
@@ -169,18 +220,91 @@ def _subdir_for_ext(ext: str) -> str:
     return EXT_TO_SUBDIR.get(ext, "theory")
 
 
+# Shared string objects for values repeated on every classification
+_CLASSIFIED = sys.intern("CLASSIFIED")
+_PENDING_REVIEW = sys.intern("PENDING_REVIEW")
+_SUBDIR_PATHS = {
+    ext: sys.intern(f"docs/source-materials/{subdir}/") for ext, subdir in EXT_TO_SUBDIR.items()
+}
+_DEFAULT_SUBDIR_PATH = sys.intern("docs/source-materials/theory/")
+
+
+def _subdir_path_for_ext(ext: str) -> str:
+    """Full target_subdir for an extension, e.g. "docs/source-materials/specs/"."""
+    return _SUBDIR_PATHS.get(ext, _DEFAULT_SUBDIR_PATH)
+
+
+# Extensions whose first lines Rule 6 scans for organ keywords
+_CONTENT_SCAN_EXTENSIONS = frozenset(
+    {".md", ".txt", ".py", ".js", ".ts", ".html", ".yaml", ".yml", ".json"},
+)
+
+# Below this many Rule-6 candidates, process start-up costs more than it saves
+PARALLEL_CONTENT_THRESHOLD = 512
+
+# Upper bound on the bytes read for Rule 6 — 50 lines of prose fit comfortably
+HEAD_READ_BYTES = 16384
+
+
 def _read_first_lines(path: str, n: int = 50) -> str:
-    """Read first N lines of a text file for keyword scanning."""
+    """Read first N lines of a text file for keyword scanning, in one bounded read.
+
+    Undecodable bytes become U+FFFD rather than being dropped, so the letters
+    on either side of them never merge into a keyword that is not in the text.
+    """
     try:
-        with Path(path).open("r", encoding="utf-8", errors="ignore") as f:
-            lines = []
-            for i, line in enumerate(f):
-                if i >= n:
-                    break
-                lines.append(line)
-            return "\n".join(lines).lower()
-    except (OSError, UnicodeDecodeError):
+        with Path(path).open("rb") as f:
+            head = f.read(HEAD_READ_BYTES)
+    except OSError:
         return ""
+    return b"\n".join(head.split(b"\n", n)[:n]).decode("utf-8", errors="replace").lower()
+
+
+class Classification(NamedTuple):
+    """Result of the rule chain.
+
+    Rules work with these compact tuples; classify_entry and classify_all
+    hand out plain dicts (via _asdict) since that is what absorb-mapping.json
+    and every downstream consumer reads.
+    """
+
+    rule: int
+    rule_name: str
+    confidence: float
+    target_organ: str | None
+    target_org: str | None
+    target_repo: str | None
+    target_subdir: str | None
+    status: str
+
+
+_PROCESS_CONTAINER = Classification(
+    4,
+    "process_container",
+    0.85,
+    "ORGAN-I",
+    PROCESS_CONTAINER_TARGET["org"],
+    PROCESS_CONTAINER_TARGET["repo"],
+    "docs/source-materials/specs/",
+    _CLASSIFIED,
+)
+_INSORT = Classification(
+    4,
+    "insort_routing",
+    0.8,
+    "ORGAN-I",
+    INSORT_TARGET["org"],
+    INSORT_TARGET["repo"],
+    "docs/source-materials/specs/",
+    _CLASSIFIED,
+)
+# Per-organ (target_organ, target_org, target_repo) for Rules 5 and 6
+_ORGAN_TARGETS = {organ: (organ, info["org"], None) for organ, info in ORGAN_KEYWORDS.items()}
+_RULE5_TEMPLATES = {
+    organ: (5, "manifest_category", 0.8, *_ORGAN_TARGETS.get(organ, (organ, "", None)))
+    for organ in MANIFEST_CATEGORY_TO_ORGAN.values()
+}
+_UNRESOLVED = Classification(7, "unresolved", 0.0, None, None, None, None, _PENDING_REVIEW)
 
 
 def classify_entry(entry: dict, registry: dict) -> dict:
@@ -196,163 +320,117 @@ def classify_entry(entry: dict, registry: dict) -> dict:
       - target_subdir: e.g. "docs/source-materials/theory/"
       - status: "CLASSIFIED" or "PENDING_REVIEW"
     """
-    toplevel = _get_toplevel_dir(entry)
-    by_name = registry["by_name"]
-    ext = entry.get("extension", "")
-    subdir = _subdir_for_ext(ext)
-
-    # Rule 1: Direct repo match — parent dir name matches a registry repo
-    if toplevel in by_name:
-        repo_info = by_name[toplevel]
-        return {
-            "rule": 1,
-            "rule_name": "direct_repo_match",
-            "confidence": 1.0,
-            "target_organ": repo_info["organ"],
-            "target_org": repo_info["org"],
-            "target_repo": repo_info["name"],
-            "target_subdir": f"docs/source-materials/{subdir}/",
-            "status": "CLASSIFIED",
-        }
+    classification = _classify_without_content(entry, registry) or _classify_content(
+        entry["path"],
+        entry.get("extension", ""),
+    )
+    return classification._asdict()
 
-    # Rule 2: Name-variant match — known discrepancy table
-    variant_name = NAME_VARIANTS.get(toplevel)
-    if variant_name and variant_name in by_name:
-        repo_info = by_name[variant_name]
-        return {
-            "rule": 2,
-            "rule_name": "name_variant_match",
-            "confidence": 0.95,
-            "target_organ": repo_info["organ"],
-            "target_org": repo_info["org"],
-            "target_repo": repo_info["name"],
-            "target_subdir": f"docs/source-materials/{subdir}/",
-            "status": "CLASSIFIED",
-        }
 
-    # Rule 3: Staging dir match — ORG-{N}-*-staging/ pattern
-    staging_org = STAGING_DIR_TO_ORG.get(toplevel)
-    if staging_org:
-        # Reverse lookup: org name → organ key (covers all organs)
-        org_to_organ = {info["org"]: organ for organ, info in ORGAN_KEYWORDS.items()}
-        return {
-            "rule": 3,
-            "rule_name": "staging_dir_match",
-            "confidence": 0.9,
-            "target_organ": org_to_organ.get(staging_org, ""),
-            "target_org": staging_org,
-            "target_repo": None,  # needs manual routing to specific repo
-            "target_subdir": f"docs/source-materials/{subdir}/",
-            "status": "CLASSIFIED",
-        }
+@lru_cache(maxsize=256)
+def _organ_for_category(category: str) -> str | None:
+    """Map a raw manifest category to its organ.
 
-    # Rule 3b: Directory-to-organ bulk routing (non-repo directories)
-    organ_dir = DIR_TO_ORGAN.get(toplevel)
-    if organ_dir:
-        return {
-            "rule": 3,
-            "rule_name": "dir_to_organ",
-            "confidence": 0.75,
-            "target_organ": organ_dir["organ"],
-            "target_org": organ_dir["org"],
-            "target_repo": None,
-            "target_subdir": f"docs/source-materials/{subdir}/",
-            "status": "CLASSIFIED",
-        }
+    Manifests use a handful of category strings, so the normalize-and-scan
+    runs once per distinct value and every later entry is a cache hit.
+    """
+    category = category.lower().strip()
+    for cat_prefix, organ in MANIFEST_CATEGORY_TO_ORGAN.items():
+        if cat_prefix in category:
+            return organ
+    return None
 
-    # Rule 4: processCONTAINER / inSORT / MET4 — specialized intake subdirs
-    rel_path = entry.get("relative_path", "")
-    file_path = entry.get("path", "")
-    if "processCONTAINER" in rel_path or "processCONTAINER" in file_path:
-        return {
-            "rule": 4,
-            "rule_name": "process_container",
-            "confidence": 0.85,
-            "target_organ": "ORGAN-I",
-            "target_org": PROCESS_CONTAINER_TARGET["org"],
-            "target_repo": PROCESS_CONTAINER_TARGET["repo"],
-            "target_subdir": "docs/source-materials/specs/",
-            "status": "CLASSIFIED",
-        }
-    if "inSORT" in rel_path or "inSORT" in file_path:
-        return {
-            "rule": 4,
-            "rule_name": "insort_routing",
-            "confidence": 0.8,
-            "target_organ": "ORGAN-I",
-            "target_org": INSORT_TARGET["org"],
-            "target_repo": INSORT_TARGET["repo"],
-            "target_subdir": "docs/source-materials/specs/",
-            "status": "CLASSIFIED",
-        }
-    if "MET4" in rel_path or "MET4" in file_path:
-        return {
-            "rule": 4,
-            "rule_name": "met4_routing",
-            "confidence": 0.8,
-            "target_organ": MET4_TARGET["organ"],
-            "target_org": MET4_TARGET["org"],
-            "target_repo": None,
-            "target_subdir": f"docs/source-materials/{subdir}/",
-            "status": "CLASSIFIED",
-        }
 
-    # Rule 5: MANIFEST_INDEX_TABLE — CSV category + tags lookup
-    manifest = entry.get("manifest")
-    if manifest and manifest.get("manifest_category"):
-        category = manifest["manifest_category"].lower().strip()
-        for cat_prefix, organ in MANIFEST_CATEGORY_TO_ORGAN.items():
-            if cat_prefix in category:
-                organ_info = ORGAN_KEYWORDS.get(organ, {})
-                return {
-                    "rule": 5,
-                    "rule_name": "manifest_category",
-                    "confidence": 0.8,
-                    "target_organ": organ,
-                    "target_org": organ_info.get("org", ""),
-                    "target_repo": None,
-                    "target_subdir": f"docs/source-materials/{subdir}/",
-                    "status": "CLASSIFIED",
-                }
+def build_classifier(registry: dict) -> Callable[[dict], Classification | None]:
+    """Specialize Rules 1-5 to one registry.
+
+    The dispatch tables and helpers are bound as closure variables up front,
+    so classifying an entry does no registry or module-global lookups.
+    Returns a function mapping an entry to a Classification, or None when
+    the entry needs Rule 6 content scanning.
+    """
+    dispatch = registry.get("toplevel_dispatch")
+    if dispatch is None:
+        # Hand-built registries carry only by_name; the registry itself is left untouched
+        dispatch = build_toplevel_dispatch(registry["by_name"])
+    dispatch_get = dispatch.get
+    subdir_path_get = _SUBDIR_PATHS.get
+    default_subdir_path = _DEFAULT_SUBDIR_PATH
+    get_toplevel_dir = _get_toplevel_dir
+    rule4_finditer = _RULE4_RE.finditer
+    organ_for_category = _organ_for_category
+    rule5_templates = _RULE5_TEMPLATES
+    met4_template = (4, "met4_routing", 0.8, MET4_TARGET["organ"], MET4_TARGET["org"], None)
+    process_container = _PROCESS_CONTAINER
+    insort = _INSORT
+    classified = _CLASSIFIED
+
+    def classify(entry: dict) -> Classification | None:
+        subdir_path = subdir_path_get(entry.get("extension", ""), default_subdir_path)
+
+        # Rules 1-3b: single lookup on the top-level directory
+        hit = dispatch_get(get_toplevel_dir(entry))
+        if hit:
+            return Classification(*hit, subdir_path, classified)
+
+        # Rule 4: processCONTAINER / inSORT / MET4 — specialized intake subdirs
+        rel_path = entry.get("relative_path", "")
+        file_path = entry.get("path", "")
+        hits = {m.lastindex for m in rule4_finditer(f"{rel_path}\0{file_path}")}
+        if hits:
+            marker = min(hits)
+            if marker == 1:
+                return process_container
+            if marker == 2:
+                return insort
+            return Classification(*met4_template, subdir_path, classified)
+
+        # Rule 5: MANIFEST_INDEX_TABLE — CSV category + tags lookup
+        manifest = entry.get("manifest")
+        if manifest and manifest.get("manifest_category"):
+            organ = organ_for_category(manifest["manifest_category"])
+            if organ:
+                return Classification(*rule5_templates[organ], subdir_path, classified)
+
+        return None
+
+    return classify
+
+
+def _classify_without_content(entry: dict, registry: dict) -> Classification | None:
+    """Rules 1-5: path, registry and manifest lookups — no file I/O."""
+    return build_classifier(registry)(entry)
+
 
+def _classify_content(path: str, ext: str) -> Classification:
+    """Rules 6-7: content-keyword heuristic, else flag for review.
+
+    Module-level so it can be dispatched to worker processes.
+    """
     # Rule 6: Content-keyword heuristic — scan first lines for organ keywords
-    text_extensions = {".md", ".txt", ".py", ".js", ".ts", ".html", ".yaml", ".yml", ".json"}
-    if ext in text_extensions:
-        content = _read_first_lines(entry["path"])
+    if ext in _CONTENT_SCAN_EXTENSIONS:
+        content = _read_first_lines(path)
         if content:
             best_organ = None
             best_score = 0
-            for organ, kw_info in ORGAN_KEYWORDS.items():
-                score = sum(1 for kw in kw_info["keywords"] if kw in content)
+            for organ, score in _keyword_scores(content).items():
                 if score > best_score:
                     best_score = score
                     best_organ = organ
 
             if best_organ and best_score >= 2:
-                organ_info = ORGAN_KEYWORDS[best_organ]
                 confidence = min(0.5 + best_score * 0.1, 0.85)
-                return {
-                    "rule": 6,
-                    "rule_name": "content_keyword",
-                    "confidence": confidence,
-                    "target_organ": best_organ,
-                    "target_org": organ_info["org"],
-                    "target_repo": None,
-                    "target_subdir": f"docs/source-materials/{subdir}/",
-                    "status": "CLASSIFIED",
-                }
+                return Classification(
+                    6,
+                    "content_keyword",
+                    confidence,
+                    *_ORGAN_TARGETS[best_organ],
+                    _subdir_path_for_ext(ext),
+                    _CLASSIFIED,
+                )
 
     # Rule 7: Unresolved — flag for human review
-    return {
-        "rule": 7,
-        "rule_name": "unresolved",
-        "confidence": 0.0,
-        "target_organ": None,
-        "target_org": None,
-        "target_repo": None,
-        "target_subdir": None,
-        "status": "PENDING_REVIEW",
-    }
+    return _UNRESOLVED
 
 
 def classify_all(entries: list[dict], registry: dict | None = None) -> list[dict]:
@@ -360,11 +438,32 @@ def classify_all(entries: list[dict], registry: dict | None = None) -> list[dict
     if registry is None:
         registry = load_registry()
 
+    # Rules 1-5 are cheap lookups; only the remainder needs file content.
+    # The classifier is built once here rather than per entry.
+    classify = build_classifier(registry)
+    needs_content = []
+    for entry in entries:
+        classification = classify(entry)
+        if classification is None:
+            needs_content.append(entry)
+        else:
+            entry["classification"] = classification._asdict()
+
+    paths = [entry["path"] for entry in needs_content]
+    exts = [entry.get("extension", "") for entry in needs_content]
+    if len(needs_content) >= PARALLEL_CONTENT_THRESHOLD:
+        workers = os.cpu_count() or 1
+        chunksize = max(1, min(64, len(needs_content) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_classify_content, paths, exts, chunksize=chunksize))
+    else:
+        results = list(map(_classify_content, paths, exts))
+    for entry, classification in zip(needs_content, results, strict=True):
+        entry["classification"] = classification._asdict()
+
     stats = {i: 0 for i in range(1, 8)}
     for entry in entries:
-        classification = classify_entry(entry, registry)
-        entry["classification"] = classification
-        stats[classification["rule"]] += 1
+        stats[entry["classification"]["rule"]] += 1
 
     rule_names = {
         1: "direct_repo_match",
@@ -376,14 +475,18 @@ def classify_all(entries: list[dict], registry: dict | None = None) -> list[dict
         7: "unresolved",
     }
 
-    print("  Classification results:")
-    for rule_num, count in sorted(stats.items()):
-        print(f"    Rule {rule_num} ({rule_names[rule_num]}): {count}")
-
     classified = sum(v for k, v in stats.items() if k < 7)
     total = len(entries)
     pct = (classified / total * 100) if total else 0
-    print(f"  Classified: {classified}/{total} ({pct:.1f}%)")
-    print(f"  Pending review: {stats[7]}")
+
+    # One write for the whole report rather than a print per line
+    lines = ["  Classification results:"]
+    lines.extend(
+        f"    Rule {rule_num} ({rule_names[rule_num]}): {count}"
+        for rule_num, count in sorted(stats.items())
+    )
+    lines.append(f"  Classified: {classified}/{total} ({pct:.1f}%)")
+    lines.append(f"  Pending review: {stats[7]}")
+    print("\n".join(lines))
 
     return entries
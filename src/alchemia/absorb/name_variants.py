@@ -19,6 +19,17 @@
     "ORG-VII-marketing-staging": "organvm-vii-kerygma",
 }
 
+# GitHub org → organ key, for routing org-level targets such as staging dirs
+ORG_TO_ORGAN = {
+    "organvm-i-theoria": "ORGAN-I",
+    "organvm-ii-poiesis": "ORGAN-II",
+    "organvm-iii-ergon": "ORGAN-III",
+    "organvm-iv-taxis": "ORGAN-IV",
+    "organvm-v-logos": "ORGAN-V",
+    "organvm-vi-koinonia": "ORGAN-VI",
+    "organvm-vii-kerygma": "ORGAN-VII",
+}
+
 # processCONTAINER files → target repo
 PROCESS_CONTAINER_TARGET = {
     "org": "organvm-i-theoria",
@@ -12,10 +12,18 @@
 
 from __future__ import annotations
 
-import json
 import os
+import sys
 from pathlib import Path
 
+from alchemia.absorb.name_variants import (
+    DIR_TO_ORGAN,
+    NAME_VARIANTS,
+    ORG_TO_ORGAN,
+    STAGING_DIR_TO_ORG,
+)
+from alchemia.common import jsonio
+
 REGISTRY_PATH = (
     Path(
         os.environ.get(
@@ -35,9 +43,63 @@ def _load_raw(path: Path | None = None) -> dict:
         return _engine_load(path)
     except ImportError:
         # Standalone fallback — alchemia can run without the engine installed
-        path = path or REGISTRY_PATH
-        with Path(path).open(encoding="utf-8") as f:
-            return json.load(f)
+        return jsonio.load_path(path or REGISTRY_PATH)
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern registry strings, which are parsed as fresh objects per repo."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def build_toplevel_dispatch(by_name: dict) -> dict[str, tuple]:
+    """Fuse Rules 1-3b into one lookup: toplevel dir → (rule, rule_name, confidence,
+    target_organ, target_org, target_repo).
+
+    Entries are inserted lowest priority first so that higher-priority rules
+    overwrite them, preserving the order of the original if/elif chain.
+    """
+    dispatch = {}
+
+    # Rule 3b: Directory-to-organ bulk routing (non-repo directories)
+    for toplevel, organ_dir in DIR_TO_ORGAN.items():
+        dispatch[toplevel] = (3, "dir_to_organ", 0.75, organ_dir["organ"], organ_dir["org"], None)
+
+    # Rule 3: Staging dir match — repo needs manual routing
+    for toplevel, staging_org in STAGING_DIR_TO_ORG.items():
+        dispatch[toplevel] = (
+            3,
+            "staging_dir_match",
+            0.9,
+            ORG_TO_ORGAN.get(staging_org, ""),
+            staging_org,
+            None,
+        )
+
+    # Rule 2: Name-variant match — only when the canonical name is registered
+    for toplevel, variant_name in NAME_VARIANTS.items():
+        repo_info = by_name.get(variant_name)
+        if repo_info:
+            dispatch[toplevel] = (
+                2,
+                "name_variant_match",
+                0.95,
+                _intern(repo_info["organ"]),
+                _intern(repo_info["org"]),
+                _intern(repo_info["name"]),
+            )
+
+    # Rule 1: Direct repo match
+    for name, repo_info in by_name.items():
+        dispatch[name] = (
+            1,
+            "direct_repo_match",
+            1.0,
+            _intern(repo_info["organ"]),
+            _intern(repo_info["org"]),
+            _intern(repo_info["name"]),
+        )
+
+    return dispatch
 
 
 def load_registry(path: Path | None = None) -> dict:
@@ -48,6 +110,7 @@ def load_registry(path: Path | None = None) -> dict:
       - by_name: dict mapping repo name → repo info
       - by_org: dict mapping org name → list of repos
       - archived: set of archived repo names
+      - toplevel_dispatch: fused Rules 1-3b lookup (see build_toplevel_dispatch)
     """
     reg = _load_raw(path)
 
@@ -78,4 +141,5 @@ def load_registry(path: Path | None = None) -> dict:
         "by_name": by_name,
         "by_org": by_org,
         "archived": archived,
+        "toplevel_dispatch": build_toplevel_dispatch(by_name),
     }
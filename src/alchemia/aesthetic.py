@@ -1,52 +1,84 @@
 """Aesthetic Nervous System — taste.yaml management and capture."""
 
+import copy
 import shutil
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 TASTE_PATH = Path(__file__).parent.parent.parent / "taste.yaml"
 
+# Organ key → modifier file under data/organ-aesthetics/
+ORGAN_AESTHETIC_FILES = {
+    "ORGAN-I": "organ-i-theoria.yaml",
+    "ORGAN-II": "organ-ii-poiesis.yaml",
+    "ORGAN-III": "organ-iii-ergon.yaml",
+    "ORGAN-IV": "organ-iv-taxis.yaml",
+    "ORGAN-V": "organ-v-logos.yaml",
+    "ORGAN-VI": "organ-vi-koinonia.yaml",
+    "ORGAN-VII": "organ-vii-kerygma.yaml",
+    "META": "organ-meta.yaml",
+}
+
 
 def load_taste(path: Path | None = None) -> dict:
-    """Load the taste.yaml file."""
-    path = path or TASTE_PATH
+    """Load the taste.yaml file.
+
+    Parses are cached per (path, mtime, size); callers get a private copy
+    they are free to mutate.
+    """
+    return _load_yaml(Path(path or TASTE_PATH))
+
+
+def _load_yaml(path: Path) -> dict:
+    """Parse a YAML file through the (path, mtime, size) cache; returns a private copy."""
+    st = path.stat()
+    return copy.deepcopy(_load_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file; mtime_ns and size are part of the cache key."""
     with Path(path).open() as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)
 
 
 def save_taste(data: dict, path: Path | None = None) -> None:
     """Save the taste.yaml file, preserving comments via backup-and-write."""
     path = path or TASTE_PATH
     with Path(path).open("w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            data,
+            f,
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
 
-def add_reference(
+def _reference_entry(
     ref_type: str,
     value: str,
-    tags: list[str] | None = None,
-    notes: str = "",
-    path: Path | None = None,
+    tags: list[str] | None,
+    notes: str,
+    *,
+    path: Path | None,
+    captured: str,
 ) -> dict:
-    """Add a reference to taste.yaml.
-
-    Args:
-        ref_type: "url", "screenshot", "note", or "description"
-        value: URL string, file path, or note text
-        tags: List of tags for categorization
-        notes: Additional notes about why this reference matters
-        path: Override taste.yaml path
-    """
-    taste = load_taste(path)
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
+    """Build one references entry, copying screenshots into inspirations/."""
     entry = {
         "type": ref_type,
         "tags": tags or ["uncategorized"],
         "notes": notes,
-        "captured": now,
+        "captured": captured,
     }
 
     if ref_type == "url":
@@ -67,12 +99,71 @@ def add_reference(
         entry["type"] = "description"
         entry["text"] = value
 
+    return entry
+
+
+def add_reference(
+    ref_type: str,
+    value: str,
+    tags: list[str] | None = None,
+    notes: str = "",
+    path: Path | None = None,
+) -> dict:
+    """Add a reference to taste.yaml.
+
+    Args:
+        ref_type: "url", "screenshot", "note", or "description"
+        value: URL string, file path, or note text
+        tags: List of tags for categorization
+        notes: Additional notes about why this reference matters
+        path: Override taste.yaml path
+    """
+    ref = {"ref_type": ref_type, "value": value, "tags": tags, "notes": notes}
+    return add_references([ref], path)[0]
+
+
+def add_references(refs: Iterable[dict], path: Path | None = None) -> list[dict]:
+    """Add many references to taste.yaml with a single load and save.
+
+    Each item holds add_reference's keyword arguments (ref_type, value and
+    optionally tags, notes). Returns the entries written, in order.
+    """
+    taste = load_taste(path)
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    entries = [
+        _reference_entry(
+            ref["ref_type"],
+            ref["value"],
+            ref.get("tags"),
+            ref.get("notes", ""),
+            path=path,
+            captured=now,
+        )
+        for ref in refs
+    ]
+    if not entries:
+        return entries
+
     if taste.get("references") is None:
         taste["references"] = []
-    taste["references"].append(entry)
+    taste["references"].extend(entries)
     save_taste(taste, path)
 
-    return entry
+    return entries
+
+
+def organ_aesthetic_path(
+    organ: str,
+    taste_path: Path | None = None,
+    organ_aesthetics_dir: Path | None = None,
+) -> Path | None:
+    """Return the organ's modifier file, or None when it has none."""
+    name = ORGAN_AESTHETIC_FILES.get(organ)
+    if name is None:
+        return None
+    default_dir = (taste_path or TASTE_PATH).parent / "data" / "organ-aesthetics"
+    organ_file = (organ_aesthetics_dir or default_dir) / name
+    return organ_file if organ_file.is_file() else None
 
 
 def resolve_aesthetic_chain(
@@ -80,12 +171,17 @@ def resolve_aesthetic_chain(
     repo: str | None = None,
     taste_path: Path | None = None,
     organ_aesthetics_dir: Path | None = None,
+    taste: dict | None = None,
 ) -> dict:
     """Resolve the full cascading aesthetic chain.
 
     Returns a merged dict: taste.yaml ← organ-aesthetic.yaml ← repo-aesthetic.yaml
+
+    Pass an already loaded taste dict to skip reading taste_path; it is not
+    modified, so one load can be shared across organs.
     """
-    taste = load_taste(taste_path)
+    if taste is None:
+        taste = load_taste(taste_path)
 
     result = {
         "palette": taste.get("palette", {}),
@@ -93,27 +189,14 @@ def resolve_aesthetic_chain(
         "tone": taste.get("tone", {}),
         "visual_language": taste.get("visual_language", {}),
         "anti_patterns": taste.get("anti_patterns", []),
-        "references": taste.get("references", []),
+        "references": list(taste.get("references", [])),
     }
 
     # Layer organ aesthetic
     if organ:
-        default_dir = (taste_path or TASTE_PATH).parent / "data" / "organ-aesthetics"
-        organ_dir = organ_aesthetics_dir or default_dir
-        organ_map = {
-            "ORGAN-I": "organ-i-theoria.yaml",
-            "ORGAN-II": "organ-ii-poiesis.yaml",
-            "ORGAN-III": "organ-iii-ergon.yaml",
-            "ORGAN-IV": "organ-iv-taxis.yaml",
-            "ORGAN-V": "organ-v-logos.yaml",
-            "ORGAN-VI": "organ-vi-koinonia.yaml",
-            "ORGAN-VII": "organ-vii-kerygma.yaml",
-            "META": "organ-meta.yaml",
-        }
-        organ_file = organ_dir / organ_map.get(organ, "")
-        if organ_file.exists():
-            with Path(organ_file).open() as f:
-                organ_data = yaml.safe_load(f)
+        organ_file = organ_aesthetic_path(organ, taste_path, organ_aesthetics_dir)
+        if organ_file is not None:
+            organ_data = _load_yaml(organ_file)
             result["organ_modifiers"] = organ_data.get("modifiers", {})
             result["organ_name"] = organ_data.get("name", "")
             result["references"].extend(organ_data.get("specific_references", []))
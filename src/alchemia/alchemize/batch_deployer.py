@@ -1,45 +1,125 @@
-"""Batch deployment via GitHub push_files (single commit per repo)."""
+"""Batch deployment via the GitHub Git Data API (blobs → tree → commit → ref)."""
 
 import base64
-import json
-import subprocess
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import quote
 
 from alchemia.absorb.registry_loader import load_registry
+from alchemia.alchemize.github_client import api
 from alchemia.alchemize.transformer import classify_action, get_deploy_path
 
+# Concurrent blob uploads per repo; each worker thread holds its own connection
+UPLOAD_WORKERS = 8
+
+# GitHub rejects blobs over 100 MB; refuse them before reading anything
+MAX_BLOB_BYTES = 100 * 1024 * 1024
+
 
 def get_default_branch(org: str, repo: str) -> str:
     """Get the default branch of a repo."""
-    result = subprocess.run(
-        ["gh", "api", f"/repos/{org}/{repo}", "--jq", ".default_branch"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        return result.stdout.strip()
+    data, _ = api("GET", f"/repos/{org}/{repo}")
+    if isinstance(data, dict) and data.get("default_branch"):
+        return data["default_branch"]
     return "main"
 
 
 def is_repo_archived(org: str, repo: str) -> bool:
     """Check if a repo is archived."""
-    result = subprocess.run(
-        ["gh", "api", f"/repos/{org}/{repo}", "--jq", ".archived"],
-        capture_output=True,
-        text=True,
-    )
-    return result.stdout.strip() == "true"
+    data, _ = api("GET", f"/repos/{org}/{repo}")
+    return isinstance(data, dict) and data.get("archived") is True
 
 
 def check_file_exists(org: str, repo: str, path: str) -> bool:
     """Check if a file already exists in the repo."""
-    result = subprocess.run(
-        ["gh", "api", f"/repos/{org}/{repo}/contents/{path}"],
-        capture_output=True,
-        text=True,
+    data, _ = api("GET", f"/repos/{org}/{repo}/contents/{quote(path, safe='/')}")
+    return data is not None
+
+
+# Head of a repository with no commits yet: the first commit has no parent
+EMPTY_HEAD = (None, None)
+
+
+def get_branch_head(org: str, repo: str, branch: str) -> tuple | None:
+    """Return (commit sha, tree sha) at the tip of branch, or None.
+
+    An empty repository has no refs at all (GitHub answers 409); it yields
+    EMPTY_HEAD so the caller can create the first commit.
+    """
+    ref, err = api("GET", f"/repos/{org}/{repo}/git/ref/heads/{branch}")
+    if not ref:
+        return EMPTY_HEAD if err and "409" in err else None
+    commit_sha = ref["object"]["sha"]
+    commit, _ = api("GET", f"/repos/{org}/{repo}/git/commits/{commit_sha}")
+    if not commit:
+        return None
+    return commit_sha, commit["tree"]["sha"]
+
+
+def list_tree_paths(org: str, repo: str, tree_sha: str) -> set[str] | None:
+    """List every file path in a tree with one recursive call.
+
+    Returns None when the listing is unavailable or truncated by GitHub,
+    in which case callers fall back to per-file existence checks.
+    """
+    tree, _ = api("GET", f"/repos/{org}/{repo}/git/trees/{tree_sha}?recursive=1")
+    if not tree or tree.get("truncated"):
+        return None
+    return {item["path"] for item in tree.get("tree", []) if item.get("type") == "blob"}
+
+
+def create_blob(org: str, repo: str, content: bytes) -> tuple:
+    """Upload file content as a git blob. Returns (blob sha, None) or (None, error)."""
+    payload = {"content": base64.b64encode(content).decode("ascii"), "encoding": "base64"}
+    blob, err = api("POST", f"/repos/{org}/{repo}/git/blobs", payload)
+    return (blob["sha"], None) if blob else (None, err)
+
+
+def commit_tree(
+    org: str,
+    repo: str,
+    parent: tuple,
+    tree_entries: list[dict],
+    message: str,
+) -> tuple:
+    """Create a tree on top of parent's tree and a commit pointing at it.
+
+    parent is (commit sha, tree sha), or EMPTY_HEAD for a root commit.
+    Returns ((commit sha, tree sha), None) or (None, error). The branch ref
+    is not moved.
+    """
+    parent_commit, base_tree = parent
+    tree_payload = {"tree": tree_entries}
+    if base_tree is not None:
+        tree_payload["base_tree"] = base_tree
+    tree, err = api("POST", f"/repos/{org}/{repo}/git/trees", tree_payload)
+    if not tree:
+        return None, err
+    commit, err = api(
+        "POST",
+        f"/repos/{org}/{repo}/git/commits",
+        {
+            "message": message,
+            "tree": tree["sha"],
+            "parents": [] if parent_commit is None else [parent_commit],
+        },
     )
-    return result.returncode == 0
+    if not commit:
+        return None, err
+    return (commit["sha"], tree["sha"]), None
+
+
+def move_branch(org: str, repo: str, branch: str, head: tuple, commit_sha: str) -> str | None:
+    """Point branch at commit_sha, creating the ref when head is EMPTY_HEAD.
+
+    Returns None on success or an error message.
+    """
+    if head[0] is None:
+        payload = {"ref": f"refs/heads/{branch}", "sha": commit_sha}
+        _, err = api("POST", f"/repos/{org}/{repo}/git/refs", payload)
+    else:
+        _, err = api("PATCH", f"/repos/{org}/{repo}/git/refs/heads/{branch}", {"sha": commit_sha})
+    return err
 
 
 def build_deployment_manifest(entries: list[dict], registry: dict | None = None) -> dict:
@@ -56,7 +136,7 @@ def build_deployment_manifest(entries: list[dict], registry: dict | None = None)
     if registry is None:
         registry = load_registry()
 
-    manifest = defaultdict(lambda: {"files": []})
+    manifest = {}
 
     for entry in entries:
         classification = entry.get("classification", {})
@@ -79,9 +159,10 @@ def build_deployment_manifest(entries: list[dict], registry: dict | None = None)
         target_path = get_deploy_path(entry)
 
         key = f"{org}/{repo}"
-        manifest[key]["org"] = org
-        manifest[key]["repo"] = repo
-        manifest[key]["files"].append(
+        bucket = manifest.get(key)
+        if bucket is None:
+            bucket = manifest[key] = {"org": org, "repo": repo, "files": []}
+        bucket["files"].append(
             {
                 "source": entry["path"],
                 "target": target_path,
@@ -90,7 +171,45 @@ def build_deployment_manifest(entries: list[dict], registry: dict | None = None)
             },
         )
 
-    return dict(manifest)
+    return manifest
+
+
+def _upload_one(
+    org: str,
+    repo: str,
+    file_info: dict,
+    existing: set[str] | None,
+    force: bool,
+) -> tuple:
+    """Upload one file as a blob unless it already exists.
+
+    Returns ("uploaded", tree entry, None), ("skipped", None, None) or
+    ("failed", None, error).
+    """
+    source = Path(file_info["source"])
+    target = file_info["target"]
+
+    # Check if file already exists (skip unless force)
+    if not force:
+        if existing is not None:
+            exists = target in existing
+        else:
+            exists = check_file_exists(org, repo, target)
+        if exists:
+            return "skipped", None, None
+
+    try:
+        size = source.stat().st_size
+        if size > MAX_BLOB_BYTES:
+            return "failed", None, f"{target}: {size} bytes exceeds the GitHub blob limit"
+        content = source.read_bytes()
+    except OSError as e:
+        return "failed", None, f"Read error {source}: {e}"
+
+    blob_sha, err = create_blob(org, repo, content)
+    if blob_sha is None:
+        return "failed", None, f"{target}: {err}"
+    return "uploaded", {"path": target, "mode": "100644", "type": "blob", "sha": blob_sha}, None
 
 
 def deploy_repo_batch(
@@ -103,8 +222,9 @@ def deploy_repo_batch(
 ) -> dict:
     """Deploy a batch of files to a single repo.
 
-    Uses gh api to push files. Groups into sub-batches to avoid
-    API payload limits.
+    Uploads each file as a blob, then commits every batch_size files as one
+    tree on top of the branch head. Commits are chained and the branch ref
+    is updated once, so the repo sees a single push.
 
     Returns deployment result dict.
     """
@@ -129,67 +249,79 @@ def deploy_repo_batch(
         print(f"  SKIP {org}/{repo}: archived")
         return result
 
-    branch = get_default_branch(org, repo)
+    # Missing sources fail up front so nothing is fetched for them
+    pending = []
+    for file_info in files:
+        source = Path(file_info["source"])
+        if source.exists():
+            pending.append(file_info)
+        else:
+            result["failed"] += 1
+            result["errors"].append(f"Source not found: {source}")
+
+    if not pending:
+        result["status"] = "completed"
+        return result
 
-    # Deploy files in sub-batches
-    for i in range(0, len(files), batch_size):
-        batch = files[i : i + batch_size]
+    branch = get_default_branch(org, repo)
+    head = get_branch_head(org, repo, branch)
+    if head is None:
+        result["status"] = "failed"
+        result["failed"] += len(pending)
+        result["errors"].append(f"Could not resolve {org}/{repo}@{branch}")
+        return result
 
-        for file_info in batch:
-            source = Path(file_info["source"])
-            target = file_info["target"]
+    if force:
+        existing = None
+    elif head[0] is None:
+        existing = set()
+    else:
+        existing = list_tree_paths(org, repo, head[1])
+    tip = head
+
+    # One commit per sub-batch, chained; the branch ref moves once at the end.
+    # Blob uploads within a sub-batch run concurrently.
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        for i in range(0, len(pending), batch_size):
+            batch = pending[i : i + batch_size]
+            tree_entries = []
+            filenames = []
+
+            for file_info, (outcome, tree_entry, err) in zip(
+                batch,
+                pool.map(lambda fi: _upload_one(org, repo, fi, existing, force), batch),
+                strict=True,
+            ):
+                if outcome == "skipped":
+                    result["skipped"] += 1
+                elif outcome == "failed":
+                    result["failed"] += 1
+                    result["errors"].append(err)
+                else:
+                    tree_entries.append(tree_entry)
+                    filenames.append(file_info["filename"])
 
-            if not source.exists():
-                result["failed"] += 1
-                result["errors"].append(f"Source not found: {source}")
+            if not tree_entries:
                 continue
 
-            # Check if file already exists (skip unless force)
-            if not force and check_file_exists(org, repo, target):
-                result["skipped"] += 1
+            if len(filenames) == 1:
+                message = f"chore(alchemia): ingest {filenames[0]}"
+            else:
+                message = f"chore(alchemia): ingest {len(tree_entries)} files"
+            new_tip, err = commit_tree(org, repo, tip, tree_entries, message)
+            if new_tip is None:
+                result["failed"] += len(tree_entries)
+                result["errors"].append(f"commit failed: {err}")
                 continue
-
-            try:
-                content = source.read_bytes()
-                b64 = base64.b64encode(content).decode("utf-8")
-
-                # Get existing SHA if overwriting
-                sha_cmd = ["gh", "api", f"/repos/{org}/{repo}/contents/{target}", "--jq", ".sha"]
-                sha_result = subprocess.run(sha_cmd, capture_output=True, text=True)
-                existing_sha = sha_result.stdout.strip() if sha_result.returncode == 0 else None
-
-                # Use stdin piping to avoid ARG_MAX on large files
-                payload = {
-                    "message": f"chore(alchemia): ingest {file_info['filename']}",
-                    "content": b64,
-                    "branch": branch,
-                }
-                if existing_sha:
-                    payload["sha"] = existing_sha
-
-                deploy_result = subprocess.run(
-                    [
-                        "gh",
-                        "api",
-                        "-X",
-                        "PUT",
-                        f"/repos/{org}/{repo}/contents/{target}",
-                        "--input",
-                        "-",
-                    ],
-                    input=json.dumps(payload),
-                    capture_output=True,
-                    text=True,
-                )
-                if deploy_result.returncode == 0:
-                    result["deployed"] += 1
-                else:
-                    err = deploy_result.stderr.strip()[:200]
-                    result["failed"] += 1
-                    result["errors"].append(f"{target}: {err}")
-            except OSError as e:
-                result["failed"] += 1
-                result["errors"].append(f"Read error {source}: {e}")
+            tip = new_tip
+            result["deployed"] += len(tree_entries)
+
+    if tip != head:
+        err = move_branch(org, repo, branch, head, tip[0])
+        if err:
+            result["failed"] += result["deployed"]
+            result["deployed"] = 0
+            result["errors"].append(f"ref update failed: {err}")
 
     result["status"] = "completed"
     return result
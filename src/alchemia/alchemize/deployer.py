@@ -3,7 +3,14 @@
 import base64
 import json
 import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
+
+from alchemia.alchemize import github_client
+
+CONFLICT_RETRIES = 3
 
 
 def gh_api(
@@ -12,7 +19,17 @@ def gh_api(
     data: dict | None = None,
     silent: bool = False,
 ) -> dict | str | None:
-    """Call GitHub API via gh CLI."""
+    """Call the GitHub API.
+
+    Goes over github_client's keep-alive connection when a token is
+    available, otherwise through the gh CLI.
+    """
+    if github_client.get_token() is not None:
+        result, err = github_client.api(method, endpoint, data)
+        if err and not silent:
+            print(f"    API error: {err}")
+        return result
+
     cmd = ["gh", "api", "-X", method, endpoint]
     if data:
         if "content" in data:
@@ -34,30 +51,48 @@ def gh_api(
         return result.stdout
 
 
+def _contents_endpoint(org: str, repo: str, path: str) -> str:
+    """Contents API endpoint for path, percent-encoded for the raw HTTP request line."""
+    return f"/repos/{org}/{repo}/contents/{quote(path, safe='/')}"
+
+
 def get_file_sha(org: str, repo: str, path: str) -> str | None:
     """Get the SHA of an existing file, or None if it doesn't exist."""
-    result = gh_api("GET", f"/repos/{org}/{repo}/contents/{path}", silent=True)
+    result = gh_api("GET", _contents_endpoint(org, repo, path), silent=True)
     if result and isinstance(result, dict) and "sha" in result:
         return result["sha"]
     return None
 
 
-def get_default_branch(org: str, repo: str) -> str:
-    """Get the default branch of a repo."""
+@lru_cache(maxsize=1024)
+def _repo_meta(org: str, repo: str) -> dict:
+    """Fetch /repos/{org}/{repo} once per process.
+
+    Raises LookupError when the lookup fails, so failures are not cached.
+    """
     result = gh_api("GET", f"/repos/{org}/{repo}", silent=True)
     if result and isinstance(result, dict):
-        return result.get("default_branch", "main")
-    return "main"
+        return result
+    raise LookupError(f"{org}/{repo}")
+
+
+def get_default_branch(org: str, repo: str) -> str:
+    """Get the default branch of a repo."""
+    try:
+        return _repo_meta(org, repo).get("default_branch", "main")
+    except LookupError:
+        return "main"
 
 
 def is_archived(org: str, repo: str) -> bool:
     """Check if a repo is archived on GitHub."""
-    result = gh_api("GET", f"/repos/{org}/{repo}", silent=True)
-    if result and isinstance(result, dict):
-        return result.get("archived", False)
-    return False
+    try:
+        return _repo_meta(org, repo).get("archived", False)
+    except LookupError:
+        return False
 
 
+@lru_cache(maxsize=1024)
 def is_branch_protected(org: str, repo: str, branch: str) -> bool:
     """Check if a branch has protection rules."""
     result = gh_api("GET", f"/repos/{org}/{repo}/branches/{branch}/protection", silent=True)
@@ -85,7 +120,6 @@ def put_file(
 
     b64_content = base64.b64encode(content_bytes).decode("utf-8")
 
-    # Use stdin piping to avoid ARG_MAX on large files
     payload = {
         "message": message,
         "content": b64_content,
@@ -95,14 +129,14 @@ def put_file(
     if branch:
         payload["branch"] = branch
 
-    result = subprocess.run(
-        ["gh", "api", "-X", "PUT", f"/repos/{org}/{repo}/contents/{path}", "--input", "-"],
-        input=json.dumps(payload),
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        err = result.stderr.strip()[:200]
+    # JSON body (stdin for the gh fallback) avoids ARG_MAX on large files.
+    # Concurrent commits to one branch can 409; those are retried.
+    for attempt in range(CONFLICT_RETRIES + 1):
+        _, err = github_client.api("PUT", _contents_endpoint(org, repo, path), payload)
+        if not err or "409" not in err or attempt == CONFLICT_RETRIES:
+            break
+        time.sleep(0.5 * (attempt + 1))
+    if err:
         print(f"    FAIL {path}: {err}")
         return False
     return True
@@ -0,0 +1,189 @@
+"""Keep-alive HTTPS client for the GitHub REST API.
+
+Every call used to spawn `gh api`, paying process start-up plus a fresh TLS
+handshake. This module reads the token once and reuses one persistent
+connection per thread. When no token is available it falls back to the
+gh CLI, so behaviour without credentials is unchanged.
+"""
+
+import http.client
+import json
+import os
+import subprocess
+import threading
+import time
+from functools import lru_cache
+
+from alchemia.common import jsonio
+
+API_HOST = "api.github.com"
+TIMEOUT = 30
+
+# Secondary rate limits (403/429) are retried after the advertised wait
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 60.0
+
+# Below this many remaining requests, wait for the window to reset first
+RATE_LIMIT_FLOOR = 10
+
+_local = threading.local()
+_rate_lock = threading.Lock()
+_rate_state = {"remaining": None, "reset": 0.0}
+
+
+@lru_cache(maxsize=1)
+def get_token() -> str | None:
+    """Resolve a GitHub token from GH_TOKEN / GITHUB_TOKEN or `gh auth token`."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def _connection() -> http.client.HTTPSConnection:
+    """Return this thread's persistent connection, opening it on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=TIMEOUT)
+        _local.conn = conn
+    return conn
+
+
+def _drop_connection() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+def _gh_cli(method: str, endpoint: str, payload: dict | None) -> tuple:
+    """Fallback transport: one `gh api` subprocess per call."""
+    cmd = ["gh", "api", "-X", method, endpoint]
+    if payload is not None:
+        cmd.extend(["--input", "-"])
+    result = subprocess.run(
+        cmd,
+        input=json.dumps(payload) if payload is not None else None,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None, result.stderr.strip()[:200]
+    if not result.stdout.strip():
+        return {}, None
+    try:
+        return jsonio.loads(result.stdout), None
+    except json.JSONDecodeError:
+        return None, f"unparseable response from {endpoint}"
+
+
+def _send(method: str, endpoint: str, body: bytes | None, headers: dict) -> tuple:
+    """Issue one request. Returns (response, body bytes, None) or (None, None, error)."""
+    # A keep-alive socket may have been closed by the server; retry once fresh
+    for attempt in range(2):
+        conn = _connection()
+        try:
+            conn.request(method, endpoint, body=body, headers=headers)
+            resp = conn.getresponse()
+            return resp, resp.read(), None
+        except (http.client.InvalidURL, ValueError) as e:
+            # InvalidURL / UnicodeEncodeError: the request line itself is bad, so don't retry
+            _drop_connection()
+            return None, None, f"invalid request: {e}"[:200]
+        except (http.client.HTTPException, OSError) as e:
+            _drop_connection()
+            if attempt:
+                return None, None, f"connection error: {e}"[:200]
+    return None, None, "connection error"
+
+
+def _rate_limit_wait(resp) -> float | None:
+    """Seconds to wait before retrying a rate-limited response, or None."""
+    if resp.status not in (403, 429):
+        return None
+    retry_after = resp.getheader("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RATE_LIMIT_WAIT)
+    if resp.getheader("X-RateLimit-Remaining") == "0":
+        reset = resp.getheader("X-RateLimit-Reset", "")
+        if reset.isdigit():
+            return min(max(float(reset) - time.time(), 1.0), MAX_RATE_LIMIT_WAIT)
+        return MAX_RATE_LIMIT_WAIT
+    return None
+
+
+def _record_rate_limit(resp) -> None:
+    """Remember the primary rate-limit budget reported by the last response."""
+    remaining = resp.getheader("X-RateLimit-Remaining")
+    reset = resp.getheader("X-RateLimit-Reset")
+    if remaining and remaining.isdigit() and reset and reset.isdigit():
+        with _rate_lock:
+            _rate_state["remaining"] = int(remaining)
+            _rate_state["reset"] = float(reset)
+
+
+def _throttle() -> None:
+    """Sleep until the window resets when the budget is nearly spent."""
+    with _rate_lock:
+        remaining = _rate_state["remaining"]
+        reset = _rate_state["reset"]
+    if remaining is not None and remaining < RATE_LIMIT_FLOOR:
+        wait = reset - time.time()
+        if wait > 0:
+            time.sleep(min(wait, MAX_RATE_LIMIT_WAIT))
+
+
+def api(method: str, endpoint: str, payload: dict | None = None) -> tuple:
+    """Call the GitHub REST API, sending payload as a JSON body.
+
+    Returns (parsed response, None) on success or (None, error message).
+    Empty success bodies (e.g. 204) parse as {}.
+    """
+    token = get_token()
+    if token is None:
+        return _gh_cli(method, endpoint, payload)
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+        "User-Agent": "alchemia",
+    }
+    body = None
+    if payload is not None:
+        body = json.dumps(payload).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        _throttle()
+        resp, raw, err = _send(method, endpoint, body, headers)
+        if err:
+            return None, err
+        _record_rate_limit(resp)
+        wait = _rate_limit_wait(resp)
+        if wait is None or attempt == RATE_LIMIT_RETRIES:
+            break
+        time.sleep(wait)
+
+    if resp.status >= 400:
+        try:
+            message = jsonio.loads(raw).get("message", "")
+        except (json.JSONDecodeError, AttributeError):
+            message = raw.decode("utf-8", errors="replace")
+        return None, f"HTTP {resp.status}: {message}"[:200]
+    if not raw:
+        return {}, None
+    try:
+        return jsonio.loads(raw), None
+    except json.JSONDecodeError:
+        return None, f"unparseable response from {endpoint}"
@@ -1,66 +1,150 @@
 """Generate PROVENANCE.yaml and provenance-registry.json."""
 
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 import yaml
 
+from alchemia.intake.dedup import hash_unhashed
 
-def generate_provenance_yaml(entries: list[dict], repo_name: str, org: str) -> str:
-    """Generate a PROVENANCE.yaml for a specific repo.
+# libyaml's C emitter when PyYAML was built with it
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-    Lists all source materials ingested into this repo with their
-    original paths, SHA-256 fingerprints, and classification metadata.
-    """
-    materials = []
-    for entry in entries:
-        classification = entry.get("classification", {})
-        if classification.get("target_repo") != repo_name:
-            continue
-        if classification.get("target_org") != org:
-            continue
 
-        materials.append(
-            {
-                "filename": entry["filename"],
-                "source_path": entry["path"],
-                "sha256": entry["sha256"],
-                "size_bytes": entry["size_bytes"],
-                "last_modified": entry["last_modified"],
-                "classification_rule": classification.get("rule_name", ""),
-                "confidence": classification.get("confidence", 0),
-                "target_subdir": classification.get("target_subdir", ""),
-            },
-        )
+def hash_missing(entries: list[dict]) -> int:
+    """Hash the entries intake left unhashed; returns how many were hashed.
 
-    if not materials:
-        return ""
+    Intake only hashes files that could have a duplicate. The rest are
+    hashed here, in parallel, and marked hashed_at="alchemize": their digest
+    reflects the file as it is now, which may postdate size_bytes and
+    last_modified.
+    """
+    hashed = hash_unhashed(entries)
+    for entry in hashed:
+        entry["hashed_at"] = "alchemize"
+    return len(hashed)
+
+
+def _with_hashed_at(record: dict, entry: dict) -> dict:
+    if "hashed_at" in entry:
+        record["hashed_at"] = entry["hashed_at"]
+    return record
+
+
+def _material(entry: dict, classification: dict) -> dict:
+    """One PROVENANCE.yaml materials record."""
+    record = {
+        "filename": entry["filename"],
+        "source_path": entry["path"],
+        "sha256": entry["sha256"],
+        "size_bytes": entry["size_bytes"],
+        "last_modified": entry["last_modified"],
+        "classification_rule": classification.get("rule_name", ""),
+        "confidence": classification.get("confidence", 0),
+        "target_subdir": classification.get("target_subdir", ""),
+    }
+    return _with_hashed_at(record, entry)
 
+
+def _dump_provenance(repo_name: str, org: str, materials: list[dict], generated: str) -> str:
+    """Serialize one repo's PROVENANCE.yaml document."""
     doc = {
         "schema_version": "1.0",
         "repo": repo_name,
         "org": org,
-        "generated": datetime.now(timezone.utc).isoformat(),
+        "generated": generated,
         "total_materials": len(materials),
         "materials": materials,
     }
 
-    return yaml.dump(doc, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    return yaml.dump(
+        doc,
+        Dumper=_SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def generate_provenance_yaml(
+    entries: list[dict],
+    repo_name: str,
+    org: str,
+    generated_at: str | None = None,
+) -> str:
+    """Generate a PROVENANCE.yaml for a specific repo.
+
+    Lists all source materials ingested into this repo with their
+    original paths, SHA-256 fingerprints, and classification metadata.
+    For many repos use generate_all_provenance_yaml, which scans entries once.
+    generated_at (ISO 8601) lets one run stamp every document identically;
+    it defaults to now.
+    """
+    selected = [
+        entry
+        for entry in entries
+        if (classification := entry.get("classification", {})).get("target_repo") == repo_name
+        and classification.get("target_org") == org
+    ]
+    if not selected:
+        return ""
+
+    hash_missing(selected)
+    materials = [_material(entry, entry["classification"]) for entry in selected]
 
+    return _dump_provenance(repo_name, org, materials, generated_at or _now_iso())
 
-def generate_provenance_registry(entries: list[dict]) -> dict:
+
+def generate_all_provenance_yaml(
+    entries: list[dict],
+    generated_at: str | None = None,
+) -> dict[str, str]:
+    """Generate PROVENANCE.yaml for every target repo in one pass over entries.
+
+    Returns {"org/repo": yaml text}; each document matches what
+    generate_provenance_yaml returns for that repo with the same generated_at.
+    """
+    grouped = defaultdict(list)
+    for entry in entries:
+        classification = entry.get("classification", {})
+        org = classification.get("target_org")
+        repo = classification.get("target_repo")
+        if org and repo:
+            grouped[(org, repo)].append(entry)
+
+    hash_missing([entry for group in grouped.values() for entry in group])
+    generated = generated_at or _now_iso()
+    return {
+        f"{org}/{repo}": _dump_provenance(
+            repo,
+            org,
+            [_material(entry, entry["classification"]) for entry in group],
+            generated,
+        )
+        for (org, repo), group in grouped.items()
+    }
+
+
+def generate_provenance_registry(entries: list[dict], generated_at: str | None = None) -> dict:
     """Generate the master provenance-registry.json with bidirectional traceability.
 
     Maps: source_file → target_repo AND target_repo → source_files
+    generated_at defaults to now, as for generate_provenance_yaml.
     """
     source_to_repo = {}
     repo_to_sources = defaultdict(list)
 
-    for entry in entries:
-        classification = entry.get("classification", {})
-        if classification.get("status") != "CLASSIFIED":
-            continue
-
+    classified = [
+        entry for entry in entries if entry.get("classification", {}).get("status") == "CLASSIFIED"
+    ]
+    hash_missing(classified)
+    for entry in classified:
+        classification = entry["classification"]
         org = classification.get("target_org") or ""
         repo = classification.get("target_repo") or "unspecified"
         target_key = f"{org}/{repo}"
@@ -73,18 +157,17 @@ def generate_provenance_registry(entries: list[dict]) -> dict:
             "confidence": classification.get("confidence", 0),
         }
 
-        repo_to_sources[target_key].append(
-            {
-                "source_path": source_path,
-                "filename": entry["filename"],
-                "sha256": entry["sha256"],
-                "size_bytes": entry["size_bytes"],
-            },
-        )
+        record = {
+            "source_path": source_path,
+            "filename": entry["filename"],
+            "sha256": entry["sha256"],
+            "size_bytes": entry["size_bytes"],
+        }
+        repo_to_sources[target_key].append(_with_hashed_at(record, entry))
 
     return {
         "schema_version": "1.0",
-        "generated": datetime.now(timezone.utc).isoformat(),
+        "generated": generated_at or _now_iso(),
         "total_classified": len(source_to_repo),
         "total_target_repos": len(repo_to_sources),
         "source_to_repo": source_to_repo,
@@ -92,11 +175,28 @@ def generate_provenance_registry(entries: list[dict]) -> dict:
     }
 
 
-def get_deployment_plan(entries: list[dict]) -> dict:
+@dataclass(slots=True)
+class RepoPlan:
+    """Entries bound for one repo, bucketed by deploy action."""
+
+    deploy: list[dict] = field(default_factory=list)
+    convert: list[dict] = field(default_factory=list)
+    reference: list[dict] = field(default_factory=list)
+    skip: list[dict] = field(default_factory=list)
+
+
+def get_deployment_plan(entries: list[dict]) -> dict[str, RepoPlan]:
     """Group classified entries by target repo for deployment planning."""
     from alchemia.alchemize.transformer import classify_action, get_deploy_path
 
-    plan = defaultdict(lambda: {"deploy": [], "convert": [], "reference": [], "skip": []})
+    # classify_action result → RepoPlan bucket
+    buckets = {
+        "deploy": "deploy",
+        "convert_docx": "convert",
+        "reference": "reference",
+        "skip": "skip",
+    }
+    plan = {}
 
     for entry in entries:
         classification = entry.get("classification", {})
@@ -109,16 +209,13 @@ def get_deployment_plan(entries: list[dict]) -> dict:
             continue
 
         key = f"{org}/{repo or 'unspecified'}"
-        action = classify_action(entry)
-
-        if action == "skip":
-            plan[key]["skip"].append(entry)
-        elif action == "reference":
-            plan[key]["reference"].append(entry)
-        elif action == "convert_docx":
-            plan[key]["convert"].append(entry)
-        else:
+        repo_plan = plan.get(key)
+        if repo_plan is None:
+            repo_plan = plan[key] = RepoPlan()
+
+        bucket = buckets[classify_action(entry)]
+        if bucket == "deploy":
             entry["_deploy_path"] = get_deploy_path(entry)
-            plan[key]["deploy"].append(entry)
+        getattr(repo_plan, bucket).append(entry)
 
-    return dict(plan)
+    return plan
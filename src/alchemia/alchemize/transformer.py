@@ -1,8 +1,11 @@
 """File transformation for the ALCHEMIZE stage."""
 
+import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # File handling rules per the plan
@@ -29,6 +32,22 @@
 
 MAX_BINARY_SIZE = 5 * 1024 * 1024  # 5MB
 MAX_IMAGE_SIZE = 2 * 1024 * 1024  # 2MB
+MAX_UNKNOWN_SIZE = 100 * 1024  # 100KB
+
+IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif"})
+
+# Extension → (action, size at or above which the file is reference-only),
+# built once so classify_action is a single dict lookup per entry
+_EXT_ACTIONS = {
+    **dict.fromkeys(DEPLOY_DIRECT, ("deploy", None)),
+    **dict.fromkeys(CONVERT_DOCX, ("convert_docx", None)),
+    **dict.fromkeys(DEPLOY_SMALL_BINARY, ("deploy", None)),
+    ".pdf": ("deploy", MAX_BINARY_SIZE),
+    **dict.fromkeys(IMAGE_EXTS, ("deploy", MAX_IMAGE_SIZE)),
+    **dict.fromkeys(REFERENCE_ONLY, ("reference", None)),
+}
+# Unknown extension — if small text file, deploy; otherwise reference
+_UNKNOWN_EXT_ACTION = ("deploy", MAX_UNKNOWN_SIZE)
 
 
 def classify_action(entry: dict) -> str:
@@ -47,52 +66,49 @@ def classify_action(entry: dict) -> str:
     if classification.get("status") != "CLASSIFIED":
         return "skip"
 
-    ext = entry.get("extension", "").lower()
-    size = entry.get("size_bytes", 0)
-
-    if ext in DEPLOY_DIRECT:
-        return "deploy"
-
-    if ext in CONVERT_DOCX:
-        return "convert_docx"
-
-    if ext in DEPLOY_SMALL_BINARY:
-        if ext == ".pdf" and size >= MAX_BINARY_SIZE:
-            return "reference"
-        if ext in {".png", ".jpg", ".jpeg", ".gif"} and size >= MAX_IMAGE_SIZE:
-            return "reference"
-        return "deploy"
-
-    if ext in REFERENCE_ONLY:
+    action, size_limit = _EXT_ACTIONS.get(
+        entry.get("extension", "").lower(),
+        _UNKNOWN_EXT_ACTION,
+    )
+    if size_limit is not None and entry.get("size_bytes", 0) >= size_limit:
         return "reference"
+    return action
+
 
-    # Unknown extension — if small text file, deploy; otherwise reference
-    if size < 100 * 1024:  # <100KB
-        return "deploy"
-    return "reference"
+# sanitize_filename runs once per deployed file; build its tables once
+_UNSAFE_CHARS = str.maketrans(dict.fromkeys('|"?*:<>', "-"))
+_DASH_RUN_RE = re.compile(r"-{2,}")
 
 
 def sanitize_filename(name: str) -> str:
     """Sanitize filename for GitHub compatibility."""
     # Replace problematic characters
-    sanitized = re.sub(r'[|"?*:<>]', "-", name)
+    sanitized = name.translate(_UNSAFE_CHARS)
     # Collapse multiple dashes
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
+    if "--" in sanitized:
+        sanitized = _DASH_RUN_RE.sub("-", sanitized)
     # Remove leading/trailing dashes and dots
     sanitized = sanitized.strip("-.")
     return sanitized or "unnamed"
 
 
+@lru_cache(maxsize=1)
+def _pandoc_path() -> str | None:
+    """Resolve pandoc on PATH once per process."""
+    return shutil.which("pandoc")
+
+
 def convert_docx_to_md(source_path: Path, output_dir: Path) -> Path | None:
     """Convert .docx to .md using pandoc. Returns output path or None on failure."""
-    if not shutil.which("pandoc"):
+    pandoc = _pandoc_path()
+    if not pandoc:
         print(f"    WARNING: pandoc not found, cannot convert {source_path.name}")
         return None
 
     output_path = output_dir / (source_path.stem + ".md")
     try:
         subprocess.run(
-            ["pandoc", str(source_path), "-t", "gfm", "-o", str(output_path)],
+            [pandoc, str(source_path), "-t", "gfm", "-o", str(output_path)],
             capture_output=True,
             text=True,
             timeout=30,
@@ -104,6 +120,29 @@ def convert_docx_to_md(source_path: Path, output_dir: Path) -> Path | None:
     return None
 
 
+def convert_docx_batch(
+    source_paths: list[Path],
+    output_dir: Path,
+    max_workers: int | None = None,
+) -> dict[Path, Path | None]:
+    """Convert many .docx files to .md, running pandoc processes in parallel.
+
+    Each pandoc run is a separate process, so worker threads only wait on
+    it and the GIL is not a bottleneck. Returns {source: output path or
+    None}, in the same order as source_paths.
+    """
+    if not source_paths:
+        return {}
+    if not _pandoc_path():
+        print("    WARNING: pandoc not found, cannot convert .docx files")
+        return dict.fromkeys(source_paths)
+
+    workers = max_workers or min(len(source_paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outputs = pool.map(lambda src: convert_docx_to_md(src, output_dir), source_paths)
+        return dict(zip(source_paths, outputs, strict=True))
+
+
 def get_deploy_path(entry: dict) -> str:
     """Compute the target path in the repo for this file."""
     classification = entry.get("classification", {})
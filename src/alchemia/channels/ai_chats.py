@@ -1,9 +1,60 @@
 """AI Chat parser — extract content from ChatGPT, Claude, and Gemini exports."""
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+from alchemia.common import jsonio
+
+try:
+    import ijson
+except ImportError:  # optional: pip install alchemia[fast]
+    ijson = None
+
+
+# Longest message prefix each parser keeps; text past it is never joined
+_CHATGPT_PREVIEW = 200
+_CLAUDE_PREVIEW = 300
+
+
+def _clip_join(parts: list[str], limit: int) -> str:
+    """Return " ".join(parts)[:limit] without copying text past limit."""
+    return " ".join([p[:limit] for p in parts])[:limit]
+
+
+def _iter_conversations(convos_file: Path):
+    """Yield conversations one at a time.
+
+    With ijson installed the export is streamed, so memory stays at one
+    conversation instead of the whole file.
+    """
+    if ijson is not None:
+        with Path(convos_file).open("rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+    yield from jsonio.load_path(convos_file)
+
+
+def _iter_jsonl(root: str):
+    """Yield paths of *.jsonl files under root.
+
+    os.scandir reports entry types from the directory read itself, so the
+    walk skips the per-match stat and Path wrapping of Path.rglob.
+    Unreadable directories are skipped, as rglob does.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".jsonl"):
+                        yield entry.path
+        except OSError:
+            continue
+
 
 def parse_chatgpt_export(export_dir: Path) -> list[dict]:
     """Parse ChatGPT data export (from Settings → Data Controls → Export).
@@ -14,28 +65,30 @@ def parse_chatgpt_export(export_dir: Path) -> list[dict]:
     if not convos_file.exists():
         return []
 
-    with Path(convos_file).open(encoding="utf-8") as f:
-        conversations = json.load(f)
-
     results = []
-    for convo in conversations:
+    for convo in _iter_conversations(convos_file):
         title = convo.get("title", "Untitled")
         create_time = convo.get("create_time")
         messages = convo.get("mapping", {})
 
-        # Extract key message content
-        content_parts = []
+        # Count substantive messages; only the first one's text is kept
+        message_count = 0
+        preview = ""
         for _msg_id, msg_data in messages.items():
             message = msg_data.get("message")
             if not message:
                 continue
-            role = message.get("author", {}).get("role", "")
             parts = message.get("content", {}).get("parts", [])
-            text = " ".join(str(p) for p in parts if isinstance(p, str))
+            if len(parts) == 1 and isinstance(parts[0], str):
+                text = parts[0][:_CHATGPT_PREVIEW]
+            else:
+                text = _clip_join([p for p in parts if isinstance(p, str)], _CHATGPT_PREVIEW)
             if text and len(text) > 50:  # Skip trivial messages
-                content_parts.append({"role": role, "text": text[:500]})
+                if not message_count:
+                    preview = text
+                message_count += 1
 
-        if content_parts:
+        if message_count:
             results.append(
                 {
                     "source": "chatgpt",
@@ -45,8 +98,8 @@ def parse_chatgpt_export(export_dir: Path) -> list[dict]:
                         if create_time
                         else None
                     ),
-                    "message_count": len(content_parts),
-                    "preview": content_parts[0]["text"][:200] if content_parts else "",
+                    "message_count": message_count,
+                    "preview": preview,
                 },
             )
 
@@ -63,29 +116,32 @@ def parse_claude_sessions(claude_dir: Path | None = None) -> list[dict]:
         return []
 
     results = []
-    for jsonl_file in claude_dir.rglob("*.jsonl"):
+    for jsonl_file in _iter_jsonl(str(claude_dir)):
         try:
             messages = []
-            with Path(jsonl_file).open(encoding="utf-8") as f:
+            with Path(jsonl_file).open("rb") as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        msg = json.loads(line)
+                        msg = jsonio.loads(line)
                         if isinstance(msg, dict) and msg.get("type") == "human":
                             text = ""
                             content = msg.get("message", {}).get("content", "")
                             if isinstance(content, str):
-                                text = content
+                                text = content[:_CLAUDE_PREVIEW]
                             elif isinstance(content, list):
-                                text = " ".join(
-                                    p.get("text", "")
-                                    for p in content
-                                    if isinstance(p, dict) and p.get("type") == "text"
+                                text = _clip_join(
+                                    [
+                                        p.get("text", "")
+                                        for p in content
+                                        if isinstance(p, dict) and p.get("type") == "text"
+                                    ],
+                                    _CLAUDE_PREVIEW,
                                 )
                             if text and len(text) > 20:
-                                messages.append(text[:300])
+                                messages.append(text)
                     except json.JSONDecodeError:
                         continue
 
@@ -93,7 +149,7 @@ def parse_claude_sessions(claude_dir: Path | None = None) -> list[dict]:
                 results.append(
                     {
                         "source": "claude",
-                        "session_file": str(jsonl_file),
+                        "session_file": jsonl_file,
                         "message_count": len(messages),
                         "preview": messages[0][:200] if messages else "",
                     },
@@ -109,8 +165,7 @@ def parse_gemini_visits(intake_dir: Path) -> list[dict]:
     results = []
     for gfile in intake_dir.glob("_gemini_visit_*.json"):
         try:
-            with Path(gfile).open(encoding="utf-8") as f:
-                data = json.load(f)
+            data = jsonio.load_path(gfile)
 
             # Gemini exports vary in structure; extract what we can
             if isinstance(data, list):
@@ -1,115 +1,118 @@
 """Apple Notes bridge — export notes from 'Alchemia' folder via AppleScript."""
 
-import json
 import subprocess
 from pathlib import Path
 
 NOTES_OUTPUT_DIR = Path("~/Workspace/alchemia-ingestvm/data/notes").expanduser()
 
 
-def export_alchemia_notes() -> list[dict]:
-    """Export notes from the 'Alchemia' folder in Apple Notes.
+# ASCII unit/record separators cannot occur in note text, so the script's
+# output needs no escaping (titles with quotes used to break the old JSON)
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
 
-    Uses AppleScript to read note titles and bodies. Notes are
-    classified by hashtag:
-      - #aesthetic → taste.yaml references
-      - #spec / #idea → material pipeline
-      - No tag → uncategorized
-    """
-    NOTES_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+# One osascript run returns every note in the folder, bodies included
+_EXPORT_SCRIPT = """
+tell application "Notes"
+    set fieldSep to character id 31
+    set recordSep to character id 30
+    set records to {}
+    try
+        set alchemiaFolder to folder "Alchemia"
+        repeat with aNote in notes of alchemiaFolder
+            set noteDate to modification date of aNote as «class isot» as string
+            set end of records to (id of aNote) & fieldSep & (name of aNote) & fieldSep ¬
+                & noteDate & fieldSep & (plaintext of aNote)
+        end repeat
+    on error errMsg
+        return "ERROR: " & errMsg
+    end try
+    set AppleScript's text item delimiters to recordSep
+    return records as text
+end tell
+"""
 
-    # AppleScript to export notes from "Alchemia" folder
-    applescript = """
-    tell application "Notes"
-        set output to ""
-        try
-            set alchemiaFolder to folder "Alchemia"
-            repeat with aNote in notes of alchemiaFolder
-                set noteTitle to name of aNote
-                set noteBody to plaintext of aNote
-                set noteDate to modification date of aNote as «class isot» as string
-                set noteId to id of aNote
-                -- JSON-escape basic characters
-                set output to output & "{"
-                set output to output & "\\"id\\": \\"" & noteId & "\\","
-                set output to output & "\\"title\\": \\"" & noteTitle & "\\","
-                set output to output & "\\"modified\\": \\"" & noteDate & "\\","
-                set output to output & "\\"body_length\\": " & (length of noteBody) & ""
-                set output to output & "}" & linefeed
-            end repeat
-        on error errMsg
-            set output to "ERROR: " & errMsg
-        end try
-        return output
-    end tell
-    """
+# Note bodies from the last export, keyed by title, for export_note_body;
+# with duplicate titles the first note wins, as a lookup by name always did
+_note_bodies: dict[str, str] = {}
+
+# Titles a fresh export did not contain; asked again, they don't re-run it
+_missing_titles: set[str] = set()
 
+
+def _run_export(timeout: int = 30) -> tuple[list[dict] | None, str]:
+    """Run the export script once and refresh the body cache.
+
+    Returns (notes, "") on success or (None, error message).
+    """
     try:
         result = subprocess.run(
-            ["osascript", "-e", applescript],
+            ["osascript", "-e", _EXPORT_SCRIPT],
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=timeout,
         )
     except subprocess.TimeoutExpired:
-        print("  WARNING: Apple Notes export timed out")
-        return []
+        return None, "timed out"
 
     if result.returncode != 0 or result.stdout.startswith("ERROR:"):
-        err = result.stdout.strip() or result.stderr.strip()
-        if "folder" in err.lower() and "alchemia" in err.lower():
-            print(
-                (
-                    "  INFO: No 'Alchemia' folder found in Apple Notes — "
-                    "create one to use this channel"
-                ),
-            )
-        else:
-            print(f"  WARNING: Apple Notes export failed: {err[:200]}")
-        return []
-
-    # Parse the output (one JSON object per line)
+        return None, result.stdout.strip() or result.stderr.strip()
+
     notes = []
-    for line in result.stdout.strip().split("\n"):
-        line = line.strip()
-        if not line or line.startswith("ERROR:"):
-            continue
-        try:
-            note = json.loads(line)
-            notes.append(note)
-        except json.JSONDecodeError:
+    bodies = {}
+    # osascript terminates its output with a newline
+    for record in result.stdout.removesuffix("\n").split(_RECORD_SEP):
+        fields = record.split(_FIELD_SEP, 3)
+        if len(fields) != 4:
             continue
+        note_id, title, modified, body = fields
+        notes.append(
+            {"id": note_id, "title": title, "modified": modified, "body_length": len(body)},
+        )
+        bodies.setdefault(title, body)
 
-    return notes
+    _note_bodies.clear()
+    _note_bodies.update(bodies)
+    _missing_titles.clear()
+    return notes, ""
 
 
-def export_note_body(note_title: str) -> str:
-    """Export the full body of a specific note."""
-    applescript = f'''
-    tell application "Notes"
-        try
-            set alchemiaFolder to folder "Alchemia"
-            repeat with aNote in notes of alchemiaFolder
-                if name of aNote is "{note_title}" then
-                    return plaintext of aNote
-                end if
-            end repeat
-        on error
-            return ""
-        end try
-        return ""
-    end tell
-    '''
+def export_alchemia_notes() -> list[dict]:
+    """Export notes from the 'Alchemia' folder in Apple Notes.
 
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", applescript],
-            capture_output=True,
-            text=True,
-            timeout=15,
+    Uses AppleScript to read note titles and bodies. Notes are
+    classified by hashtag:
+      - #aesthetic → taste.yaml references
+      - #spec / #idea → material pipeline
+      - No tag → uncategorized
+    """
+    NOTES_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    notes, err = _run_export()
+    if notes is not None:
+        return notes
+
+    if err == "timed out":
+        print("  WARNING: Apple Notes export timed out")
+    elif "folder" in err.lower() and "alchemia" in err.lower():
+        print(
+            ("  INFO: No 'Alchemia' folder found in Apple Notes — create one to use this channel"),
         )
-        if result.returncode == 0:
-            return result.stdout
-    except subprocess.TimeoutExpired:
-        pass
-    return ""
+    else:
+        print(f"  WARNING: Apple Notes export failed: {err[:200]}")
+    return []
+
+
+def export_note_body(note_title: str) -> str:
+    """Export the full body of a specific note.
+
+    Bodies come from the last export_alchemia_notes run; a title not seen
+    there triggers one fresh export rather than an osascript call per note.
+    A title that fresh export also lacks returns "" until the next export
+    succeeds; a failed export is retried on the next call.
+    """
+    if note_title not in _note_bodies and note_title not in _missing_titles:
+        notes, _ = _run_export(timeout=15)
+        if notes is not None and note_title not in _note_bodies:
+            _missing_titles.add(note_title)
+    return _note_bodies.get(note_title, "")
@@ -2,9 +2,10 @@
 
 import json
 import plistlib
-import subprocess
 from pathlib import Path
 
+from alchemia.common import jsonio
+
 SAFARI_BOOKMARKS = Path("~/Library/Safari/Bookmarks.plist").expanduser()
 CHROME_BOOKMARKS = Path(
     "~/Library/Application Support/Google/Chrome/Default/Bookmarks",
@@ -22,14 +23,9 @@ def parse_safari_bookmarks() -> list[dict]:
         return []
 
     try:
-        # Convert binary plist to XML for parsing
-        result = subprocess.run(
-            ["plutil", "-convert", "xml1", "-o", "-", str(SAFARI_BOOKMARKS)],
-            capture_output=True,
-        )
-        if result.returncode != 0:
-            return []
-        data = plistlib.loads(result.stdout)
+        # plistlib reads binary and XML plists natively
+        with Path(SAFARI_BOOKMARKS).open("rb") as f:
+            data = plistlib.load(f)
     except (plistlib.InvalidFileException, OSError):
         return []
 
@@ -38,29 +34,68 @@ def parse_safari_bookmarks() -> list[dict]:
     return bookmarks
 
 
+def _safari_title(item: dict) -> str:
+    return item.get("Title", item.get("URIDictionary", {}).get("title", ""))
+
+
+def _walk_bookmarks(
+    nodes: list,
+    path: list,
+    *,
+    type_key: str,
+    folder_type: str,
+    leaf_type: str,
+    children_key: str,
+    url_key: str,
+    title_of,
+):
+    """Yield (folder_path, url, title) for bookmarks under an Inspirations folder.
+
+    Iterative depth-first walk in document order, so deep nesting cannot hit
+    the recursion limit. Outside an Inspirations folder only sub-folders are
+    visited; leaves there are skipped without reading their fields. The
+    keyword arguments describe one browser's tree layout.
+    """
+    stack = [(iter(nodes), tuple(path), INSPIRATIONS_FOLDER in path)]
+    while stack:
+        items, folder, inside = stack[-1]
+        node = next(items, None)
+        if node is None:
+            stack.pop()
+            continue
+
+        node_type = node.get(type_key, "")
+        if node_type == folder_type:
+            name = title_of(node)
+            stack.append(
+                (
+                    iter(node.get(children_key, [])),
+                    (*folder, name),
+                    inside or name == INSPIRATIONS_FOLDER,
+                ),
+            )
+
+        elif inside and node_type == leaf_type:
+            url = node.get(url_key, "")
+            if url:
+                yield "/".join(folder), url, title_of(node)
+
+
 def _walk_safari_tree(children: list, path: list, results: list):
-    """Recursively walk Safari bookmark tree collecting from Inspirations folder."""
-    for item in children:
-        item_type = item.get("WebBookmarkType", "")
-        title = item.get("Title", item.get("URIDictionary", {}).get("title", ""))
-
-        if item_type == "WebBookmarkTypeList":
-            new_path = path + [title]
-            _walk_safari_tree(item.get("Children", []), new_path, results)
-
-        elif item_type == "WebBookmarkTypeLeaf":
-            # Bookmark
-            if INSPIRATIONS_FOLDER in path:
-                url = item.get("URLString", "")
-                if url:
-                    results.append(
-                        {
-                            "source": "safari",
-                            "url": url,
-                            "title": title,
-                            "folder_path": "/".join(path),
-                        },
-                    )
+    """Collect Safari bookmarks under an Inspirations folder into results."""
+    for folder_path, url, title in _walk_bookmarks(
+        children,
+        path,
+        type_key="WebBookmarkType",
+        folder_type="WebBookmarkTypeList",
+        leaf_type="WebBookmarkTypeLeaf",
+        children_key="Children",
+        url_key="URLString",
+        title_of=_safari_title,
+    ):
+        results.append(
+            {"source": "safari", "url": url, "title": title, "folder_path": folder_path},
+        )
 
 
 def parse_chrome_bookmarks() -> list[dict]:
@@ -72,8 +107,7 @@ def parse_chrome_bookmarks() -> list[dict]:
         return []
 
     try:
-        with Path(CHROME_BOOKMARKS).open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.load_path(CHROME_BOOKMARKS)
     except (json.JSONDecodeError, OSError):
         return []
 
@@ -86,27 +120,20 @@ def parse_chrome_bookmarks() -> list[dict]:
 
 
 def _walk_chrome_tree(node: dict, path: list, results: list):
-    """Recursively walk Chrome bookmark tree looking for Inspirations folder."""
-    name = node.get("name", "")
-    node_type = node.get("type", "")
-
-    if node_type == "folder":
-        new_path = path + [name]
-        for child in node.get("children", []):
-            _walk_chrome_tree(child, new_path, results)
-
-    elif node_type == "url":
-        if INSPIRATIONS_FOLDER in path:
-            url = node.get("url", "")
-            if url:
-                results.append(
-                    {
-                        "source": "chrome",
-                        "url": url,
-                        "title": name,
-                        "folder_path": "/".join(path),
-                    },
-                )
+    """Collect Chrome bookmarks under an Inspirations folder into results."""
+    for folder_path, url, title in _walk_bookmarks(
+        [node],
+        path,
+        type_key="type",
+        folder_type="folder",
+        leaf_type="url",
+        children_key="children",
+        url_key="url",
+        title_of=lambda n: n.get("name", ""),
+    ):
+        results.append(
+            {"source": "chrome", "url": url, "title": title, "folder_path": folder_path},
+        )
 
 
 def sync_bookmarks() -> list[dict]:
@@ -12,13 +12,23 @@
 The module gracefully degrades if google packages are not installed.
 """
 
-import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from alchemia.common import jsonio
+
 CONFIG_DIR = Path("~/.config/alchemia").expanduser()
 CLIENT_SECRET_PATH = CONFIG_DIR / "client_secret.json"
 TOKEN_PATH = CONFIG_DIR / "google_token.json"
+LAST_SYNC_PATH = CONFIG_DIR / "last_sync.json"
+FOLDER_CACHE_PATH = CONFIG_DIR / "folder_cache.json"
 ALCHEMIA_FOLDER_NAME = "Alchemia"
 
 # Google Drive MIME types
@@ -33,9 +43,42 @@
     GSLIDE_MIME: ("text/plain", ".txt"),
 }
 
+# Credentials and the Drive client are built once per process and reused;
+# credentials are refreshed in place when they expire
+_client_lock = threading.RLock()
+_client_cache: dict = {}
+
+# Exports and downloads stream to disk in pieces of this size
+DOWNLOAD_CHUNK = 1024 * 1024
+
+# Only the metadata sync_google_docs reads (partial response)
+DOC_FIELDS = "id, name, mimeType, modifiedTime"
+
+# googleapiclient retries 429, 5xx and rate-limit 403 responses this many
+# times itself, sleeping with randomized exponential backoff in between
+DRIVE_RETRIES = 4
+
+# Concurrent exports in sync_google_docs; each thread has its own transport.
+# Drive batch requests (BatchHttpRequest) cannot carry media downloads, and
+# files.export is one, so exports are parallelised rather than batched.
+SYNC_WORKERS = 8
+_http_local = threading.local()
+
+# Drive folder name → (folder ID or None, monotonic time looked up, whether the
+# ID came from a Drive query this run rather than FOLDER_CACHE_PATH)
+FOLDER_ID_TTL = 600.0
+_folder_ids: dict[str, tuple[str | None, float, bool]] = {}
+
+# Resolved folder IDs persist across runs for a day; misses are never written
+FOLDER_CACHE_TTL = 24 * 3600.0
+
+# Refresh tokens this close to expiry so a sync never starts on one about to lapse
+TOKEN_REFRESH_SKEW = 60.0
+
 
+@lru_cache(maxsize=1)
 def _check_dependencies() -> bool:
-    """Check if Google API dependencies are installed."""
+    """Check if Google API dependencies are installed (probed once per process)."""
     try:
         import google.auth  # noqa: F401
         import googleapiclient  # noqa: F401
@@ -45,9 +88,23 @@ def _check_dependencies() -> bool:
         return False
 
 
+def _needs_refresh(creds) -> bool:
+    """True when creds have expired or will within TOKEN_REFRESH_SKEW seconds."""
+    if creds.expired:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds() < TOKEN_REFRESH_SKEW
+
+
 def _get_credentials():
     """Load or refresh OAuth2 credentials.
 
+    The token file is read once per process; later calls return the cached
+    credentials, refreshing them first if they have expired or are about to.
+
     Returns google.oauth2.credentials.Credentials or None.
     """
     if not _check_dependencies():
@@ -56,23 +113,35 @@ def _get_credentials():
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
 
+    with _client_lock:
+        creds = _client_cache.get("creds")
+        if creds is None:
+            creds = _load_token(Credentials)
+        if creds and creds.refresh_token and _needs_refresh(creds):
+            try:
+                creds.refresh(Request())
+                TOKEN_PATH.write_text(creds.to_json())
+            except Exception:
+                creds = None
+
+        if creds is None:
+            _client_cache.clear()
+        else:
+            _client_cache["creds"] = creds
+        return creds
+
+
+def _load_token(credentials_cls):
+    """Read stored credentials from TOKEN_PATH, or None."""
     creds = None
     if TOKEN_PATH.exists():
         try:
-            creds = Credentials.from_authorized_user_file(
+            creds = credentials_cls.from_authorized_user_file(
                 str(TOKEN_PATH),
                 scopes=["https://www.googleapis.com/auth/drive.readonly"],
             )
         except Exception:
             creds = None
-
-    if creds and creds.expired and creds.refresh_token:
-        try:
-            creds.refresh(Request())
-            TOKEN_PATH.write_text(creds.to_json())
-        except Exception:
-            creds = None
-
     return creds
 
 
@@ -104,6 +173,9 @@ def authorize() -> bool:
 
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         TOKEN_PATH.write_text(creds.to_json())
+        with _client_lock:
+            _client_cache.clear()
+        clear_folder_cache()
         print(f"  Token saved to {TOKEN_PATH}")
         return True
     except Exception as e:
@@ -112,57 +184,206 @@ def authorize() -> bool:
 
 
 def _build_service():
-    """Build a Google Drive API service client.
+    """Return the process-wide Google Drive API service client.
+
+    Built on first use from the bundled discovery document, so no discovery
+    fetch happens; reused for as long as the cached credentials stay valid.
 
     Returns googleapiclient.discovery.Resource or None.
     """
-    creds = _get_credentials()
-    if not creds or not creds.valid:
+    with _client_lock:
+        creds = _get_credentials()
+        if not creds or not creds.valid:
+            return None
+
+        service = _client_cache.get("service")
+        if service is None:
+            from googleapiclient.discovery import build
+
+            service = build("drive", "v3", credentials=creds, static_discovery=True)
+            _client_cache["service"] = service
+        return service
+
+
+def _read_folder_cache() -> dict:
+    try:
+        data = jsonio.load_path(FOLDER_CACHE_PATH)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _cached_folder_id(folder_name: str) -> str | None:
+    """Folder ID saved by an earlier run, if it is younger than FOLDER_CACHE_TTL."""
+    entry = _read_folder_cache().get(folder_name)
+    if not isinstance(entry, dict):
+        return None
+    folder_id = entry.get("id")
+    cached_at = entry.get("cached_at")
+    if not isinstance(folder_id, str) or not isinstance(cached_at, int | float):
+        return None
+    if time.time() - cached_at >= FOLDER_CACHE_TTL:
         return None
+    return folder_id
 
-    from googleapiclient.discovery import build
 
-    return build("drive", "v3", credentials=creds)
+def _save_folder_id(folder_name: str, folder_id: str) -> None:
+    data = _read_folder_cache()
+    data[folder_name] = {"id": folder_id, "cached_at": time.time()}
+    _write_folder_cache(data)
 
 
-def _find_alchemia_folder(service, folder_name: str = ALCHEMIA_FOLDER_NAME) -> str | None:
+def _write_folder_cache(data: dict) -> None:
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        FOLDER_CACHE_PATH.write_text(json.dumps(data, indent=2))
+    except OSError:
+        pass
+
+
+def _forget_folder_id(folder_name: str) -> None:
+    """Drop one folder's ID, in memory and on disk, so the next lookup queries Drive."""
+    with _client_lock:
+        _folder_ids.pop(folder_name, None)
+    data = _read_folder_cache()
+    if data.pop(folder_name, None) is not None:
+        _write_folder_cache(data)
+
+
+def clear_folder_cache() -> None:
+    """Forget resolved folder IDs, in memory and on disk."""
+    with _client_lock:
+        _folder_ids.clear()
+    FOLDER_CACHE_PATH.unlink(missing_ok=True)
+
+
+def _find_alchemia_folder(
+    service,
+    folder_name: str = ALCHEMIA_FOLDER_NAME,
+    validate: bool = False,
+) -> str | None:
     """Find a folder ID in Google Drive by name.
 
+    Lookups (including misses) are remembered for FOLDER_ID_TTL seconds, so
+    list_docs and get_status in one run share a single Drive query. Found IDs
+    are also kept in FOLDER_CACHE_PATH, so warm starts skip the query entirely.
+    An ID from that file may be stale; validate=True ignores it and confirms
+    the ID with a Drive query unless this run has already done so.
+
     Returns the folder ID or None if not found.
     """
-    query = (
-        f"name = '{folder_name}' "
-        "and mimeType = 'application/vnd.google-apps.folder' "
-        "and trashed = false"
-    )
-    results = service.files().list(q=query, fields="files(id, name)", pageSize=5).execute()
+    cached = _folder_ids.get(folder_name)
+    if (
+        cached is not None
+        and time.monotonic() - cached[1] < FOLDER_ID_TTL
+        and (cached[2] or not validate)
+    ):
+        return cached[0]
+
+    folder_id = None if validate else _cached_folder_id(folder_name)
+    queried = folder_id is None
+    if queried:
+        query = (
+            f"name = '{folder_name}' "
+            "and mimeType = 'application/vnd.google-apps.folder' "
+            "and trashed = false"
+        )
+        results = (
+            service.files()
+            .list(q=query, fields="files(id)", pageSize=1, spaces="drive", corpora="user")
+            .execute(num_retries=DRIVE_RETRIES)
+        )
+        files = results.get("files", [])
+        folder_id = files[0]["id"] if files else None
+        if folder_id is not None:
+            _save_folder_id(folder_name, folder_id)
 
-    files = results.get("files", [])
-    if files:
-        return files[0]["id"]
-    return None
+    _folder_ids[folder_name] = (folder_id, time.monotonic(), queried)
+    return folder_id
 
 
-def list_docs(folder_name: str | None = None) -> list[dict]:
-    """List Google Docs in the Alchemia folder.
+def _folder_confirmed(service, folder_name: str) -> bool:
+    """True when the folder ID last used for folder_name is the one Drive reports now."""
+    cached = _folder_ids.get(folder_name)
+    if cached is None or cached[0] is None:
+        return False
+    return cached[2] or _find_alchemia_folder(service, folder_name, validate=True) == cached[0]
 
-    Returns list of document metadata dicts with keys:
-        id, name, mimeType, modifiedTime, createdTime
+
+def _count_docs(service, folder_id: str) -> int:
+    """Count the files in a Drive folder, fetching only their IDs."""
+    query = f"'{folder_id}' in parents and trashed = false"
+    count = 0
+    page_token = None
+    while True:
+        results = (
+            service.files()
+            .list(
+                q=query,
+                fields="nextPageToken, files(id)",
+                pageSize=1000,
+                pageToken=page_token,
+                spaces="drive",
+                corpora="user",
+            )
+            .execute(num_retries=DRIVE_RETRIES)
+        )
+        count += len(results.get("files", []))
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            return count
+
+
+def iter_docs(
+    folder_name: str | None = None,
+    modified_after: str | None = None,
+) -> Iterator[dict]:
+    """Yield metadata for each doc in the Alchemia folder, one Drive page at a time.
+
+    Each dict has the DOC_FIELDS keys: id, name, mimeType, modifiedTime.
+    modified_after (RFC 3339) makes Drive return only docs changed since then.
+    A folder ID from FOLDER_CACHE_PATH that errors or lists nothing is looked
+    up again; if the folder has a new ID, it is listed in full.
     """
     if not _check_dependencies():
-        return []
+        return
 
     service = _build_service()
     if not service:
-        return []
+        return
 
     folder_name = folder_name or ALCHEMIA_FOLDER_NAME
     folder_id = _find_alchemia_folder(service, folder_name=folder_name)
     if not folder_id:
-        return []
+        return
 
+    queried = _folder_ids[folder_name][2]
+    listed = False
+    try:
+        for doc in _iter_folder(service, folder_id, modified_after):
+            listed = True
+            yield doc
+    except Exception:
+        if listed or queried:
+            raise
+    else:
+        if listed or queried:
+            return
+
+    # A cached ID that errors or lists nothing may belong to a deleted or
+    # recreated folder: forget it and look the folder up again. A checkpoint
+    # taken against the old folder says nothing about the new one.
+    _forget_folder_id(folder_name)
+    fresh_id = _find_alchemia_folder(service, folder_name=folder_name, validate=True)
+    if fresh_id and fresh_id != folder_id:
+        yield from _iter_folder(service, fresh_id, None)
+
+
+def _iter_folder(service, folder_id: str, modified_after: str | None) -> Iterator[dict]:
+    """Yield the docs in one Drive folder, one page at a time."""
     query = f"'{folder_id}' in parents and trashed = false"
-    all_files = []
+    if modified_after:
+        query += f" and modifiedTime > '{modified_after}'"
     page_token = None
 
     while True:
@@ -170,61 +391,267 @@ def list_docs(folder_name: str | None = None) -> list[dict]:
             service.files()
             .list(
                 q=query,
-                fields="nextPageToken, files(id, name, mimeType, modifiedTime, createdTime)",
-                pageSize=100,
+                fields=f"nextPageToken, files({DOC_FIELDS})",
+                pageSize=1000,
                 pageToken=page_token,
+                spaces="drive",
+                corpora="user",
             )
-            .execute()
+            .execute(num_retries=DRIVE_RETRIES)
         )
 
-        all_files.extend(results.get("files", []))
+        yield from results.get("files", [])
         page_token = results.get("nextPageToken")
         if not page_token:
             break
 
-    return all_files
+
+def list_docs(folder_name: str | None = None) -> list[dict]:
+    """List Google Docs in the Alchemia folder.
+
+    Returns list of document metadata dicts with keys:
+        id, name, mimeType, modifiedTime
+    """
+    return list(iter_docs(folder_name))
+
+
+def _thread_http():
+    """Authorized HTTP transport for the calling thread.
+
+    httplib2 connections are not thread-safe, so each sync worker issues its
+    requests via its own transport while sharing the one service object.
+    Returns None when no credentials can be loaded or refreshed.
+    """
+    http = getattr(_http_local, "http", None)
+    if http is None:
+        creds = _get_credentials()
+        if creds is None:
+            return None
+
+        import google_auth_httplib2
+        import httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        _http_local.http = http
+    return http
 
 
-def export_doc(doc_id: str, mime_type: str) -> bytes | None:
-    """Export a Google Doc as the specified MIME type.
+def export_gdoc(doc_id: str, mime_type: str, service=None, http=None) -> bytes | None:
+    """Export a Google Docs-format file (Doc, Sheet, Slides) as mime_type.
 
     For Google Docs, use 'text/markdown' or 'text/plain'.
-    For regular files, downloads the file content directly.
+    Pass service to reuse a client the caller already holds, and http to
+    send the request over a specific transport.
 
     Returns bytes content or None on failure.
     """
-    service = _build_service()
+    service = service or _build_service()
     if not service:
         return None
 
     try:
-        return service.files().export(fileId=doc_id, mimeType=mime_type).execute()
+        request = service.files().export(fileId=doc_id, mimeType=mime_type)
+        return request.execute(http=http, num_retries=DRIVE_RETRIES)
     except Exception:
-        # Might be a regular file (not a Google Doc), try downloading
-        try:
-            return service.files().get_media(fileId=doc_id).execute()
-        except Exception:
-            return None
+        return None
+
+
+def download_file(doc_id: str, service=None, http=None) -> bytes | None:
+    """Download the content of a regular (non-Google-format) Drive file.
+
+    Returns bytes content or None on failure.
+    """
+    service = service or _build_service()
+    if not service:
+        return None
+
+    try:
+        request = service.files().get_media(fileId=doc_id)
+        return request.execute(http=http, num_retries=DRIVE_RETRIES)
+    except Exception:
+        return None
 
 
-def sync_google_docs(output_dir: Path | None = None, folder_name: str | None = None) -> list[dict]:
+def _stream_to(request, out_path: Path, http=None) -> bool:
+    """Stream a media request into out_path in DOWNLOAD_CHUNK pieces.
+
+    Writes to a .part file renamed into place on success, so a failed or
+    empty download never leaves a truncated file that looks up to date.
+    """
+    from googleapiclient.http import MediaIoBaseDownload
+
+    if http is not None:
+        request.http = http
+    part = out_path.with_name(out_path.name + ".part")
+    try:
+        # Each chunk is larger than the file buffer, so BufferedWriter passes
+        # it straight to write(2); no whole-document bytes object ever exists
+        with part.open("wb") as fh:
+            downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK)
+            done = False
+            while not done:
+                _, done = downloader.next_chunk(num_retries=DRIVE_RETRIES)
+        if part.stat().st_size == 0:
+            part.unlink()
+            return False
+    except Exception:
+        part.unlink(missing_ok=True)
+        return False
+    part.replace(out_path)
+    return True
+
+
+def download_doc(
+    doc_id: str,
+    out_path: Path,
+    export_mime: str | None = None,
+    service=None,
+    http=None,
+) -> bool:
+    """Export (Google formats) or download a Drive file straight to out_path.
+
+    export_mime selects files.export for Google formats; without it the file
+    content is downloaded as-is. Unlike export_gdoc and download_file the
+    content is never held in memory as a whole.
+    Returns True if a non-empty file was written.
+    """
+    service = service or _build_service()
+    if not service:
+        return False
+
+    files = service.files()
+    if export_mime:
+        request = files.export_media(fileId=doc_id, mimeType=export_mime)
+    else:
+        request = files.get_media(fileId=doc_id)
+    return _stream_to(request, out_path, http)
+
+
+def _sync_one(service, doc: dict, export_mime: str | None, out_path: Path) -> dict:
+    """Export or download one doc to out_path. Runs on a sync worker thread."""
+    name = doc["name"]
+    http = _thread_http()
+    if http is None:
+        return {"name": name, "status": "failed", "error": "No valid Google credentials"}
+    if not download_doc(doc["id"], out_path, export_mime, service, http):
+        return {"name": name, "status": "failed", "error": "Could not export or download"}
+
+    return {
+        "name": name,
+        "status": "synced",
+        "path": str(out_path),
+        "mime_type": doc.get("mimeType", ""),
+        "modified": doc.get("modifiedTime", ""),
+    }
+
+
+def _drive_timestamp(epoch: float) -> str:
+    """Format a POSIX time the way Drive reports modifiedTime (UTC, milliseconds)."""
+    millis = int(epoch * 1000) % 1000
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(epoch))}.{millis:03d}Z"
+
+
+def _is_drive_timestamp(value) -> bool:
+    """True for UTC timestamps like 2026-01-01T12:00:00.000Z (millis optional)."""
+    return (
+        isinstance(value, str) and len(value) in (20, 24) and value[10] == "T" and value[-1] == "Z"
+    )
+
+
+def _read_last_sync() -> dict[str, dict]:
+    """Folder name → {resolved output directory → checkpoint of its last clean sync}."""
+    try:
+        data = jsonio.load_path(LAST_SYNC_PATH)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _sync_checkpoint(folder_name: str, output_dir: Path) -> dict | None:
+    """Checkpoint for syncing folder_name into output_dir, or None.
+
+    A checkpoint holds the RFC 3339 start time of the last clean sync
+    ("started") and the local file names it left behind ("files").
+    """
+    entry = _read_last_sync().get(folder_name)
+    if not isinstance(entry, dict):
+        return None
+    checkpoint = entry.get(str(output_dir.resolve()))
+    if (
+        not isinstance(checkpoint, dict)
+        or not isinstance(checkpoint.get("started"), str)
+        or not isinstance(checkpoint.get("files"), list)
+    ):
+        return None
+    return checkpoint
+
+
+def _write_last_sync(folder_name: str, output_dir: Path, started: str, files: set[str]) -> None:
+    data = _read_last_sync()
+    entry = data.get(folder_name)
+    if not isinstance(entry, dict):
+        entry = data[folder_name] = {}
+    entry[str(output_dir.resolve())] = {"started": started, "files": sorted(files)}
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    LAST_SYNC_PATH.write_text(json.dumps(data, indent=2))
+
+
+def _local_mtimes(output_dir: Path) -> dict[str, float]:
+    """File name → mtime for everything already in output_dir, from one scandir pass.
+
+    On NFS and similar mounts the directory read brings back attributes in
+    bulk, so the per-entry stats are answered from cache instead of each
+    doc name costing its own lookup round-trip.
+    """
+    mtimes = {}
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            try:
+                if entry.is_file():
+                    mtimes[entry.name] = entry.stat().st_mtime
+            except OSError:
+                continue
+    return mtimes
+
+
+def sync_google_docs(
+    output_dir: Path | None = None,
+    folder_name: str | None = None,
+    full: bool = False,
+) -> list[dict]:
     """Sync all docs from the Alchemia folder to a local directory.
 
     Exports Google Docs as markdown, Sheets as CSV, etc.
     Regular files (PDF, images) are downloaded directly.
+    Exports run on SYNC_WORKERS threads since each is a slow Drive request.
+
+    After a sync with no failures its start time is saved in last_sync.json
+    for this folder and output directory, and the next sync into the same
+    directory asks Drive only for docs modified since then. If the directory
+    is empty or a file from that sync has been deleted locally, everything
+    is listed again and the local-mtime check alone skips unchanged files;
+    full=True forces the same.
 
-    Returns list of synced document info dicts.
+    Returns list of synced document info dicts, in Drive listing order.
     """
     output_dir = output_dir or Path("data/google-docs")
     output_dir.mkdir(parents=True, exist_ok=True)
+    folder_name = folder_name or ALCHEMIA_FOLDER_NAME
 
-    docs = list_docs(folder_name=folder_name)
-    if not docs:
-        return []
+    started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    local_mtimes = None  # read on the first doc that needs it
+    checkpoint = None if full else _sync_checkpoint(folder_name, output_dir)
+    modified_after = None
+    if checkpoint:
+        # Deleted local copies are only listed again without the modifiedTime filter
+        local_mtimes = _local_mtimes(output_dir)
+        if local_mtimes and local_mtimes.keys() >= set(checkpoint["files"]):
+            modified_after = checkpoint["started"]
 
+    service = _build_service()
     results = []
-    for doc in docs:
-        doc_id = doc["id"]
+    pending = []  # (index into results, doc, export MIME, output path)
+    for doc in iter_docs(folder_name=folder_name, modified_after=modified_after):
         name = doc["name"]
         mime = doc.get("mimeType", "")
         modified = doc.get("modifiedTime", "")
@@ -243,65 +670,54 @@ def sync_google_docs(output_dir: Path | None = None, folder_name: str | None = N
 
         out_path = output_dir / safe_name
 
-        # Skip if local copy is newer than remote
-        if out_path.exists():
-            local_mtime = datetime.fromtimestamp(out_path.stat().st_mtime, tz=timezone.utc)
-            try:
-                remote_mtime = datetime.fromisoformat(modified.replace("Z", "+00:00"))
-                if local_mtime >= remote_mtime:
-                    results.append(
-                        {
-                            "name": name,
-                            "status": "up_to_date",
-                            "path": str(out_path),
-                        },
-                    )
-                    continue
-            except (ValueError, TypeError):
-                pass  # Can't parse remote time, re-download
-
-        # Export/download
-        content = export_doc(doc_id, export_mime) if export_mime else None
-        if content is None and export_mime is None:
-            # Try direct download for non-Google files
-            service = _build_service()
-            if service:
-                with contextlib.suppress(Exception):
-                    content = service.files().get_media(fileId=doc_id).execute()
-
-        if content:
-            if isinstance(content, str):
-                out_path.write_text(content, encoding="utf-8")
-            else:
-                out_path.write_bytes(content)
-
-            results.append(
-                {
-                    "name": name,
-                    "status": "synced",
-                    "path": str(out_path),
-                    "mime_type": mime,
-                    "modified": modified,
-                },
-            )
-        else:
-            results.append(
-                {
-                    "name": name,
-                    "status": "failed",
-                    "error": "Could not export or download",
-                },
-            )
+        # Skip if local copy is newer than remote. Drive's fixed-width UTC
+        # timestamps order lexicographically, so no datetime parsing is needed.
+        if _is_drive_timestamp(modified):
+            if local_mtimes is None:
+                local_mtimes = _local_mtimes(output_dir)
+            mtime = local_mtimes.get(safe_name)
+            local_mtime = "" if mtime is None else _drive_timestamp(mtime)
+            if local_mtime >= modified:
+                results.append(
+                    {
+                        "name": name,
+                        "status": "up_to_date",
+                        "path": str(out_path),
+                    },
+                )
+                continue
+
+        pending.append((len(results), doc, export_mime, out_path))
+        results.append(None)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(SYNC_WORKERS, len(pending))) as pool:
+            synced = pool.map(lambda job: _sync_one(service, *job[1:]), pending)
+            for (index, *_), result in zip(pending, synced, strict=True):
+                results[index] = result
+
+    # Checkpoint only when nothing failed and the folder listed is confirmed
+    # by Drive (not just a cached ID), so missed docs are picked up next time
+    if (
+        service
+        and all(r["status"] != "failed" for r in results)
+        and _folder_confirmed(service, folder_name)
+    ):
+        files = {Path(r["path"]).name for r in results}
+        if modified_after:
+            files.update(checkpoint["files"])
+        _write_last_sync(folder_name, output_dir, started, files)
 
     return results
 
 
+# Characters that are unsafe in local filenames, each mapped to "-"
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('/\\:*?"<>|', "-"))
+
+
 def _sanitize_filename(name: str) -> str:
     """Sanitize a filename for local storage."""
-    # Replace problematic characters
-    for char in ["/", "\\", ":", "*", "?", '"', "<", ">", "|"]:
-        name = name.replace(char, "-")
-    return name.strip(". ")
+    return name.translate(_SANITIZE_TABLE).strip(". ")
 
 
 def get_status() -> dict:
@@ -332,7 +748,6 @@ def get_status() -> dict:
             folder_id = _find_alchemia_folder(service)
             status["folder_found"] = folder_id is not None
             if folder_id:
-                docs = list_docs()
-                status["doc_count"] = len(docs)
+                status["doc_count"] = _count_docs(service, folder_id)
 
     return status
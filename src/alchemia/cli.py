@@ -5,6 +5,16 @@
 from pathlib import Path
 
 
+def _load_inventory(path: Path) -> list[dict]:
+    """Entries of an intake inventory: NDJSON, or the older single JSON document."""
+    from alchemia.common import jsonio
+    from alchemia.common.pickle_cache import load_cached
+
+    if path.suffix == ".jsonl":
+        return load_cached(path, lambda p: list(jsonio.iter_ndjson(p)))
+    return load_cached(path, jsonio.load_path)["entries"]
+
+
 def cmd_intake(args):
     """Run the INTAKE stage: crawl + fingerprint source directories."""
     from alchemia.intake.crawler import crawl
@@ -12,7 +22,11 @@ def cmd_intake(args):
     from alchemia.intake.manifest_loader import enrich_from_manifest, enrich_from_sidecars
 
     source_dirs = [Path(d) for d in args.source_dir]
-    output = Path(args.output)
+    # absorb tells NDJSON inventories from legacy JSON documents by suffix
+    requested = Path(args.output)
+    output = requested.with_suffix(".jsonl")
+    if output != requested:
+        print(f"  WARNING: inventories are NDJSON; writing {output} instead of {requested}")
 
     print(f"INTAKE — Crawling {len(source_dirs)} source directories...")
     inventory = crawl(source_dirs)
@@ -31,39 +45,34 @@ def cmd_intake(args):
     print("  Detecting duplicates...")
     inventory = mark_duplicates(inventory)
 
-    # Write output
-    import json
-
-    with Path(output).open("w") as f:
-        json.dump(
-            {
-                "schema_version": "1.0",
-                "stage": "intake",
-                "source_dirs": [str(d) for d in source_dirs],
-                "total_files": len(inventory),
-                "entries": inventory,
-            },
-            f,
-            indent=2,
-            default=str,
-        )
-    print(f"  Wrote {output} ({len(inventory)} entries)")
+    # Write output: one entry per line, schema metadata in a small header file
+    from alchemia.common import jsonio
+
+    header = output.with_suffix(".header.json")
+    jsonio.dump_ndjson(inventory, output)
+    jsonio.dump_path(
+        {
+            "schema_version": "1.0",
+            "stage": "intake",
+            "source_dirs": [str(d) for d in source_dirs],
+            "total_files": len(inventory),
+        },
+        header,
+    )
+    print(f"  Wrote {output} + {header.name} ({len(inventory)} entries)")
 
 
 def cmd_absorb(args):
     """Run the ABSORB stage: classify + map files to target repos."""
-    import json
-
     from alchemia.absorb.classifier import classify_all
     from alchemia.absorb.registry_loader import load_registry
+    from alchemia.common import jsonio
 
     inventory_path = Path(args.inventory)
     output = Path(args.output)
 
     print("ABSORB — Loading inventory...")
-    with Path(inventory_path).open() as f:
-        data = json.load(f)
-    entries = data["entries"]
+    entries = _load_inventory(inventory_path)
     print(f"  Loaded {len(entries)} entries from {inventory_path}")
 
     print("  Loading registry...")
@@ -74,44 +83,62 @@ def cmd_absorb(args):
     entries = classify_all(entries, registry)
 
     # Write output
-    with Path(output).open("w") as f:
-        json.dump(
-            {
-                "schema_version": "1.0",
-                "stage": "absorb",
-                "source_inventory": str(inventory_path),
-                "total_entries": len(entries),
-                "entries": entries,
-            },
-            f,
-            indent=2,
-            default=str,
-        )
+    jsonio.dump_path(
+        {
+            "schema_version": "1.0",
+            "stage": "absorb",
+            "source_inventory": str(inventory_path),
+            "total_entries": len(entries),
+            "entries": entries,
+        },
+        output,
+        indent=False,  # read back by alchemize and review, not by hand
+    )
     print(f"  Wrote {output} ({len(entries)} entries)")
 
 
 def cmd_alchemize(args):
     """Run the ALCHEMIZE stage: transform + deploy."""
-    import json
+    from datetime import datetime, timezone
+    from itertools import chain
 
     from alchemia.absorb.registry_loader import load_registry
-    from alchemia.alchemize.provenance import generate_provenance_registry, get_deployment_plan
+    from alchemia.alchemize.provenance import (
+        generate_provenance_registry,
+        get_deployment_plan,
+        hash_missing,
+    )
+    from alchemia.common import jsonio
+    from alchemia.common.pickle_cache import load_cached
 
+    # One generation instant for every provenance record this run writes
+    generated_at = datetime.now(timezone.utc).isoformat()
     mapping_path = Path(args.mapping)
     print("ALCHEMIZE — Loading classified inventory...")
-    with Path(mapping_path).open() as f:
-        data = json.load(f)
+    data = load_cached(mapping_path, jsonio.load_path)
     entries = data["entries"]
     print(f"  Loaded {len(entries)} entries")
 
+    # Provenance needs a digest for every classified file; intake skipped
+    # those without a same-size twin. Hash them once and keep the digests in
+    # the mapping, so later runs don't read those files again.
+    if not args.dry_run:
+        classified = [
+            e for e in entries if e.get("classification", {}).get("status") == "CLASSIFIED"
+        ]
+        hashed = hash_missing(classified)
+        if hashed:
+            jsonio.dump_path(data, mapping_path, indent=False)
+            print(f"  Hashed {hashed} files intake had not; saved to {mapping_path}")
+
     registry = load_registry()
 
     # Build deployment plan
     plan = get_deployment_plan(entries)
-    total_deploy = sum(len(v["deploy"]) for v in plan.values())
-    total_convert = sum(len(v["convert"]) for v in plan.values())
-    total_reference = sum(len(v["reference"]) for v in plan.values())
-    total_skip = sum(len(v["skip"]) for v in plan.values())
+    total_deploy = sum(len(v.deploy) for v in plan.values())
+    total_convert = sum(len(v.convert) for v in plan.values())
+    total_reference = sum(len(v.reference) for v in plan.values())
+    total_skip = sum(len(v.skip) for v in plan.values())
 
     print("\n  Deployment plan:")
     print(f"    Deploy directly: {total_deploy}")
@@ -123,14 +150,13 @@ def cmd_alchemize(args):
     # Filter by organ/repo if specified
     if args.organ:
         organ_filter = f"ORGAN-{args.organ.upper()}"
-        plan = {
-            k: v
+        organ_keys = {
+            k
             for k, v in plan.items()
-            if any(
-                e.get("classification", {}).get("target_organ") == organ_filter
-                for e in v["deploy"] + v["convert"]
-            )
+            for e in chain(v.deploy, v.convert)
+            if e.get("classification", {}).get("target_organ") == organ_filter
         }
+        plan = {k: v for k, v in plan.items() if k in organ_keys}
         print(f"    Filtered to organ {args.organ}: {len(plan)} repos")
 
     if args.repo:
@@ -140,11 +166,11 @@ def cmd_alchemize(args):
     if args.dry_run:
         print("\n  [DRY RUN] Would deploy to:")
         for repo_key, actions in sorted(plan.items()):
-            deploy_count = len(actions["deploy"])
-            ref_count = len(actions["reference"])
+            deploy_count = len(actions.deploy)
+            ref_count = len(actions.reference)
             if deploy_count or ref_count:
                 print(f"    {repo_key}: {deploy_count} files + {ref_count} references")
-                for entry in actions["deploy"][:3]:
+                for entry in actions.deploy[:3]:
                     print(f"      → {entry.get('_deploy_path', '?')}")
                 if deploy_count > 3:
                     print(f"      ... and {deploy_count - 3} more")
@@ -159,16 +185,13 @@ def cmd_alchemize(args):
 
     # Apply organ/repo filters
     if args.organ:
-        organ_filter = f"ORGAN-{args.organ.upper()}"
-        manifest = {
-            k: v
-            for k, v in manifest.items()
-            if any(
-                e.get("classification", {}).get("target_organ") == organ_filter
-                for e in entries
-                if e.get("classification", {}).get("target_repo") == v["repo"]
-            )
+        # One pass over entries instead of one per manifest repo
+        organ_repos = {
+            c.get("target_repo")
+            for c in (e.get("classification", {}) for e in entries)
+            if c.get("target_organ") == organ_filter
         }
+        manifest = {k: v for k, v in manifest.items() if v["repo"] in organ_repos}
 
     if args.repo:
         manifest = {k: v for k, v in manifest.items() if args.repo in k}
@@ -206,23 +229,43 @@ def cmd_alchemize(args):
 
     print(f"\n  Summary: deployed={total_deployed} skipped={total_skipped} failed={total_failed}")
 
-    # Generate and save provenance registry
-    prov_registry = generate_provenance_registry(entries)
+    # Generate and save provenance registry. It stays JSON: `status` and people
+    # read it directly, and no later stage parses it.
+    prov_registry = generate_provenance_registry(entries, generated_at)
     prov_path = Path("data/provenance-registry.json")
-    with Path(prov_path).open("w") as f:
-        json.dump(prov_registry, f, indent=2, default=str)
+    jsonio.dump_path(prov_registry, prov_path)
     print(f"  Wrote {prov_path}")
 
 
 def cmd_status(args):
     """Show pipeline status."""
-    import json
+    from alchemia.common import jsonio
+
+    data_dir = Path("data")
+    inventory = data_dir / "intake-inventory.jsonl"
+    legacy_inventory = data_dir / "intake-inventory.json"
+    if inventory.exists():
+        # NDJSON inventories keep their totals in the header file; an
+        # interrupted or copied inventory may lack it, so count the records
+        header = inventory.with_suffix(".header.json")
+        if header.exists():
+            total = jsonio.load_path(header).get("total_files", "?")
+        else:
+            total = sum(1 for _ in jsonio.iter_ndjson(inventory))
+        print(f"  {inventory.name}: {total} entries")
+    elif legacy_inventory.exists():
+        data = jsonio.load_path(legacy_inventory)
+        print(
+            f"  {legacy_inventory.name}: {data.get('total_files', '?')} entries "
+            "(legacy JSON; re-run 'alchemia intake' to write intake-inventory.jsonl)",
+        )
+    else:
+        print(f"  {inventory.name}: not found")
 
-    for name in ["intake-inventory.json", "absorb-mapping.json", "provenance-registry.json"]:
-        p = Path("data") / name
+    for name in ["absorb-mapping.json", "provenance-registry.json"]:
+        p = data_dir / name
         if p.exists():
-            with Path(p).open() as f:
-                data = json.load(f)
+            data = jsonio.load_path(p)
             print(f"  {name}: {data.get('total_files', data.get('total_entries', '?'))} entries")
         else:
             print(f"  {name}: not found")
@@ -230,15 +273,14 @@ def cmd_status(args):
 
 def cmd_review(args):
     """Display PENDING_REVIEW items from the absorb mapping."""
-    import json
+    from alchemia.common import jsonio
 
     mapping_path = Path("data/absorb-mapping.json")
     if not mapping_path.exists():
         print("REVIEW — No absorb-mapping.json found. Run 'alchemia absorb' first.")
         return
 
-    with mapping_path.open() as f:
-        data = json.load(f)
+    data = jsonio.load_path(mapping_path)
 
     entries = data.get("entries", [])
     status_filter = args.status
@@ -280,8 +322,8 @@ def cmd_synthesize(args):
     output_dir = Path(args.output_dir)
     print("SYNTHESIZE — Generating creative briefs...")
 
-    briefs = generate_all_briefs(output_dir=output_dir)
-    print(f"\n  Generated {len(briefs)} creative briefs")
+    briefs = generate_all_briefs(output_dir=output_dir, force=args.force)
+    print(f"\n  {len(briefs)} creative briefs up to date")
 
     # Also generate the workflow integration example
     example = generate_workflow_integration_example()
@@ -310,7 +352,7 @@ def cmd_capture(args):
 
 def cmd_sync(args):
     """Sync all capture channels (bookmarks, notes, AI chats)."""
-    from alchemia.aesthetic import add_reference
+    from alchemia.aesthetic import add_references
     from alchemia.channels.ai_chats import parse_gemini_visits
     from alchemia.channels.apple_notes import export_alchemia_notes
     from alchemia.channels.bookmarks import sync_bookmarks
@@ -320,15 +362,16 @@ def cmd_sync(args):
     # Channel 2: Bookmarks
     print("\n  Bookmarks:")
     bookmarks = sync_bookmarks()
-    new_bookmarks = 0
-    for bm in bookmarks:
-        add_reference(
-            ref_type="url",
-            value=bm["url"],
-            tags=["bookmark", bm["source"]],
-            notes=f"From {bm['source']}: {bm.get('title', '')}",
-        )
-        new_bookmarks += 1
+    added = add_references(
+        {
+            "ref_type": "url",
+            "value": bm["url"],
+            "tags": ["bookmark", bm["source"]],
+            "notes": f"From {bm['source']}: {bm.get('title', '')}",
+        }
+        for bm in bookmarks
+    )
+    new_bookmarks = len(added)
     print(f"    Found {len(bookmarks)} bookmarks in Inspirations folder, added {new_bookmarks}")
 
     # Channel 3: Apple Notes
@@ -340,9 +383,11 @@ def cmd_sync(args):
 
     # Channel 4: Google Docs
     print("\n  Google Docs:")
-    from alchemia.channels.google_docs import get_status, sync_google_docs
+    from alchemia.channels.google_docs import clear_folder_cache, get_status, sync_google_docs
 
     folder_name = args.gdocs_folder or "Alchemia"
+    if args.refresh_folder_cache:
+        clear_folder_cache()
     gdocs_status = get_status()
     if not gdocs_status["installed"]:
         print("    Skipped — google-api-python-client not installed")
@@ -351,7 +396,7 @@ def cmd_sync(args):
         print("    Skipped — not authenticated")
         print("    Run: alchemia gdocs-auth")
     else:
-        gdocs = sync_google_docs(folder_name=folder_name)
+        gdocs = sync_google_docs(folder_name=folder_name, full=args.gdocs_full)
         synced = sum(1 for d in gdocs if d["status"] == "synced")
         up_to_date = sum(1 for d in gdocs if d["status"] == "up_to_date")
         failed = sum(1 for d in gdocs if d["status"] == "failed")
@@ -441,14 +486,18 @@ def main():
     )
     p_intake.add_argument(
         "--output",
-        default="data/intake-inventory.json",
-        help="Output file path",
+        default="data/intake-inventory.jsonl",
+        help="Output file path (NDJSON; a .header.json file is written alongside)",
     )
     p_intake.set_defaults(func=cmd_intake)
 
     # absorb
     p_absorb = sub.add_parser("absorb", help="Classify + map files to target repos")
-    p_absorb.add_argument("--inventory", default="data/intake-inventory.json")
+    p_absorb.add_argument(
+        "--inventory",
+        default="data/intake-inventory.jsonl",
+        help="Intake inventory (.jsonl, or a legacy .json document)",
+    )
     p_absorb.add_argument("--output", default="data/absorb-mapping.json")
     p_absorb.set_defaults(func=cmd_absorb)
 
@@ -489,11 +538,26 @@ def main():
         "--gdocs-folder",
         help="Google Drive folder name to sync (default: Alchemia)",
     )
+    p_sync.add_argument(
+        "--gdocs-full",
+        action="store_true",
+        help="List every Google Doc instead of only those changed since the last sync",
+    )
+    p_sync.add_argument(
+        "--refresh-folder-cache",
+        action="store_true",
+        help="Look up the Google Drive folder again instead of using the cached ID",
+    )
     p_sync.set_defaults(func=cmd_sync)
 
     # synthesize
     p_synth = sub.add_parser("synthesize", help="Generate creative briefs from references")
     p_synth.add_argument("--output-dir", default="data/creative-briefs", help="Output directory")
+    p_synth.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate briefs even when taste.yaml and organ aesthetics are unchanged",
+    )
     p_synth.set_defaults(func=cmd_synthesize)
 
     # gdocs-auth
@@ -0,0 +1,79 @@
+"""JSON parsing and writing — orjson when installed, the stdlib json module otherwise.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+catching json.JSONDecodeError whichever backend is active.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: pip install alchemia[fast]
+    orjson = None
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_path(path: Path | str):
+    """Parse a JSON file, reading it as bytes to skip a separate UTF-8 decode."""
+    return loads(Path(path).read_bytes())
+
+
+def dump_path(obj, path: Path | str, indent: bool = True) -> None:
+    """Write obj as JSON, stringifying anything JSON has no type for.
+
+    Pass indent=False for files only the pipeline reads back; compact output
+    is smaller and faster to write and parse. Datetimes go through str() as
+    with json.dump(default=str), so output matches whichever backend wrote it.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        Path(path).write_bytes(orjson.dumps(obj, default=str, option=option))
+        return
+    with Path(path).open("w", encoding="utf-8") as f:
+        if indent:
+            json.dump(obj, f, indent=2, default=str)
+        else:
+            json.dump(obj, f, separators=(",", ":"), default=str)
+
+
+def dump_ndjson(records: Iterable, path: Path | str) -> int:
+    """Write one compact JSON document per line; returns the number written.
+
+    Records are encoded and written one at a time, so no serialized copy of
+    the whole collection is ever held in memory.
+    """
+    count = 0
+    with Path(path).open("wb") as f:
+        if orjson is not None:
+            option = (
+                orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+            for record in records:
+                f.write(orjson.dumps(record, default=str, option=option))
+                count += 1
+        else:
+            for record in records:
+                f.write(json.dumps(record, default=str, ensure_ascii=False).encode("utf-8"))
+                f.write(b"\n")
+                count += 1
+    return count
+
+
+def iter_ndjson(path: Path | str) -> Iterator:
+    """Yield each document of a newline-delimited JSON file, skipping blank lines."""
+    with Path(path).open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
@@ -0,0 +1,59 @@
+"""Pickled copies of parsed pipeline files, reused while the source is unchanged.
+
+Stages re-read large intake/absorb outputs on every run (e.g. a dry-run
+alchemize followed by the real one). Unpickling the parsed structure is
+cheaper than parsing JSON again, so the first parse is saved under
+CACHE_DIR, named after the resolved source path and stored with the
+source's mtime and size. Pickles are only ever read from that private
+directory, never from next to the (possibly user-supplied) source.
+"""
+
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+
+CACHE_DIR = Path("~/.cache/alchemia").expanduser()
+
+_UNPICKLE_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    TypeError,
+    ValueError,
+)
+
+
+def load_cached(path: Path | str, parse: Callable[[Path], object]):
+    """Return parse(path), or the pickled result of an earlier parse if path is unchanged.
+
+    Any change to the source's mtime or size invalidates the cache. A missing,
+    stale or unreadable cache just falls back to parsing.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    digest = hashlib.sha256(str(path).encode()).hexdigest()[:32]
+    cache_path = CACHE_DIR / f"{path.name}.{digest}.pkl"
+
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, value = pickle.load(f)
+    except _UNPICKLE_ERRORS:
+        pass
+    else:
+        if cached_key == key:
+            return value
+
+    value = parse(path)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    return value
@@ -2,83 +2,240 @@
 
 import hashlib
 import mimetypes
+import mmap
 import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
 # Directories to skip during crawl
-SKIP_DIRS = {
-    ".git",
-    "node_modules",
-    "__pycache__",
-    ".mypy_cache",
-    ".ruff_cache",
-    ".pytest_cache",
-    ".tox",
-    ".venv",
-    "venv",
-    ".egg-info",
-    "dist",
-    "build",
-    ".DS_Store",
-    ".Trash",
-    ".Spotlight-V100",
-    ".fseventsd",
-}
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        ".tox",
+        ".venv",
+        "venv",
+        ".egg-info",
+        "dist",
+        "build",
+        ".DS_Store",
+        ".Trash",
+        ".Spotlight-V100",
+        ".fseventsd",
+    },
+)
 
 # Top-level workspace directories to skip entirely (SDKs, tool installs, self-reference)
-SKIP_TOPLEVEL = {
-    "google-cloud-sdk",
-    "alchemia-ingestvm",
-}
+SKIP_TOPLEVEL = frozenset(
+    {
+        "google-cloud-sdk",
+        "alchemia-ingestvm",
+    },
+)
+
+# Everything pruned directly under a source dir
+_SKIP_TOPLEVEL_DIRS = SKIP_DIRS | SKIP_TOPLEVEL
 
 # File patterns to skip
-SKIP_FILES = {
-    ".DS_Store",
-    "Thumbs.db",
-    "desktop.ini",
-    ".gitkeep",
-}
+SKIP_FILES = frozenset(
+    {
+        ".DS_Store",
+        "Thumbs.db",
+        "desktop.ini",
+        ".gitkeep",
+    },
+)
+
+
+# Size cutoff, not a read size: larger files are hashed from one memory map,
+# smaller ones through hashlib.file_digest
+MMAP_HASH_THRESHOLD = 1 << 20
+
+# Page-cache hints for the hashing reads (not available on macOS/Windows)
+_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _hash_mapped(h, fd: int) -> None:
+    """Feed a whole file to h from one read-only memory map."""
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        h.update(mm)
 
 
 def sha256_file(path: Path) -> str:
-    """Compute SHA-256 hash of a file using chunked reads."""
-    h = hashlib.sha256()
+    """Compute SHA-256 hash of a file.
+
+    Files larger than MMAP_HASH_THRESHOLD are memory-mapped and hashed in
+    a single update call; smaller ones, where mapping costs more than it
+    saves, go through hashlib.file_digest's C read loop.
+    """
+    try:
+        with Path(path).open("rb", buffering=0) as f:
+            fd = f.fileno()
+            if _FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if os.fstat(fd).st_size > MMAP_HASH_THRESHOLD:
+                h = hashlib.sha256()
+                _hash_mapped(h, fd)
+            else:
+                h = hashlib.file_digest(f, "sha256")
+            # Each file is read once; drop its pages rather than evict others
+            if _FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except (OSError, PermissionError, ValueError):
+        return "ERROR_UNREADABLE"
+    return h.hexdigest()
+
+
+def sha256_prefix(path: Path, limit: int) -> str:
+    """SHA-256 of at most the first limit bytes of a file."""
     try:
         with Path(path).open("rb") as f:
-            while chunk := f.read(8192):
-                h.update(chunk)
+            data = f.read(limit)
     except (OSError, PermissionError):
         return "ERROR_UNREADABLE"
-    return h.hexdigest()
+    return hashlib.sha256(data).hexdigest()
 
 
-def file_metadata(path: Path, root_dir: Path) -> dict:
-    """Gather metadata for a single file."""
-    stat = path.stat()
-    ext = path.suffix.lower()
-    mime_type, _ = mimetypes.guess_type(str(path))
+@lru_cache(maxsize=1024)
+def _mime_for_ext(ext: str) -> str:
+    mime_type, _ = mimetypes.guess_type("f" + ext)
+    return mime_type or "application/octet-stream"
+
+
+def _guess_mime(name: str, ext: str) -> str:
+    """MIME type for a filename, memoized per extension.
+
+    Compression suffixes (.gz, .bz2, ...) depend on the inner extension too,
+    so those names are looked up in full.
+    """
+    if ext in mimetypes.encodings_map:
+        mime_type, _ = mimetypes.guess_type(name)
+        return mime_type or "application/octet-stream"
+    return _mime_for_ext(ext)
+
+
+def _metadata(full: str, root: str, dirpath: str, name: str, st: os.stat_result) -> dict:
+    """Build one inventory entry from a path already split into its parts."""
+    relative = full[len(root) + 1 :]
+    dot = name.rfind(".")
+    # Same rule as Path.suffix: no suffix for dotfiles or a trailing "."
+    ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
 
     return {
-        "path": str(path),
-        "relative_path": str(path.relative_to(root_dir)),
-        "source_dir": str(root_dir),
-        "filename": path.name,
+        "path": full,
+        "relative_path": relative,
+        "source_dir": root,
+        "filename": name,
         "extension": ext,
-        "mime_type": mime_type or "application/octet-stream",
-        "size_bytes": stat.st_size,
-        "last_modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
-        "sha256": sha256_file(path),
-        "parent_dir": path.parent.name,
-        "depth": len(path.relative_to(root_dir).parts) - 1,
+        "mime_type": _guess_mime(name, ext),
+        "size_bytes": st.st_size,
+        "last_modified": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).isoformat(),
+        "sha256": None,
+        "parent_dir": dirpath[dirpath.rfind(os.sep) + 1 :],
+        "depth": relative.count(os.sep),
     }
 
 
-def crawl(source_dirs: list[Path]) -> list[dict]:
-    """Crawl all source directories and return file metadata entries."""
+def file_metadata(path: Path, root_dir: Path) -> dict:
+    """Gather metadata for a single file.
+
+    Content is not read here: sha256 starts as None and is filled in by
+    dedup.mark_duplicates for files that could have a duplicate, or on
+    demand when provenance is written.
+    """
+    return _metadata(str(path), str(root_dir), str(path.parent), path.name, path.stat())
+
+
+def _crawl_dir(root_dir: Path) -> list[dict]:
+    """Walk one resolved source directory and return its file metadata entries.
+
+    A stack of os.scandir passes replaces os.walk + Path: the symlink and
+    type checks come from the directory read, and each file costs one stat.
+    """
+    root = str(root_dir)
     entries = []
-    seen_paths = set()
+    seen_files = set()
+    stack = [root]
 
+    while stack:
+        dirpath = stack.pop()
+        skip_dirs = _SKIP_TOPLEVEL_DIRS if dirpath == root else SKIP_DIRS
+        subdirs = []
+        try:
+            it = os.scandir(dirpath)
+        except OSError as e:
+            print(f"  WARNING: Cannot read {dirpath}: {e}")
+            continue
+
+        with it:
+            for dirent in it:
+                name = dirent.name
+                try:
+                    is_dir = dirent.is_dir(follow_symlinks=False)
+                    is_symlink = dirent.is_symlink()
+                except OSError:
+                    continue
+
+                # Prune skippable directories
+                if is_dir:
+                    if name[0] != "." and name not in skip_dirs:
+                        subdirs.append(dirent.path)
+                    continue
+
+                # Skip symlinks, skippable names and already-seen files
+                if is_symlink or name in SKIP_FILES:
+                    continue
+                full = dirent.path
+                try:
+                    st = dirent.stat(follow_symlinks=False)
+                except OSError as e:
+                    print(f"  WARNING: Cannot read {full}: {e}")
+                    continue
+
+                # (device, inode) identifies the file itself, so hard links
+                # are reported once without a realpath() per file. DirEntry
+                # stats carry no inode on Windows; there every file is kept.
+                if st.st_ino:
+                    identity = (st.st_dev, st.st_ino)
+                    if identity in seen_files:
+                        continue
+                    seen_files.add(identity)
+                entries.append(_metadata(full, root, dirpath, name, st))
+
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+    return entries
+
+
+def crawl(source_dirs: list[Path], max_workers: int | None = None) -> list[dict]:
+    """Crawl all source directories and return file metadata entries."""
+    return list(iter_crawl(source_dirs, max_workers))
+
+
+def iter_crawl(source_dirs: list[Path], max_workers: int | None = None) -> Iterator[dict]:
+    """Yield file metadata entries for all source directories.
+
+    Each source directory is walked in its own worker process
+    (one at a time when there is only one directory or max_workers is 1).
+    Batches are yielded in source order, and at most one directory per worker
+    is running or waiting to be consumed, so finished batches never pile up
+    behind a slow consumer.
+    A file reachable from several source directories is reported once, under
+    the first directory listed.
+    """
+    roots = []
     for root_dir in source_dirs:
         root_dir = root_dir.expanduser().resolve()
         if not root_dir.exists():
@@ -87,35 +244,33 @@ def crawl(source_dirs: list[Path]) -> list[dict]:
         if not root_dir.is_dir():
             print(f"  WARNING: Not a directory: {root_dir}")
             continue
+        roots.append(root_dir)
 
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            # Prune skippable directories in-place
-            dp = Path(dirpath)
-            is_toplevel = dp == root_dir
-            dirnames[:] = [
-                d
-                for d in dirnames
-                if d not in SKIP_DIRS
-                and not d.startswith(".")
-                and not (is_toplevel and d in SKIP_TOPLEVEL)
-            ]
-
-            for fname in filenames:
-                if fname in SKIP_FILES:
-                    continue
+    workers = min(len(roots), max_workers or os.cpu_count() or 1)
+    seen_paths = set()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            batches = _windowed_map(ex, _crawl_dir, roots, workers)
+            yield from _unseen(chain.from_iterable(batches), seen_paths)
+    else:
+        yield from _unseen(chain.from_iterable(map(_crawl_dir, roots)), seen_paths)
 
-                fpath = Path(dirpath) / fname
-                resolved = fpath.resolve()
 
-                # Skip symlinks and already-seen files
-                if fpath.is_symlink() or str(resolved) in seen_paths:
-                    continue
-                seen_paths.add(str(resolved))
+def _windowed_map(ex: Executor, fn, items: list, window: int) -> Iterator:
+    """Like ex.map, in order, but with only window calls submitted or unconsumed at once."""
+    pending = deque()
+    items = iter(items)
+    for item in islice(items, window):
+        pending.append(ex.submit(fn, item))
+    while pending:
+        result = pending.popleft().result()
+        for item in islice(items, 1):
+            pending.append(ex.submit(fn, item))
+        yield result
 
-                try:
-                    entry = file_metadata(fpath, root_dir)
-                    entries.append(entry)
-                except (OSError, PermissionError) as e:
-                    print(f"  WARNING: Cannot read {fpath}: {e}")
 
-    return entries
+def _unseen(entries: Iterator[dict], seen_paths: set[str]) -> Iterator[dict]:
+    for entry in entries:
+        if entry["path"] not in seen_paths:
+            seen_paths.add(entry["path"])
+            yield entry
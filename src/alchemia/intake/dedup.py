@@ -1,42 +1,132 @@
 """Duplicate detection by SHA-256 fingerprint."""
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+
+from alchemia.intake.crawler import sha256_file, sha256_prefix
+
+# Bytes hashed to split same-size files before paying for a full read
+PREFIX_BYTES = 4096
+
+# Hashing threads: file reads and hashlib updates both release the GIL, so
+# this many reads stay in flight at once (the portable stand-in for batched
+# io_uring submission, which would need a non-stdlib binding)
+HASH_WORKERS = 8
+
+# Below this many files, thread start-up and handoff cost more than the overlap saves
+PARALLEL_HASH_THRESHOLD = 64
+
+
+def _hash_all(hash_fn, paths: list[str]) -> list[str]:
+    """hash_fn over paths on HASH_WORKERS threads, results in input order."""
+    if len(paths) < PARALLEL_HASH_THRESHOLD:
+        return [hash_fn(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(paths))) as pool:
+        return list(pool.map(hash_fn, paths))
+
+
+def _hash_candidates(entries: list[dict]) -> None:
+    """Fill in sha256 for unhashed entries that could have a duplicate.
+
+    Files are bucketed by size, then by a hash of their first PREFIX_BYTES;
+    only unhashed entries still sharing a bucket are read in full. A file no
+    larger than the prefix is fully hashed by the prefix pass itself.
+    Entries that already carry a sha256 (from an earlier inventory, say)
+    take part in the bucketing but are never re-hashed.
+    """
+    by_size = defaultdict(list)
+    for entry in entries:
+        if "size_bytes" in entry:
+            by_size[entry["size_bytes"]].append(entry)
+
+    # Only size groups with something left to hash; known digests need just a prefix
+    groups = [g for g in by_size.values() if len(g) > 1 and any(e.get("sha256") is None for e in g)]
+    need_prefix = [
+        e for g in groups for e in g if e.get("sha256") is None or "prefix_hash" not in e
+    ]
+    prefixes = _hash_all(
+        lambda path: sha256_prefix(path, PREFIX_BYTES),
+        [e["path"] for e in need_prefix],
+    )
+    for entry, prefix in zip(need_prefix, prefixes, strict=True):
+        if entry.get("sha256") is None:
+            entry["prefix_hash"] = prefix
+            if entry["size_bytes"] <= PREFIX_BYTES or prefix == "ERROR_UNREADABLE":
+                entry["sha256"] = prefix
+        elif prefix != "ERROR_UNREADABLE":
+            entry["prefix_hash"] = prefix
+
+    survivors = {}
+    for group in groups:
+        pending = [e for e in group if e.get("sha256") is None]
+        if not pending:
+            continue
+        if any(e.get("sha256") and "prefix_hash" not in e for e in group):
+            # A known digest whose file can no longer be read could still match any of them
+            survivors.update((id(e), e) for e in pending)
+            continue
+        by_prefix = defaultdict(list)
+        for entry in group:
+            by_prefix[entry["prefix_hash"]].append(entry)
+        survivors.update(
+            (id(e), e)
+            for bucket in by_prefix.values()
+            if len(bucket) > 1
+            for e in bucket
+            if e.get("sha256") is None
+        )
+
+    survivors = list(survivors.values())
+    digests = _hash_all(sha256_file, [e["path"] for e in survivors])
+    for entry, digest in zip(survivors, digests, strict=True):
+        entry["sha256"] = digest
+
+
+def hash_unhashed(entries: list[dict]) -> list[dict]:
+    """Fully hash the entries that still lack a sha256, on the dedup thread pool.
+
+    Returns the entries hashed, in input order.
+    """
+    pending = [e for e in entries if e.get("sha256") is None]
+    digests = _hash_all(sha256_file, [e["path"] for e in pending])
+    for entry, digest in zip(pending, digests, strict=True):
+        entry["sha256"] = digest
+    return pending
 
 
 def mark_duplicates(entries: list[dict]) -> list[dict]:
     """Mark duplicate files. Most-specific directory path wins (deepest nesting)."""
-    by_hash = defaultdict(list)
+    _hash_candidates(entries)
 
+    hashed = []
+    # Never hashed means no other file shares its size and prefix: unique by construction
+    unique = 0
     for entry in entries:
+        entry["duplicate"] = False
+        entry["duplicate_group"] = None
+        entry.pop("duplicate_of", None)
         sha = entry.get("sha256")
-        if sha and sha != "ERROR_UNREADABLE":
-            by_hash[sha].append(entry)
+        if sha is None:
+            unique += 1
+        elif sha != "ERROR_UNREADABLE":
+            hashed.append(entry)
 
-    dup_count = 0
-    for sha, group in by_hash.items():
-        if len(group) < 2:
-            for e in group:
-                e["duplicate"] = False
-                e["duplicate_group"] = None
-            continue
-
-        # Sort by depth (deepest = most specific wins), then by path length
-        group.sort(key=lambda e: (-e.get("depth", 0), len(e["path"])))
-        primary = group[0]
-        primary["duplicate"] = False
-        primary["duplicate_group"] = sha[:12]
+    # Within each hash, deepest (most specific) first, then shortest path
+    hashed.sort(key=lambda e: (e["sha256"], -e.get("depth", 0), len(e["path"])))
 
-        for dup in group[1:]:
+    dup_count = 0
+    for sha, group in groupby(hashed, key=itemgetter("sha256")):
+        unique += 1
+        primary, *dups = group
+        if dups:
+            primary["duplicate_group"] = sha[:12]
+        for dup in dups:
             dup["duplicate"] = True
             dup["duplicate_group"] = sha[:12]
             dup["duplicate_of"] = primary["path"]
             dup_count += 1
 
-    # Mark non-duplicate singletons
-    for entry in entries:
-        if "duplicate" not in entry:
-            entry["duplicate"] = False
-            entry["duplicate_group"] = None
-
-    print(f"  Found {dup_count} duplicate files across {len(by_hash)} unique hashes")
+    print(f"  Found {dup_count} duplicate files; {unique} distinct contents")
     return entries
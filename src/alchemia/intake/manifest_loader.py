@@ -2,8 +2,67 @@
 
 import csv
 import json
+import os
 from pathlib import Path
 
+from alchemia.common import jsonio
+
+# CSV column for each manifest field; "Title" first since it is the key
+_MANIFEST_COLUMNS = (
+    "Title",
+    "ID",
+    "Category",
+    "Primary_Tags",
+    "Type",
+    "Status",
+    "Primary_Use",
+    "Phase",
+    "Key_Dependencies",
+)
+_MANIFEST_FIELDS = (
+    "manifest_id",
+    "manifest_category",
+    "manifest_tags",
+    "manifest_type",
+    "manifest_status",
+    "manifest_primary_use",
+    "manifest_phase",
+    "manifest_dependencies",
+)
+
+# Parsed manifests by path, keyed on (mtime_ns, size) of the CSV when parsed
+_manifest_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_manifest(manifest_path: Path) -> dict[str, dict]:
+    """Lower-cased title → manifest fields, reparsed only when the CSV changes."""
+    st = Path(manifest_path).stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _manifest_cache.get(str(manifest_path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    manifest = {}
+    with Path(manifest_path).open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        cols = [header.index(name) if name in header else None for name in _MANIFEST_COLUMNS]
+        title_col, field_cols = cols[0], cols[1:]
+        # Index by column position; rows and headers may be short or missing columns
+        for row in reader if title_col is not None else ():
+            title = row[title_col].strip() if title_col < len(row) else ""
+            if title:
+                values = [row[i] if i is not None and i < len(row) else "" for i in field_cols]
+                manifest[title.lower()] = dict(zip(_MANIFEST_FIELDS, values, strict=True))
+    _manifest_cache[str(manifest_path)] = (key, manifest)
+    return manifest
+
+
+def _stem(name: str) -> str:
+    """Path(name).stem by string slicing (dotfiles and a trailing "." keep their name)."""
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
 
 def enrich_from_manifest(entries: list[dict], manifest_path: Path) -> list[dict]:
     """Cross-reference entries with MANIFEST_INDEX_TABLE.csv.
@@ -11,29 +70,13 @@ def enrich_from_manifest(entries: list[dict], manifest_path: Path) -> list[dict]
     The CSV has columns: ID, Category, Title, Size_KB, Type, Status,
     Primary_Tags, Key_Dependencies, Primary_Use, Phase
     """
-    manifest = {}
-    with Path(manifest_path).open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            title = row.get("Title", "").strip()
-            if title:
-                manifest[title.lower()] = {
-                    "manifest_id": row.get("ID", ""),
-                    "manifest_category": row.get("Category", ""),
-                    "manifest_tags": row.get("Primary_Tags", ""),
-                    "manifest_type": row.get("Type", ""),
-                    "manifest_status": row.get("Status", ""),
-                    "manifest_primary_use": row.get("Primary_Use", ""),
-                    "manifest_phase": row.get("Phase", ""),
-                    "manifest_dependencies": row.get("Key_Dependencies", ""),
-                }
+    manifest = _load_manifest(manifest_path)
 
     matched = 0
     for entry in entries:
         fname = entry["filename"].lower()
-        # Try exact match first, then without extension
-        stem = Path(fname).stem.lower()
-        match = manifest.get(fname) or manifest.get(stem)
+        # Try exact match first, then without extension (only if needed)
+        match = manifest.get(fname) or manifest.get(_stem(fname))
         if match:
             entry["manifest"] = match
             matched += 1
@@ -50,26 +93,25 @@ def enrich_from_sidecars(entries: list[dict]) -> list[dict]:
     FUNCTIONcalled naming convention: if a file is `foo.py`,
     its sidecar is `foo.py.meta.json`.
     """
+    # Parent dirs by string slicing, computed once and shared by both passes
+    parents = [entry["path"].rpartition(os.sep)[0] for entry in entries]
+
     # Build a lookup of all .meta.json files in the inventory
     sidecar_paths = {}
-    for entry in entries:
+    for entry, parent in zip(entries, parents, strict=True):
         if entry["filename"].endswith(".meta.json"):
             # The source file is the filename minus ".meta.json"
             source_name = entry["filename"][: -len(".meta.json")]
-            parent = str(Path(entry["path"]).parent)
             sidecar_paths[(parent, source_name)] = entry["path"]
 
     enriched = 0
-    for entry in entries:
+    for entry, parent in zip(entries, parents, strict=True):
         if entry["filename"].endswith(".meta.json"):
             continue
-        key = (str(Path(entry["path"]).parent), entry["filename"])
-        sidecar_path = sidecar_paths.get(key)
+        sidecar_path = sidecar_paths.get((parent, entry["filename"])) if sidecar_paths else None
         if sidecar_path:
             try:
-                with Path(sidecar_path).open(encoding="utf-8") as f:
-                    sidecar_data = json.load(f)
-                entry["sidecar"] = sidecar_data
+                entry["sidecar"] = jsonio.load_path(sidecar_path)
                 enriched += 1
             except (json.JSONDecodeError, OSError):
                 entry["sidecar"] = None
@@ -2,9 +2,16 @@
 
 from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
-from alchemia.aesthetic import format_prompt_injection, load_taste, resolve_aesthetic_chain
+from alchemia.aesthetic import (
+    TASTE_PATH,
+    format_prompt_injection,
+    load_taste,
+    organ_aesthetic_path,
+    resolve_aesthetic_chain,
+)
 
 # ISOTOPE DISSOLUTION: organ map canonical source is organvm-engine/organ_config.py.
 # The name/domain metadata is alchemia's own concern (the engine doesn't carry it).
@@ -47,7 +54,7 @@
     }
 
 
-def analyze_references(taste_path: Path | None = None) -> dict:
+def analyze_references(taste_path: Path | None = None, taste: dict | None = None) -> dict:
     """Analyze accumulated references and group by tag clusters.
 
     Returns dict with:
@@ -55,31 +62,59 @@ def analyze_references(taste_path: Path | None = None) -> dict:
       - by_type: {type: [references]}
       - tag_counts: {tag: count}
       - total: int
+
+    An already loaded taste dict skips reading taste_path.
     """
-    taste = load_taste(taste_path)
+    if taste is None:
+        taste = load_taste(taste_path)
     refs = taste.get("references", [])
 
     by_tag = defaultdict(list)
     by_type = defaultdict(list)
-    tag_counts = defaultdict(int)
 
     for ref in refs:
-        ref_type = ref.get("type", "unknown")
-        by_type[ref_type].append(ref)
-
+        by_type[ref.get("type", "unknown")].append(ref)
         for tag in ref.get("tags", ["uncategorized"]):
             by_tag[tag].append(ref)
-            tag_counts[tag] += 1
 
     return {
         "by_tag": dict(by_tag),
         "by_type": dict(by_type),
-        "tag_counts": dict(tag_counts),
+        # Each tag occurrence lands in by_tag once, so its list length is the count
+        "tag_counts": {tag: len(group) for tag, group in by_tag.items()},
         "total": len(refs),
     }
 
 
-def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
+# Static brief fragments, built once rather than per organ
+_PALETTE_HEADER = (
+    "## 2. Color Palette",
+    "",
+    "| Role | Value | Usage |",
+    "|------|-------|-------|",
+)
+_APPENDIX_HEADER = (
+    "---",
+    "",
+    "## Appendix: AI Prompt Injection Block",
+    "",
+    "Copy this block into AI generation prompts to enforce aesthetic guidelines:",
+    "",
+    "```markdown",
+)
+
+
+@lru_cache(maxsize=256)
+def _label(key: str) -> str:
+    """Human label for a taste.yaml key; the same keys recur in every organ's brief."""
+    return key.replace("_", " ").title()
+
+
+def generate_creative_brief(
+    organ: str,
+    taste_path: Path | None = None,
+    taste: dict | None = None,
+) -> str:
     """Generate a creative brief for a specific organ.
 
     The brief includes:
@@ -89,10 +124,14 @@ def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
       4. Typography recommendations
       5. Tone guide
       6. Anti-pattern checklist
+
+    An already loaded taste dict skips reading taste_path.
     """
-    chain = resolve_aesthetic_chain(organ=organ, taste_path=taste_path)
+    if taste is None:
+        taste = load_taste(taste_path)
+    chain = resolve_aesthetic_chain(organ=organ, taste_path=taste_path, taste=taste)
     organ_info = ORGAN_MAP.get(organ, {"name": organ, "domain": ""})
-    analyze_references(taste_path)
+    mods = chain.get("organ_modifiers") or {}
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
@@ -114,19 +153,11 @@ def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
     # Palette
     palette = chain.get("palette", {})
     if palette:
-        lines.extend(
-            [
-                "## 2. Color Palette",
-                "",
-                "| Role | Value | Usage |",
-                "|------|-------|-------|",
-            ],
-        )
+        lines.extend(_PALETTE_HEADER)
         for role, value in palette.items():
-            lines.append(f"| {role} | `{value}` | {role.replace('_', ' ').title()} |")
+            lines.append(f"| {role} | `{value}` | {_label(role)} |")
         lines.append("")
 
-        mods = chain.get("organ_modifiers", {})
         if mods.get("palette_shift"):
             lines.append(f"**Organ modifier:** {mods['palette_shift']}")
             lines.append("")
@@ -141,8 +172,7 @@ def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
             ],
         )
         for key, value in typo.items():
-            lines.append(f"- **{key.replace('_', ' ').title()}:** {value}")
-        mods = chain.get("organ_modifiers", {})
+            lines.append(f"- **{_label(key)}:** {value}")
         if mods.get("typography_emphasis"):
             lines.append(f"- **Organ emphasis:** {mods['typography_emphasis']}")
         lines.append("")
@@ -157,8 +187,7 @@ def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
             ],
         )
         for key, value in tone.items():
-            lines.append(f"- **{key.replace('_', ' ').title()}:** {value}")
-        mods = chain.get("organ_modifiers", {})
+            lines.append(f"- **{_label(key)}:** {value}")
         if mods.get("tone_shift"):
             lines.append(f"- **Organ shift:** {mods['tone_shift']}")
         lines.append("")
@@ -182,7 +211,6 @@ def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
         if keywords:
             lines.append(f"**Keywords:** {', '.join(keywords)}")
             lines.append("")
-        mods = chain.get("organ_modifiers", {})
         if mods.get("visual_shift"):
             lines.append(f"**Organ visual:** {mods['visual_shift']}")
             lines.append("")
@@ -227,41 +255,56 @@ def generate_creative_brief(organ: str, taste_path: Path | None = None) -> str:
         lines.append("")
 
     # Prompt injection block
-    lines.extend(
-        [
-            "---",
-            "",
-            "## Appendix: AI Prompt Injection Block",
-            "",
-            "Copy this block into AI generation prompts to enforce aesthetic guidelines:",
-            "",
-            "```markdown",
-            format_prompt_injection(chain),
-            "```",
-        ],
-    )
+    lines.extend(_APPENDIX_HEADER)
+    lines.append(format_prompt_injection(chain))
+    lines.append("```")
 
     return "\n".join(lines)
 
 
+def _is_current(out_path: Path, sources: list[Path]) -> bool:
+    """True when out_path exists and is no older than any of its sources."""
+    try:
+        built = out_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(src.stat().st_mtime_ns <= built for src in sources)
+
+
 def generate_all_briefs(
     output_dir: Path | None = None,
     taste_path: Path | None = None,
+    *,
+    force: bool = False,
 ) -> list[Path]:
     """Generate creative briefs for all organs.
 
+    A brief newer than both taste.yaml and its organ aesthetic file is left
+    as is; force=True regenerates every brief.
+
     Returns list of output file paths.
     """
     output_dir = output_dir or Path("data/creative-briefs")
     output_dir.mkdir(parents=True, exist_ok=True)
+    taste_file = Path(taste_path or TASTE_PATH)
 
+    # Loaded on the first stale brief, then shared; the briefs only read from it
+    taste = None
     outputs = []
     for organ in ORGAN_MAP:
-        brief = generate_creative_brief(organ, taste_path)
         filename = f"creative-brief-{organ.lower().replace('-', '_')}.md"
         out_path = output_dir / filename
-        out_path.write_text(brief)
         outputs.append(out_path)
+        organ_file = organ_aesthetic_path(organ, taste_path)
+        sources = [taste_file] if organ_file is None else [taste_file, organ_file]
+        if not force and _is_current(out_path, sources):
+            print(f"  Up to date: {out_path}")
+            continue
+        if taste is None:
+            taste = load_taste(taste_path)
+        brief = generate_creative_brief(organ, taste_path, taste=taste)
+        # Explicit UTF-8: briefs carry em dashes and the locale default may not be UTF-8
+        out_path.write_bytes(brief.encode("utf-8"))
         print(f"  Generated: {out_path}")
 
     return outputs
@@ -4,13 +4,22 @@
 
 import yaml
 
-from alchemia.aesthetic import add_reference, format_prompt_injection, resolve_aesthetic_chain
+from alchemia.aesthetic import (
+    add_reference,
+    format_prompt_injection,
+    load_taste,
+    resolve_aesthetic_chain,
+)
+
+# Parse with the same loader the module uses so the C path is what gets validated
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def test_taste_yaml_valid():
     taste_path = Path(__file__).parent.parent / "taste.yaml"
     with Path(taste_path).open() as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
     assert data["schema_version"] == "1.0"
     assert "palette" in data
     assert "typography" in data
@@ -21,9 +30,12 @@ def test_taste_yaml_valid():
 
 def test_organ_aesthetics_valid():
     organ_dir = Path(__file__).parent.parent / "data" / "organ-aesthetics"
-    for yaml_file in organ_dir.glob("*.yaml"):
-        with Path(yaml_file).open() as f:
-            data = yaml.safe_load(f)
+    files = sorted(organ_dir.glob("*.yaml"))
+    # One multi-document stream, so the parser is set up once for every file
+    stream = b"\n---\n".join(p.read_bytes() for p in files)
+    docs = list(yaml.load_all(stream, Loader=_Loader))
+    assert len(docs) == len(files) == 8
+    for data in docs:
         assert data["schema_version"] == "1.0"
         assert "inherits" in data
         assert "modifiers" in data
@@ -37,6 +49,29 @@ def test_resolve_chain_organ_i():
     assert chain["organ_name"] == "Theoria"
 
 
+def test_resolve_chain_leaves_shared_taste_untouched():
+    taste = load_taste()
+    before = len(taste.get("references", []))
+    for organ in ("ORGAN-I", "ORGAN-II"):
+        resolve_aesthetic_chain(organ=organ, taste=taste)
+    assert len(taste.get("references", [])) == before
+
+
+def test_resolve_chain_reparses_changed_organ_file(tmp_path):
+    organ_file = tmp_path / "organ-i-theoria.yaml"
+    organ_file.write_text("name: First\nmodifiers: {}\n")
+    assert (
+        resolve_aesthetic_chain("ORGAN-I", organ_aesthetics_dir=tmp_path)["organ_name"] == "First"
+    )
+    chain = resolve_aesthetic_chain("ORGAN-I", organ_aesthetics_dir=tmp_path)
+    chain["organ_modifiers"]["tone_shift"] = "mutated"
+
+    organ_file.write_text("name: Second\nmodifiers: {}\n")
+    chain = resolve_aesthetic_chain("ORGAN-I", organ_aesthetics_dir=tmp_path)
+    assert chain["organ_name"] == "Second"
+    assert chain["organ_modifiers"] == {}
+
+
 def test_format_prompt_injection():
     chain = resolve_aesthetic_chain(organ="ORGAN-I")
     prompt = format_prompt_injection(chain)
@@ -55,6 +90,7 @@ def test_add_reference(tmp_path):
                 "references": [],
                 "anti_patterns": [],
             },
+            Dumper=_Dumper,
         ),
     )
     entry = add_reference("note", "Test note", tags=["test"], path=taste)
@@ -65,3 +101,39 @@ def test_add_reference(tmp_path):
     with Path(taste).open() as f:
         data = yaml.safe_load(f)
     assert len(data["references"]) == 1
+
+
+def test_load_taste_returns_private_copy(tmp_path):
+    taste = tmp_path / "taste.yaml"
+    taste.write_text(yaml.dump({"references": []}))
+    load_taste(taste)["references"].append({"type": "note"})
+    assert load_taste(taste)["references"] == []
+
+
+def test_add_reference_twice_sees_first_write(tmp_path):
+    taste = tmp_path / "taste.yaml"
+    taste.write_text(yaml.dump({"references": []}))
+    add_reference("note", "one", path=taste)
+    add_reference("note", "two", path=taste)
+    assert [r["text"] for r in load_taste(taste)["references"]] == ["one", "two"]
+
+
+def test_add_references_saves_once(tmp_path, monkeypatch):
+    from alchemia import aesthetic
+
+    taste = tmp_path / "taste.yaml"
+    taste.write_text(yaml.dump({"references": [{"type": "url", "source": "a"}]}))
+    saves = []
+    real_save = aesthetic.save_taste
+    monkeypatch.setattr(aesthetic, "save_taste", lambda d, p: saves.append(p) or real_save(d, p))
+
+    refs = [
+        {"ref_type": "url", "value": f"https://e.com/{i}", "tags": ["bookmark"]} for i in range(3)
+    ]
+    entries = aesthetic.add_references(refs, path=taste)
+    assert [e["source"] for e in entries] == [f"https://e.com/{i}" for i in range(3)]
+    assert len(saves) == 1
+    assert len(aesthetic.load_taste(taste)["references"]) == 4
+
+    assert aesthetic.add_references([], path=taste) == []
+    assert len(saves) == 1
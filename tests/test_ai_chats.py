@@ -84,6 +84,30 @@ def test_chatgpt_filters_short_messages(tmp_path):
     assert result == []
 
 
+def test_chatgpt_streams_with_ijson(tmp_path, monkeypatch):
+    import types
+
+    import alchemia.channels.ai_chats as mod
+
+    def items(f, prefix, use_float=False):
+        assert (prefix, use_float) == ("item", True)
+        yield from json.load(f)
+
+    monkeypatch.setattr(mod, "ijson", types.SimpleNamespace(items=items))
+    text = "A message comfortably longer than the fifty character cut-off."
+    conversations = [
+        {
+            "title": "Streamed",
+            "create_time": 1700000000,
+            "mapping": {"m1": {"message": {"content": {"parts": [text]}}}},
+        },
+    ]
+    (tmp_path / "conversations.json").write_text(json.dumps(conversations))
+
+    result = parse_chatgpt_export(tmp_path)
+    assert [(r["title"], r["preview"]) for r in result] == [("Streamed", text)]
+
+
 def test_claude_sessions_empty_dir(tmp_path):
     assert parse_claude_sessions(tmp_path) == []
 
@@ -120,6 +144,7 @@ def test_claude_sessions_with_jsonl(tmp_path):
     assert len(result) == 1
     assert result[0]["source"] == "claude"
     assert result[0]["message_count"] == 2
+    assert result[0]["session_file"] == str(jsonl)
 
 
 def test_claude_sessions_skips_short_messages(tmp_path):
@@ -132,6 +157,24 @@ def test_claude_sessions_skips_short_messages(tmp_path):
     assert result == []
 
 
+def test_iter_jsonl_finds_nested_files_only(tmp_path):
+    from alchemia.channels.ai_chats import _iter_jsonl
+
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.jsonl").write_text("")
+    (tmp_path / "a" / "b" / "deep.jsonl").write_text("")
+    (tmp_path / "a" / "notes.txt").write_text("")
+
+    found = sorted(_iter_jsonl(str(tmp_path)))
+    assert found == [str(tmp_path / "a" / "b" / "deep.jsonl"), str(tmp_path / "top.jsonl")]
+
+
+def test_iter_jsonl_missing_root(tmp_path):
+    from alchemia.channels.ai_chats import _iter_jsonl
+
+    assert list(_iter_jsonl(str(tmp_path / "missing"))) == []
+
+
 def test_gemini_visits_no_files(tmp_path):
     assert parse_gemini_visits(tmp_path) == []
 
@@ -159,3 +202,26 @@ def test_gemini_visits_invalid_json(tmp_path):
 
     result = parse_gemini_visits(tmp_path)
     assert result == []
+
+
+def test_clip_join_matches_join_then_slice():
+    from alchemia.channels.ai_chats import _clip_join
+
+    for parts in ([], ["a"], ["x" * 500, "y"], ["ab", "cd" * 150, "ef"]):
+        for limit in (1, 3, 200):
+            assert _clip_join(parts, limit) == " ".join(parts)[:limit]
+
+
+def test_chatgpt_multi_part_preview(tmp_path):
+    convo = {
+        "title": "Parts",
+        "create_time": 1700000000,
+        "mapping": {
+            "m1": {"message": {"content": {"parts": ["a" * 30, {"asset": 1}, "b" * 300]}}},
+        },
+    }
+    (tmp_path / "conversations.json").write_text(json.dumps([convo]))
+
+    (result,) = parse_chatgpt_export(tmp_path)
+    assert result["message_count"] == 1
+    assert result["preview"] == ("a" * 30 + " " + "b" * 300)[:200]
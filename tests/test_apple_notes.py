@@ -1,21 +1,34 @@
 """Tests for channels/apple_notes.py — Apple Notes export via AppleScript."""
 
-import json
 import subprocess
 
+import pytest
+
 from alchemia.channels.apple_notes import export_alchemia_notes, export_note_body
 
 
+def _records(*notes):
+    """Format notes the way the export AppleScript prints them."""
+    return "\x1e".join("\x1f".join(note) for note in notes) + "\n"
+
+
+@pytest.fixture(autouse=True)
+def _clear_body_cache():
+    import alchemia.channels.apple_notes as mod
+
+    mod._note_bodies.clear()
+    mod._missing_titles.clear()
+
+
 def test_export_notes_success(monkeypatch, tmp_path):
     import alchemia.channels.apple_notes as mod
 
     monkeypatch.setattr(mod, "NOTES_OUTPUT_DIR", tmp_path / "notes")
 
-    notes_json = [
-        json.dumps({"id": "1", "title": "Note A", "modified": "2026-01-01", "body_length": 100}),
-        json.dumps({"id": "2", "title": "Note B", "modified": "2026-01-02", "body_length": 200}),
-    ]
-    stdout = "\n".join(notes_json) + "\n"
+    stdout = _records(
+        ("1", "Note A", "2026-01-01", "a" * 100),
+        ("2", "Note B", "2026-01-02", "b" * 200),
+    )
 
     def mock_run(cmd, **kwargs):
         return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
@@ -28,6 +41,36 @@ def mock_run(cmd, **kwargs):
     assert result[1]["body_length"] == 200
 
 
+def test_export_notes_quotes_and_newlines(monkeypatch, tmp_path):
+    import alchemia.channels.apple_notes as mod
+
+    monkeypatch.setattr(mod, "NOTES_OUTPUT_DIR", tmp_path / "notes")
+    body = 'line one\n\tline "two"\n'
+    stdout = _records(("1", 'The "quoted" title', "2026-01-01", body))
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kw: subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=""),
+    )
+
+    (note,) = export_alchemia_notes()
+    assert note["title"] == 'The "quoted" title'
+    assert note["body_length"] == len(body)
+    assert export_note_body('The "quoted" title') == body
+
+
+def test_export_notes_empty_folder(monkeypatch, tmp_path):
+    import alchemia.channels.apple_notes as mod
+
+    monkeypatch.setattr(mod, "NOTES_OUTPUT_DIR", tmp_path / "notes")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kw: subprocess.CompletedProcess(cmd, 0, stdout="\n", stderr=""),
+    )
+    assert export_alchemia_notes() == []
+
+
 def test_export_notes_no_folder(monkeypatch):
     def mock_run(cmd, **kwargs):
         return subprocess.CompletedProcess(
@@ -65,7 +108,8 @@ def mock_run(cmd, **kwargs):
 
 def test_export_note_body_success(monkeypatch):
     def mock_run(cmd, **kwargs):
-        return subprocess.CompletedProcess(cmd, 0, stdout="Note body text here", stderr="")
+        stdout = _records(("1", "Test Note", "2026-01-01", "Note body text here"))
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
 
     monkeypatch.setattr(subprocess, "run", mock_run)
 
@@ -73,6 +117,24 @@ def mock_run(cmd, **kwargs):
     assert result == "Note body text here"
 
 
+def test_export_note_body_uses_export_cache(monkeypatch, tmp_path):
+    import alchemia.channels.apple_notes as mod
+
+    monkeypatch.setattr(mod, "NOTES_OUTPUT_DIR", tmp_path / "notes")
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append(cmd)
+        stdout = _records(("1", "A", "2026-01-01", "body A"), ("2", "B", "2026-01-02", "body B"))
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    export_alchemia_notes()
+    assert [export_note_body("A"), export_note_body("B")] == ["body A", "body B"]
+    assert len(calls) == 1
+
+
 def test_export_note_body_timeout(monkeypatch):
     def mock_run(cmd, **kwargs):
         raise subprocess.TimeoutExpired(cmd, 15)
@@ -81,3 +143,26 @@ def mock_run(cmd, **kwargs):
 
     result = export_note_body("Test Note")
     assert result == ""
+
+
+def test_export_note_body_first_duplicate_title_wins(monkeypatch):
+    def mock_run(cmd, **kwargs):
+        stdout = _records(("1", "Dup", "2026-01-01", "first"), ("2", "Dup", "2026-01-02", "second"))
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    assert export_note_body("Dup") == "first"
+
+
+def test_export_note_body_unknown_title_exports_once(monkeypatch):
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append(cmd)
+        stdout = _records(("1", "A", "2026-01-01", "body A"))
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    assert [export_note_body("Nope"), export_note_body("Nope")] == ["", ""]
+    assert export_note_body("A") == "body A"
+    assert len(calls) == 1
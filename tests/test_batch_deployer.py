@@ -1,7 +1,11 @@
 """Tests for alchemize/batch_deployer.py — batch deployment via GitHub API."""
 
+import base64
+import json
+import subprocess
 from unittest.mock import patch
 
+from alchemia.alchemize import batch_deployer, github_client
 from alchemia.alchemize.batch_deployer import (
     build_deployment_manifest,
     deploy_repo_batch,
@@ -84,3 +88,120 @@ def test_deploy_repo_batch_source_not_found(mock_exists, mock_branch, mock_archi
     ]
     result = deploy_repo_batch("org", "repo", files)
     assert result["failed"] == 1
+
+
+def _fake_git_api(calls, existing_paths=(), empty=False):
+    """Stand-in for `gh api` answering the Git Data API endpoints."""
+
+    def run(cmd, **kwargs):
+        method, endpoint = cmd[3], cmd[4]
+        payload = json.loads(kwargs["input"]) if kwargs.get("input") else None
+        calls.append((method, endpoint, payload))
+        if empty and "/git/ref/heads/" in endpoint:
+            stderr = "gh: Git Repository is empty. (HTTP 409)"
+            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr=stderr)
+        if "/git/ref/heads/" in endpoint:
+            body = {"object": {"sha": "head-commit"}}
+        elif "/git/commits/" in endpoint:
+            body = {"tree": {"sha": "head-tree"}}
+        elif "/git/trees/" in endpoint:
+            body = {"tree": [{"path": p, "type": "blob"} for p in existing_paths]}
+        elif endpoint.endswith("/git/blobs"):
+            body = {"sha": f"blob-{len(calls)}"}
+        elif endpoint.endswith("/git/trees"):
+            body = {"sha": "new-tree"}
+        elif endpoint.endswith("/git/commits"):
+            body = {"sha": "new-commit"}
+        else:
+            body = {}
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(body), stderr="")
+
+    return run
+
+
+@patch("alchemia.alchemize.batch_deployer.is_repo_archived", return_value=False)
+@patch("alchemia.alchemize.batch_deployer.get_default_branch", return_value="main")
+def test_deploy_repo_batch_single_commit(mock_branch, mock_archived, tmp_path, monkeypatch):
+    files = []
+    for name in ("a.md", "b.md", "c.md"):
+        (tmp_path / name).write_text(name)
+        files.append({"source": str(tmp_path / name), "target": f"docs/{name}", "filename": name})
+
+    calls = []
+    monkeypatch.setattr(github_client, "get_token", lambda: None)
+    monkeypatch.setattr(subprocess, "run", _fake_git_api(calls, existing_paths=["docs/c.md"]))
+    result = deploy_repo_batch("org", "repo", files)
+
+    assert result["deployed"] == 2
+    assert result["skipped"] == 1
+    posts = [c for c in calls if c[0] == "POST"]
+    assert sum(c[1].endswith("/git/blobs") for c in posts) == 2
+    assert sum(c[1].endswith("/git/commits") for c in posts) == 1
+    tree_post = next(c for c in posts if c[1].endswith("/git/trees"))
+    assert tree_post[2]["base_tree"] == "head-tree"
+    assert calls[-1] == ("PATCH", "/repos/org/repo/git/refs/heads/main", {"sha": "new-commit"})
+
+
+@patch("alchemia.alchemize.batch_deployer.is_repo_archived", return_value=False)
+@patch("alchemia.alchemize.batch_deployer.get_default_branch", return_value="main")
+def test_deploy_repo_batch_empty_repo(mock_branch, mock_archived, tmp_path, monkeypatch):
+    (tmp_path / "a.md").write_text("a")
+    files = [{"source": str(tmp_path / "a.md"), "target": "docs/a.md", "filename": "a.md"}]
+
+    calls = []
+    monkeypatch.setattr(github_client, "get_token", lambda: None)
+    monkeypatch.setattr(subprocess, "run", _fake_git_api(calls, empty=True))
+    result = deploy_repo_batch("org", "repo", files)
+
+    assert result["deployed"] == 1
+    assert result["errors"] == []
+    # No existence checks or tree listing against a repo with no commits
+    assert not any("/contents/" in c[1] or "/git/trees/" in c[1] for c in calls)
+    tree_post = next(c for c in calls if c[1].endswith("/git/trees"))
+    assert "base_tree" not in tree_post[2]
+    commit_post = next(c for c in calls if c[1].endswith("/git/commits"))
+    assert commit_post[2]["parents"] == []
+    assert calls[-1] == (
+        "POST",
+        "/repos/org/repo/git/refs",
+        {"ref": "refs/heads/main", "sha": "new-commit"},
+    )
+
+
+def test_upload_one_refuses_oversized_file(tmp_path, monkeypatch):
+    source = tmp_path / "big.pdf"
+    source.write_bytes(b"x" * 10)
+    monkeypatch.setattr(batch_deployer, "MAX_BLOB_BYTES", 5)
+    info = {"source": str(source), "target": "docs/big.pdf", "filename": "big.pdf"}
+    outcome, entry, err = batch_deployer._upload_one("org", "repo", info, set(), force=False)
+    assert outcome == "failed"
+    assert entry is None
+    assert "exceeds" in err
+
+
+def test_upload_one_sends_file_content(tmp_path, monkeypatch):
+    source = tmp_path / "large.pdf"
+    source.write_bytes(b"abc" * 100)
+    sent = []
+    monkeypatch.setattr(
+        batch_deployer,
+        "api",
+        lambda method, endpoint, payload=None: (sent.append(payload) or {"sha": "s1"}, None),
+    )
+    info = {"source": str(source), "target": "docs/large.pdf", "filename": "large.pdf"}
+    outcome, entry, _ = batch_deployer._upload_one("org", "repo", info, set(), force=False)
+    assert outcome == "uploaded"
+    assert entry["sha"] == "s1"
+    assert base64.b64decode(sent[0]["content"]) == b"abc" * 100
+
+
+def test_check_file_exists_quotes_path(monkeypatch):
+    endpoints = []
+
+    def mock_api(method, endpoint, payload=None):
+        endpoints.append(endpoint)
+        return {"sha": "abc"}, None
+
+    monkeypatch.setattr(batch_deployer, "api", mock_api)
+    assert batch_deployer.check_file_exists("org", "repo", "docs/my café.md")
+    assert endpoints == ["/repos/org/repo/contents/docs/my%20caf%C3%A9.md"]
@@ -18,8 +18,6 @@ def test_parse_safari_missing_file(monkeypatch, tmp_path):
 
 
 def test_parse_safari_with_inspirations(monkeypatch, tmp_path):
-    import subprocess
-
     import alchemia.channels.bookmarks as mod
 
     # Build a plist tree with an Inspirations folder containing 2 bookmarks
@@ -43,19 +41,11 @@ def test_parse_safari_with_inspirations(monkeypatch, tmp_path):
             },
         ],
     }
-    xml_bytes = plistlib.dumps(plist_data, fmt=plistlib.FMT_XML)
-
-    # Make the file "exist"
+    # Safari writes Bookmarks.plist in binary format
     fake_plist = tmp_path / "Bookmarks.plist"
-    fake_plist.write_bytes(b"fake")
+    fake_plist.write_bytes(plistlib.dumps(plist_data, fmt=plistlib.FMT_BINARY))
     monkeypatch.setattr(mod, "SAFARI_BOOKMARKS", fake_plist)
 
-    # Mock subprocess.run to return the XML plist
-    def mock_run(cmd, **kwargs):
-        return subprocess.CompletedProcess(cmd, 0, stdout=xml_bytes, stderr=b"")
-
-    monkeypatch.setattr(subprocess, "run", mock_run)
-
     result = parse_safari_bookmarks()
     assert len(result) == 2
     assert all(r["source"] == "safari" for r in result)
@@ -63,8 +53,6 @@ def mock_run(cmd, **kwargs):
 
 
 def test_parse_safari_no_inspirations(monkeypatch, tmp_path):
-    import subprocess
-
     import alchemia.channels.bookmarks as mod
 
     plist_data = {
@@ -82,21 +70,23 @@ def test_parse_safari_no_inspirations(monkeypatch, tmp_path):
             },
         ],
     }
-    xml_bytes = plistlib.dumps(plist_data, fmt=plistlib.FMT_XML)
-
     fake_plist = tmp_path / "Bookmarks.plist"
-    fake_plist.write_bytes(b"fake")
+    fake_plist.write_bytes(plistlib.dumps(plist_data, fmt=plistlib.FMT_XML))
     monkeypatch.setattr(mod, "SAFARI_BOOKMARKS", fake_plist)
 
-    def mock_run(cmd, **kwargs):
-        return subprocess.CompletedProcess(cmd, 0, stdout=xml_bytes, stderr=b"")
-
-    monkeypatch.setattr(subprocess, "run", mock_run)
-
     result = parse_safari_bookmarks()
     assert result == []
 
 
+def test_parse_safari_invalid_plist(monkeypatch, tmp_path):
+    import alchemia.channels.bookmarks as mod
+
+    fake_plist = tmp_path / "Bookmarks.plist"
+    fake_plist.write_bytes(b"fake")
+    monkeypatch.setattr(mod, "SAFARI_BOOKMARKS", fake_plist)
+    assert parse_safari_bookmarks() == []
+
+
 def test_parse_chrome_missing_file(monkeypatch, tmp_path):
     import alchemia.channels.bookmarks as mod
 
@@ -164,3 +154,54 @@ def test_sync_bookmarks_combines_sources(monkeypatch):
 
     result = sync_bookmarks()
     assert len(result) == 2
+
+
+def test_walk_chrome_tree_nested_inspirations_in_order():
+    from alchemia.channels.bookmarks import _walk_chrome_tree
+
+    def url(name):
+        return {"name": name, "type": "url", "url": f"https://{name}.example.com"}
+
+    root = {
+        "name": "Bar",
+        "type": "folder",
+        "children": [
+            url("outside"),
+            {
+                "name": "Work",
+                "type": "folder",
+                "children": [
+                    {
+                        "name": "Inspirations",
+                        "type": "folder",
+                        "children": [
+                            url("first"),
+                            {"name": "Sub", "type": "folder", "children": [url("second")]},
+                            url("third"),
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    results = []
+    _walk_chrome_tree(root, [], results)
+    assert [r["title"] for r in results] == ["first", "second", "third"]
+    assert results[1]["folder_path"] == "Bar/Work/Inspirations/Sub"
+
+
+def test_walk_safari_tree_deep_nesting_does_not_recurse():
+    from alchemia.channels.bookmarks import _walk_safari_tree
+
+    leaf = {
+        "WebBookmarkType": "WebBookmarkTypeLeaf",
+        "URLString": "https://deep.example.com",
+        "URIDictionary": {"title": "Deep"},
+    }
+    node = {"WebBookmarkType": "WebBookmarkTypeList", "Title": "Inspirations", "Children": [leaf]}
+    for i in range(5000):
+        node = {"WebBookmarkType": "WebBookmarkTypeList", "Title": f"f{i}", "Children": [node]}
+
+    results = []
+    _walk_safari_tree([node], [], results)
+    assert [r["url"] for r in results] == ["https://deep.example.com"]
@@ -1,8 +1,13 @@
 """Tests for absorb/classifier.py — 7-rule priority chain classification."""
 
+import alchemia.absorb.classifier as classifier_mod
 from alchemia.absorb.classifier import (
     _get_toplevel_dir,
+    _keyword_scores,
+    _read_first_lines,
     _subdir_for_ext,
+    build_classifier,
+    build_toplevel_dispatch,
     classify_all,
     classify_entry,
 )
@@ -26,6 +31,15 @@ def _mock_registry():
     }
 
 
+def test_classification_serializes_as_object():
+    import json
+
+    entry = {"path": "/Users/x/Workspace/my-repo/docs/file.md", "extension": ".md"}
+    data = json.loads(json.dumps(classify_entry(entry, _mock_registry())))
+    assert data["rule_name"] == "direct_repo_match"
+    assert data["target_subdir"] == "docs/source-materials/theory/"
+
+
 def test_rule1_direct_repo_match():
     entry = {"path": "/Users/x/Workspace/my-repo/docs/file.md", "extension": ".md"}
     result = classify_entry(entry, _mock_registry())
@@ -62,6 +76,69 @@ def test_rule3b_dir_to_organ():
     assert result["target_organ"] == "ORGAN-IV"
 
 
+def test_toplevel_dispatch_prefers_direct_repo_match():
+    from alchemia.absorb.name_variants import DIR_TO_ORGAN
+
+    shadowed = next(iter(DIR_TO_ORGAN))
+    by_name = {shadowed: {"name": shadowed, "organ": "ORGAN-V", "org": "organvm-v-logos"}}
+    dispatch = build_toplevel_dispatch(by_name)
+    assert dispatch[shadowed][:2] == (1, "direct_repo_match")
+
+
+def test_org_to_organ_matches_keyword_orgs():
+    from alchemia.absorb.name_variants import ORG_TO_ORGAN
+
+    expected = {info["org"]: organ for organ, info in classifier_mod.ORGAN_KEYWORDS.items()}
+    assert expected == ORG_TO_ORGAN
+
+
+def test_classify_entry_uses_prebuilt_dispatch():
+    registry = _mock_registry()
+    registry["toplevel_dispatch"] = build_toplevel_dispatch(registry["by_name"])
+    entry = {"path": "/Users/x/Workspace/my-repo/notes.py", "extension": ".py"}
+    result = classify_entry(entry, registry)
+    assert result["rule"] == 1
+    assert result["target_subdir"] == "docs/source-materials/prototypes/"
+
+
+def test_classify_all_builds_classifier_once(monkeypatch):
+    import pickle
+
+    registry = _mock_registry()
+    builds = []
+    real_build = classifier_mod.build_toplevel_dispatch
+    monkeypatch.setattr(
+        classifier_mod,
+        "build_toplevel_dispatch",
+        lambda by_name: builds.append(1) or real_build(by_name),
+    )
+    entries = [
+        {"path": f"/Users/x/Workspace/my-repo/{name}", "extension": ".py"}
+        for name in ("a.py", "b.md", "c.txt")
+    ]
+    before = set(registry)
+    classify_all(entries, registry)
+    assert len(builds) == 1
+    # Nothing is cached on the caller's registry, so it stays plain data
+    assert set(registry) == before
+    pickle.dumps(registry)
+
+
+def test_target_subdir_is_shared_per_extension():
+    registry = _mock_registry()
+    a = classify_entry({"path": "/Users/x/Workspace/my-repo/a.py", "extension": ".py"}, registry)
+    b = classify_entry({"path": "/Users/x/Workspace/my-repo/b.py", "extension": ".py"}, registry)
+    assert a["target_subdir"] == "docs/source-materials/prototypes/"
+    assert a["target_subdir"] is b["target_subdir"]
+
+
+def test_build_classifier_defers_content_rules():
+    classify = build_classifier(_mock_registry())
+    hit = classify({"path": "/Users/x/Workspace/my-repo/a.md", "extension": ".md"})
+    assert (hit.rule, hit.target_repo) == (1, "my-repo")
+    assert classify({"path": "/Users/x/Workspace/unknown/a.md", "extension": ".md"}) is None
+
+
 def test_rule4_process_container():
     entry = {
         "path": "/Users/x/Workspace/intake/processCONTAINER/file.yaml",
@@ -86,6 +163,16 @@ def test_rule4_insort():
     assert result["target_organ"] == "ORGAN-I"
 
 
+def test_rule4_marker_priority_ignores_position():
+    entry = {
+        "path": "/Users/x/Workspace/intake/inSORT/processCONTAINER/file.json",
+        "relative_path": "inSORT/processCONTAINER/file.json",
+        "extension": ".json",
+    }
+    result = classify_entry(entry, _mock_registry())
+    assert result["rule_name"] == "process_container"
+
+
 def test_rule5_manifest_category():
     entry = {
         "path": "/Users/x/Workspace/unknown-dir/spec.md",
@@ -98,6 +185,17 @@ def test_rule5_manifest_category():
     assert result["target_organ"] == "ORGAN-I"
 
 
+def test_rule5_category_with_suffix_and_case():
+    entry = {
+        "path": "/Users/x/Workspace/random/b.pdf",
+        "extension": ".pdf",
+        "manifest": {"manifest_category": "  Creative & Artistic (drafts) "},
+    }
+    result = classify_entry(entry, _mock_registry())
+    assert result["rule"] == 5
+    assert result["target_organ"] == "ORGAN-II"
+
+
 def test_rule6_content_keyword(tmp_path):
     # Create a file with enough organ-I keywords
     f = tmp_path / "theory.md"
@@ -127,6 +225,15 @@ def test_rule6_insufficient_keywords(tmp_path):
     assert result["rule"] == 7  # Falls through to unresolved
 
 
+def test_keyword_scores_match_fallback(monkeypatch):
+    content = "epistemology and recursive ontology; a saas product with pricing and pricing"
+    scores = _keyword_scores(content)
+    monkeypatch.setattr(classifier_mod, "_KEYWORD_AUTOMATON", None)
+    assert _keyword_scores(content) == scores
+    assert scores["ORGAN-I"] == 3
+    assert scores["ORGAN-III"] == 3  # repeated keywords count once
+
+
 def test_rule7_unresolved():
     entry = {
         "path": "/Users/x/Workspace/random-place/file.pdf",
@@ -154,6 +261,64 @@ def test_classify_all_adds_classification():
     assert all("classification" in e for e in result)
 
 
+def test_classify_all_prints_summary(capsys):
+    classify_all(
+        [{"path": "/Users/x/Workspace/my-repo/a.md", "extension": ".md"}],
+        _mock_registry(),
+    )
+    out = capsys.readouterr().out
+    assert "    Rule 1 (direct_repo_match): 1\n" in out
+    assert out.endswith("  Classified: 1/1 (100.0%)\n  Pending review: 0\n")
+
+
+def test_classify_all_parallel_matches_serial(tmp_path, monkeypatch):
+    entries = []
+    for i in range(4):
+        f = tmp_path / f"note{i}.md"
+        f.write_text("Pricing and revenue for the SaaS product." if i % 2 else "nothing here")
+        entries.append({"path": str(f), "extension": ".md"})
+    serial = [classify_entry(e, _mock_registry()) for e in entries]
+
+    monkeypatch.setattr(classifier_mod, "PARALLEL_CONTENT_THRESHOLD", 1)
+    result = classify_all(entries, _mock_registry())
+    assert [e["classification"] for e in result] == serial
+    assert serial[1]["rule"] == 6
+
+
+def test_read_first_lines_limits_and_lowercases(tmp_path):
+    f = tmp_path / "head.md"
+    f.write_text("Line ONE\nline two\nline three\n")
+    assert _read_first_lines(str(f), n=2) == "line one\nline two"
+
+
+def test_read_first_lines_rereads_after_modification(tmp_path):
+    import os
+
+    f = tmp_path / "changing.md"
+    f.write_text("first version")
+    assert _read_first_lines(str(f)) == "first version"
+    f.write_text("second version")
+    os.utime(f, ns=(f.stat().st_atime_ns, f.stat().st_mtime_ns + 1_000_000_000))
+    assert _read_first_lines(str(f)) == "second version"
+
+
+def test_read_first_lines_keeps_non_ascii_boundaries(tmp_path):
+    f = tmp_path / "accents.md"
+    f.write_text("Ontología and RITUAL\n", encoding="utf-8")
+    assert _read_first_lines(str(f)) == "ontología and ritual\n"
+
+    # Dropping the dash or the invalid byte would glue these into "saas" and "b2b"
+    g = tmp_path / "dashes.md"
+    g.write_bytes("sa—as b2".encode() + b"\xffb\n")
+    content = _read_first_lines(str(g))
+    assert content == "sa—as b2\ufffdb\n"
+    assert _keyword_scores(content)["ORGAN-III"] == 0
+
+
+def test_read_first_lines_missing_file(tmp_path):
+    assert _read_first_lines(str(tmp_path / "nope.md")) == ""
+
+
 def test_subdir_for_ext_md():
     assert _subdir_for_ext(".md") == "theory"
 
@@ -169,3 +334,9 @@ def test_subdir_for_ext_unknown():
 def test_get_toplevel_dir():
     entry = {"path": "/Users/x/Workspace/my-repo/sub/file.py"}
     assert _get_toplevel_dir(entry) == "my-repo"
+
+
+def test_get_toplevel_dir_relative_and_missing():
+    assert _get_toplevel_dir({"path": "Workspace/my-repo/a.md"}) == "my-repo"
+    assert _get_toplevel_dir({"path": "/Users/x/Workspace/loose.md"}) == "loose.md"
+    assert _get_toplevel_dir({"path": "/Users/x/Documents/a.md"}) == ""
@@ -0,0 +1,26 @@
+"""Tests for cmd_intake in cli.py — inventory output path."""
+
+from argparse import Namespace
+
+from alchemia.cli import cmd_intake
+
+
+def _run_intake(tmp_path, output):
+    source = tmp_path / "source"
+    source.mkdir(exist_ok=True)
+    (source / "note.md").write_text("# note")
+    cmd_intake(Namespace(source_dir=[str(source)], output=str(output), manifest=None))
+
+
+def test_cmd_intake_writes_requested_jsonl_path(tmp_path, capsys):
+    _run_intake(tmp_path, tmp_path / "inv.jsonl")
+    assert (tmp_path / "inv.jsonl").exists()
+    assert (tmp_path / "inv.header.json").exists()
+    assert "WARNING" not in capsys.readouterr().out
+
+
+def test_cmd_intake_warns_when_suffix_changes(tmp_path, capsys):
+    _run_intake(tmp_path, tmp_path / "inv.json")
+    assert (tmp_path / "inv.jsonl").exists()
+    out = capsys.readouterr().out
+    assert f"WARNING: inventories are NDJSON; writing {tmp_path / 'inv.jsonl'}" in out
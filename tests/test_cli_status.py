@@ -0,0 +1,37 @@
+"""Tests for cmd_status in cli.py — pipeline artifact summary."""
+
+import json
+from argparse import Namespace
+
+from alchemia.cli import cmd_status
+
+
+def test_cmd_status_counts_inventory_without_header(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "intake-inventory.jsonl").write_text('{"path": "a"}\n{"path": "b"}\n\n')
+    cmd_status(Namespace())
+    out = capsys.readouterr().out
+    assert "intake-inventory.jsonl: 2 entries" in out
+    assert "absorb-mapping.json: not found" in out
+
+
+def test_cmd_status_reads_inventory_header(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "intake-inventory.jsonl").write_text("")
+    (data_dir / "intake-inventory.header.json").write_text(json.dumps({"total_files": 7}))
+    cmd_status(Namespace())
+    assert "intake-inventory.jsonl: 7 entries" in capsys.readouterr().out
+
+
+def test_cmd_status_reports_legacy_inventory(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "intake-inventory.json").write_text(json.dumps({"total_files": 3, "entries": []}))
+    cmd_status(Namespace())
+    out = capsys.readouterr().out
+    assert "intake-inventory.json: 3 entries (legacy JSON" in out
@@ -13,6 +13,35 @@ def test_sha256_file(tmp_path):
     assert sha256_file(f) == expected
 
 
+def test_sha256_file_spans_read_buffers(tmp_path):
+    # Below MMAP_HASH_THRESHOLD but larger than file_digest's internal read buffer
+    data = bytes(range(256)) * 1200
+    f = tmp_path / "big.bin"
+    f.write_bytes(data)
+    assert sha256_file(f) == hashlib.sha256(data).hexdigest()
+
+
+def test_sha256_file_mapped_matches_read(tmp_path, monkeypatch):
+    from alchemia.intake import crawler
+
+    monkeypatch.setattr(crawler, "MMAP_HASH_THRESHOLD", 16)
+    data = bytes(range(256)) * 4
+    f = tmp_path / "big.bin"
+    f.write_bytes(data)
+    (tmp_path / "small.bin").write_bytes(data[:16])
+    assert sha256_file(f) == hashlib.sha256(data).hexdigest()
+    assert sha256_file(tmp_path / "small.bin") == hashlib.sha256(data[:16]).hexdigest()
+
+
+def test_sha256_file_without_fadvise(tmp_path, monkeypatch):
+    from alchemia.intake import crawler
+
+    monkeypatch.setattr(crawler, "_FADVISE", False)
+    f = tmp_path / "data.bin"
+    f.write_bytes(b"abc")
+    assert sha256_file(f) == hashlib.sha256(b"abc").hexdigest()
+
+
 def test_sha256_file_unreadable(tmp_path, monkeypatch):
     f = tmp_path / "locked.txt"
     f.write_text("data")
@@ -77,3 +106,59 @@ def test_crawl_skips_ds_store(tmp_path):
 def test_crawl_nonexistent_dir(tmp_path):
     result = crawl([tmp_path / "nope"])
     assert result == []
+
+
+def test_windowed_map_bounds_submissions():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from alchemia.intake import crawler
+
+    submitted = []
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        real_submit = ex.submit
+        ex.submit = lambda fn, item: submitted.append(item) or real_submit(fn, item)
+        results = crawler._windowed_map(ex, lambda x: x * 10, range(5), 2)
+        assert next(results) == 0
+        # First result consumed: the window of 2 has been refilled once
+        assert submitted == [0, 1, 2]
+        assert list(results) == [10, 20, 30, 40]
+
+
+def test_crawl_overlapping_dirs_in_parallel(tmp_path):
+    one = tmp_path / "one"
+    sub = one / "sub"
+    other = tmp_path / "two"
+    sub.mkdir(parents=True)
+    other.mkdir()
+    (one / "a.txt").write_text("a")
+    (sub / "b.txt").write_text("b")
+    (other / "c.txt").write_text("c")
+
+    result = crawl([one, sub, other], max_workers=3)
+    assert [e["filename"] for e in result] == ["a.txt", "b.txt", "c.txt"]
+    # b.txt is reported under the first source dir that reaches it
+    assert result[1]["source_dir"] == str(one.resolve())
+    assert crawl([one, sub, other], max_workers=1) == result
+
+
+def test_crawl_entry_fields_and_symlinks(tmp_path):
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (nested / "pack.tar.gz").write_bytes(b"x")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "skip.txt").write_text("s")
+    (tmp_path / "link.txt").symlink_to(nested / "pack.tar.gz")
+
+    [entry] = crawl([tmp_path], max_workers=1)
+    assert entry["relative_path"] == str(Path("a", "b", "pack.tar.gz"))
+    assert entry["depth"] == 2
+    assert entry["parent_dir"] == "b"
+    assert entry["extension"] == ".gz"
+    assert entry["mime_type"] == "application/x-tar"
+    assert entry == file_metadata(nested / "pack.tar.gz", tmp_path.resolve())
+
+
+def test_crawl_reports_hard_links_once(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").hardlink_to(tmp_path / "a.txt")
+    assert len(crawl([tmp_path], max_workers=1)) == 1
@@ -3,6 +3,9 @@
 import json
 import subprocess
 
+import pytest
+
+from alchemia.alchemize import deployer, github_client
 from alchemia.alchemize.deployer import (
     deploy_file,
     get_default_branch,
@@ -12,6 +15,14 @@
 )
 
 
+@pytest.fixture(autouse=True)
+def _no_token(monkeypatch):
+    """Force the gh CLI transport so subprocess mocks see every call."""
+    monkeypatch.setattr(github_client, "get_token", lambda: None)
+    deployer._repo_meta.cache_clear()
+    deployer.is_branch_protected.cache_clear()
+
+
 def _mock_subprocess(monkeypatch, returncode=0, stdout="", stderr=""):
     def mock_run(cmd, **kwargs):
         return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr=stderr)
@@ -93,3 +104,73 @@ def test_deploy_file_source_missing(tmp_path):
     source = tmp_path / "nonexistent.md"
     result = deploy_file("org", "repo", "docs/file.md", source)
     assert result["status"] == "error"
+
+
+def test_gh_api_uses_http_client_with_token(monkeypatch):
+    monkeypatch.setattr(github_client, "get_token", lambda: "tok")
+    calls = []
+
+    def mock_api(method, endpoint, payload=None):
+        calls.append((method, endpoint, payload))
+        return {"default_branch": "trunk"}, None
+
+    monkeypatch.setattr(github_client, "api", mock_api)
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: pytest.fail("spawned gh"))
+    assert get_default_branch("org", "repo") == "trunk"
+    assert calls == [("GET", "/repos/org/repo", None)]
+
+
+@pytest.mark.parametrize(
+    ("path", "quoted"),
+    [("docs/my file.md", "docs/my%20file.md"), ("docs/café.md", "docs/caf%C3%A9.md")],
+)
+def test_contents_paths_are_percent_encoded(monkeypatch, path, quoted):
+    monkeypatch.setattr(github_client, "get_token", lambda: "tok")
+    endpoints = []
+
+    def mock_api(method, endpoint, payload=None):
+        endpoints.append((method, endpoint))
+        return ({"sha": "abc"}, None) if method == "GET" else ({}, None)
+
+    monkeypatch.setattr(github_client, "api", mock_api)
+    assert get_file_sha("org", "repo", path) == "abc"
+    assert deployer.put_file("org", "repo", path, b"x", "msg", force=True)
+    expected = f"/repos/org/repo/contents/{quoted}"
+    assert endpoints == [("GET", expected), ("GET", expected), ("PUT", expected)]
+
+
+def test_put_file_retries_branch_conflict(monkeypatch):
+    attempts = []
+
+    def mock_api(method, endpoint, payload=None):
+        attempts.append(method)
+        if attempts.count("PUT") == 1:
+            return None, "HTTP 409: is at abc but expected def"
+        return {}, None
+
+    monkeypatch.setattr(github_client, "api", mock_api)
+    monkeypatch.setattr(deployer, "get_file_sha", lambda *a: None)
+    monkeypatch.setattr("alchemia.alchemize.deployer.time.sleep", lambda s: None)
+    assert deployer.put_file("org", "repo", "docs/a.md", b"a", "msg")
+    assert attempts == ["PUT", "PUT"]
+
+
+def test_repo_metadata_fetched_once(monkeypatch):
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append(cmd)
+        body = {"default_branch": "develop", "archived": False}
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(body), stderr="")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    assert get_default_branch("org", "repo") == "develop"
+    assert is_archived("org", "repo") is False
+    assert len(calls) == 1
+
+
+def test_repo_metadata_failure_not_cached(monkeypatch):
+    _mock_subprocess(monkeypatch, returncode=1, stderr="boom")
+    assert get_default_branch("org", "repo") == "main"
+    _mock_subprocess(monkeypatch, stdout=json.dumps({"default_branch": "develop"}))
+    assert get_default_branch("org", "repo") == "develop"
@@ -0,0 +1,118 @@
+"""Tests for alchemize/github_client.py — keep-alive GitHub REST client."""
+
+import json
+import subprocess
+
+from alchemia.alchemize import github_client
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self._body = body
+        self._headers = headers or {}
+
+    def read(self):
+        return self._body
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+
+class FakeConnection:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, endpoint, body=None, headers=None):
+        self.requests.append((method, endpoint, body, headers))
+
+    def getresponse(self):
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+def _use_connection(monkeypatch, conn):
+    monkeypatch.setattr(github_client, "get_token", lambda: "tok")
+    monkeypatch.setattr(github_client, "_connection", lambda: conn)
+
+
+def test_api_reuses_connection(monkeypatch):
+    conn = FakeConnection(
+        [FakeResponse(200, b'{"archived": false}'), FakeResponse(200, b'{"sha": "abc"}')],
+    )
+    _use_connection(monkeypatch, conn)
+    assert github_client.api("GET", "/repos/o/r") == ({"archived": False}, None)
+    assert github_client.api("POST", "/repos/o/r/git/blobs", {"content": "x"}) == (
+        {"sha": "abc"},
+        None,
+    )
+    assert len(conn.requests) == 2
+    method, _endpoint, body, headers = conn.requests[1]
+    assert method == "POST"
+    assert json.loads(body) == {"content": "x"}
+    assert headers["Authorization"] == "Bearer tok"
+
+
+def test_api_http_error(monkeypatch):
+    _use_connection(monkeypatch, FakeConnection([FakeResponse(404, b'{"message": "Not Found"}')]))
+    data, err = github_client.api("GET", "/repos/o/r/contents/nope")
+    assert data is None
+    assert err == "HTTP 404: Not Found"
+
+
+def test_api_retries_secondary_rate_limit(monkeypatch):
+    conn = FakeConnection(
+        [
+            FakeResponse(429, b'{"message": "slow down"}', {"Retry-After": "2"}),
+            FakeResponse(200, b'{"sha": "abc"}'),
+        ],
+    )
+    _use_connection(monkeypatch, conn)
+    waits = []
+    monkeypatch.setattr(github_client.time, "sleep", waits.append)
+    assert github_client.api("POST", "/repos/o/r/git/blobs", {}) == ({"sha": "abc"}, None)
+    assert waits == [2.0]
+
+
+def test_api_waits_when_budget_nearly_spent(monkeypatch):
+    reset = str(int(github_client.time.time()) + 30)
+    low = {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": reset}
+    conn = FakeConnection([FakeResponse(200, b"{}", low), FakeResponse(200, b"{}")])
+    _use_connection(monkeypatch, conn)
+    monkeypatch.setattr(github_client, "_rate_state", {"remaining": None, "reset": 0.0})
+    waits = []
+    monkeypatch.setattr(github_client.time, "sleep", waits.append)
+    github_client.api("GET", "/repos/o/r")
+    assert waits == []
+    github_client.api("GET", "/repos/o/r")
+    assert len(waits) == 1
+    assert 0 < waits[0] <= 30
+
+
+def test_api_empty_body(monkeypatch):
+    _use_connection(monkeypatch, FakeConnection([FakeResponse(204, b"")]))
+    assert github_client.api("DELETE", "/repos/o/r/x") == ({}, None)
+
+
+def test_api_falls_back_to_gh_cli(monkeypatch):
+    monkeypatch.setattr(github_client, "get_token", lambda: None)
+
+    def mock_run(cmd, **kwargs):
+        assert cmd[:2] == ["gh", "api"]
+        return subprocess.CompletedProcess(cmd, 0, stdout='{"default_branch": "dev"}', stderr="")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    assert github_client.api("GET", "/repos/o/r") == ({"default_branch": "dev"}, None)
+
+
+def test_api_reports_unencodable_endpoint(monkeypatch):
+    # A real connection rejects these while building the request line, before connecting
+    monkeypatch.setattr(github_client, "get_token", lambda: "tok")
+    monkeypatch.setattr(github_client, "_local", github_client.threading.local())
+    for endpoint in ("/repos/o/r/contents/my file.md", "/repos/o/r/contents/café.md"):
+        result, err = github_client.api("GET", endpoint)
+        assert result is None
+        assert err.startswith("invalid request")
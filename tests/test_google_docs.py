@@ -12,6 +12,16 @@
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_state(monkeypatch, tmp_path):
+    from alchemia.channels import google_docs
+
+    monkeypatch.setattr(google_docs, "_folder_ids", {})
+    monkeypatch.setattr(google_docs, "CONFIG_DIR", tmp_path / "config")
+    monkeypatch.setattr(google_docs, "LAST_SYNC_PATH", tmp_path / "config" / "last_sync.json")
+    monkeypatch.setattr(google_docs, "FOLDER_CACHE_PATH", tmp_path / "config" / "folder_cache.json")
+
+
 def test_sanitize_filename():
     assert _sanitize_filename("hello world") == "hello world"
     assert _sanitize_filename("file:name") == "file-name"
@@ -42,6 +52,19 @@ def test_get_status_without_deps():
         assert status["doc_count"] == 0
 
 
+def test_check_dependencies_probes_once(monkeypatch):
+    import sys
+
+    from alchemia.channels.google_docs import _check_dependencies
+
+    _check_dependencies.cache_clear()
+    monkeypatch.setitem(sys.modules, "googleapiclient", None)
+    assert _check_dependencies() is False
+    monkeypatch.delitem(sys.modules, "googleapiclient")
+    assert _check_dependencies() is False  # cached, not re-imported
+    _check_dependencies.cache_clear()
+
+
 def test_list_docs_honors_folder_name(monkeypatch: pytest.MonkeyPatch):
     class FakeFilesAPI:
         def __init__(self) -> None:
@@ -51,7 +74,7 @@ def list(self, **kwargs):
             self.calls.append(kwargs)
             return self
 
-        def execute(self):
+        def execute(self, num_retries=0):
             if len(self.calls) == 1:
                 return {"files": [{"id": "folder-1", "name": "Custom Folder"}]}
             return {"files": []}
@@ -71,3 +94,481 @@ def files(self):
 
     assert service.api.calls
     assert service.api.calls[0]["q"].startswith("name = 'Custom Folder'")
+
+
+class FakeCreds:
+    def __init__(self, expired=False):
+        self.expired = expired
+        self.expiry = None
+        self.refresh_token = "refresh"
+        self.refreshed = 0
+
+    @property
+    def valid(self):
+        return not self.expired
+
+    def refresh(self, request):
+        self.refreshed += 1
+        self.expired = False
+
+    def to_json(self):
+        return "{}"
+
+
+@pytest.fixture
+def fake_google(monkeypatch, tmp_path):
+    """Install stand-in google modules and an empty client cache."""
+    import sys
+    import types
+
+    from alchemia.channels import google_docs
+
+    loads = []
+
+    class Credentials:
+        @classmethod
+        def from_authorized_user_file(cls, path, scopes):
+            loads.append(path)
+            return FakeCreds(expired=True)
+
+    builds = []
+
+    def build(name, version, credentials, static_discovery):
+        builds.append((name, version, static_discovery))
+        return object()
+
+    modules = {
+        "google.auth.transport.requests": {"Request": lambda: None},
+        "google.oauth2.credentials": {"Credentials": Credentials},
+        "googleapiclient.discovery": {"build": build},
+    }
+    for name, attrs in modules.items():
+        module = types.ModuleType(name)
+        for attr, value in attrs.items():
+            setattr(module, attr, value)
+        monkeypatch.setitem(sys.modules, name, module)
+
+    token = tmp_path / "google_token.json"
+    token.write_text("{}")
+    monkeypatch.setattr(google_docs, "TOKEN_PATH", token)
+    monkeypatch.setattr(google_docs, "_check_dependencies", lambda: True)
+    monkeypatch.setattr(google_docs, "_client_cache", {})
+    return loads, builds
+
+
+def test_credentials_loaded_once_and_refreshed_in_place(fake_google):
+    from alchemia.channels import google_docs
+
+    loads, _ = fake_google
+    creds = google_docs._get_credentials()
+    assert creds.valid
+    assert creds.refreshed == 1
+
+    creds.expired = True
+    assert google_docs._get_credentials() is creds
+    assert creds.refreshed == 2
+    assert len(loads) == 1
+
+
+def test_credentials_refreshed_before_expiry(fake_google):
+    from datetime import datetime, timedelta, timezone
+
+    from alchemia.channels import google_docs
+
+    creds = google_docs._get_credentials()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    creds.expiry = now + timedelta(minutes=30)
+    google_docs._get_credentials()
+    assert creds.refreshed == 1
+
+    creds.expiry = now + timedelta(seconds=google_docs.TOKEN_REFRESH_SKEW / 2)
+    google_docs._get_credentials()
+    assert creds.refreshed == 2
+
+
+def test_build_service_reuses_client(fake_google):
+    from alchemia.channels import google_docs
+
+    _, builds = fake_google
+    first = google_docs._build_service()
+    assert google_docs._build_service() is first
+    assert builds == [("drive", "v3", True)]
+
+
+class CountingFilesAPI:
+    """files() stand-in: the first list() call is the folder lookup."""
+
+    def __init__(self, folder_files, doc_files=()):
+        self.queries = []
+        self.folder_files = folder_files
+        self.doc_files = list(doc_files)
+
+    def list(self, **kwargs):
+        self.queries.append(kwargs["q"])
+        self.fields = kwargs["fields"]
+        return self
+
+    def execute(self, num_retries=0):
+        self.num_retries = num_retries
+        if "mimeType = 'application/vnd.google-apps.folder'" in self.queries[-1]:
+            return {"files": self.folder_files}
+        return {"files": self.doc_files}
+
+
+class FakeDrive:
+    def __init__(self, api):
+        self.api = api
+
+    def files(self):
+        return self.api
+
+
+def test_find_folder_cached_until_ttl(monkeypatch):
+    from alchemia.channels import google_docs
+
+    api = CountingFilesAPI([{"id": "folder-1", "name": "Alchemia"}])
+    service = FakeDrive(api)
+    now = [1000.0]
+    monkeypatch.setattr(google_docs.time, "monotonic", lambda: now[0])
+
+    assert google_docs._find_alchemia_folder(service) == "folder-1"
+    assert google_docs._find_alchemia_folder(service) == "folder-1"
+    assert len(api.queries) == 1
+
+    now[0] += google_docs.FOLDER_ID_TTL
+    google_docs.FOLDER_CACHE_PATH.unlink()
+    google_docs._find_alchemia_folder(service)
+    assert len(api.queries) == 2
+
+
+def test_drive_calls_request_client_retries():
+    from alchemia.channels import google_docs
+
+    api = CountingFilesAPI([{"id": "folder-1", "name": "Alchemia"}])
+    google_docs._find_alchemia_folder(FakeDrive(api))
+    assert api.num_retries == google_docs.DRIVE_RETRIES
+
+
+def test_find_folder_warm_start_uses_disk_cache(monkeypatch):
+    from alchemia.channels import google_docs
+
+    api = CountingFilesAPI([{"id": "folder-1", "name": "Alchemia"}])
+    service = FakeDrive(api)
+    wall = [5000.0]
+    monkeypatch.setattr(google_docs.time, "time", lambda: wall[0])
+
+    assert google_docs._find_alchemia_folder(service) == "folder-1"
+    google_docs._folder_ids.clear()  # a new process
+    assert google_docs._find_alchemia_folder(service) == "folder-1"
+    assert len(api.queries) == 1
+
+    google_docs._folder_ids.clear()
+    wall[0] += google_docs.FOLDER_CACHE_TTL
+    google_docs._find_alchemia_folder(service)
+    assert len(api.queries) == 2
+
+    google_docs.clear_folder_cache()
+    assert not google_docs.FOLDER_CACHE_PATH.exists()
+    google_docs._find_alchemia_folder(service)
+    assert len(api.queries) == 3
+
+
+class FolderFilesAPI:
+    """files() stand-in listing docs per folder ID; IDs in errors raise like a 404."""
+
+    def __init__(self, folder_id, docs_by_folder, errors=()):
+        self.folder_id = folder_id
+        self.docs_by_folder = docs_by_folder
+        self.errors = set(errors)
+        self.queries = []
+
+    def list(self, **kwargs):
+        self.queries.append(kwargs["q"])
+        return self
+
+    def execute(self, num_retries=0):
+        query = self.queries[-1]
+        if "mimeType = 'application/vnd.google-apps.folder'" in query:
+            return {"files": [{"id": self.folder_id}]}
+        folder_id = query.split("'")[1]
+        if folder_id in self.errors:
+            raise RuntimeError("404 File not found")
+        return {"files": self.docs_by_folder.get(folder_id, [])}
+
+
+@pytest.mark.parametrize("errors", [(), ("old-id",)])
+def test_iter_docs_revalidates_stale_cached_folder(monkeypatch, errors):
+    from alchemia.channels import google_docs
+
+    google_docs._save_folder_id("Alchemia", "old-id")
+    api = FolderFilesAPI("new-id", {"new-id": [{"id": "d1"}]}, errors)
+    monkeypatch.setattr(google_docs, "_check_dependencies", lambda: True)
+    monkeypatch.setattr(google_docs, "_build_service", lambda: FakeDrive(api))
+
+    docs = list(google_docs.iter_docs(modified_after="2026-01-01T00:00:00Z"))
+
+    assert [d["id"] for d in docs] == ["d1"]
+    assert google_docs._cached_folder_id("Alchemia") == "new-id"
+    # The old folder's checkpoint does not filter the new folder's listing
+    assert "modifiedTime" not in api.queries[-1]
+
+
+@pytest.mark.parametrize(("resolved_id", "checkpointed"), [("old-id", True), ("new-id", False)])
+def test_sync_google_docs_checkpoints_confirmed_folder(
+    monkeypatch,
+    tmp_path,
+    resolved_id,
+    checkpointed,
+):
+    from alchemia.channels import google_docs
+
+    # The cached ID still lists docs; Drive may now resolve the name elsewhere
+    google_docs._save_folder_id("Alchemia", "old-id")
+    api = FolderFilesAPI(resolved_id, {"old-id": [{"id": "d1", "name": "One", "mimeType": ""}]})
+    monkeypatch.setattr(google_docs, "_check_dependencies", lambda: True)
+    monkeypatch.setattr(google_docs, "_build_service", lambda: FakeDrive(api))
+    synced = {"name": "One", "status": "synced", "path": str(tmp_path / "One.bin")}
+    monkeypatch.setattr(google_docs, "_sync_one", lambda *a: synced)
+
+    google_docs.sync_google_docs(output_dir=tmp_path)
+
+    assert (google_docs._sync_checkpoint("Alchemia", tmp_path) is not None) is checkpointed
+    assert google_docs._cached_folder_id("Alchemia") == resolved_id
+
+
+def test_get_status_single_folder_query(monkeypatch):
+    from alchemia.channels import google_docs
+
+    api = CountingFilesAPI([{"id": "folder-1", "name": "Alchemia"}], [{"id": "d1"}])
+    service = FakeDrive(api)
+    monkeypatch.setattr(google_docs, "_check_dependencies", lambda: True)
+    monkeypatch.setattr(google_docs, "_get_credentials", FakeCreds)
+    monkeypatch.setattr(google_docs, "_build_service", lambda: service)
+
+    status = google_docs.get_status()
+    assert status["folder_found"] is True
+    assert status["doc_count"] == 1
+    assert len(api.queries) == 2  # one folder lookup + one count
+    assert api.fields == "nextPageToken, files(id)"
+
+
+class FakeExportRequest:
+    def __init__(self, content):
+        self.content = content
+
+    def execute(self, http=None, num_retries=0):
+        if self.content is None:
+            raise RuntimeError("export failed")
+        return self.content
+
+
+class FakeExportFiles:
+    def __init__(self, contents):
+        self.contents = contents
+        self.media_ids = []
+
+    def export_media(self, fileId, mimeType):
+        return FakeExportRequest(self.contents.get(fileId))
+
+    def export(self, fileId, mimeType):
+        return self.export_media(fileId, mimeType)
+
+    def get_media(self, fileId):
+        self.media_ids.append(fileId)
+        return FakeExportRequest(self.contents.get(f"media:{fileId}"))
+
+
+@pytest.fixture
+def fake_media(monkeypatch):
+    """Stand-in googleapiclient.http whose downloader writes in two chunks."""
+    import sys
+    import types
+
+    class MediaIoBaseDownload:
+        def __init__(self, fh, request, chunksize):
+            self.fh = fh
+            self.body = None
+            self.request = request
+
+        def next_chunk(self, num_retries=0):
+            if self.body is None:
+                self.body = self.request.execute()
+                self.fh.write(self.body[:1])
+                return None, False
+            self.fh.write(self.body[1:])
+            return None, True
+
+    module = types.ModuleType("googleapiclient.http")
+    module.MediaIoBaseDownload = MediaIoBaseDownload
+    monkeypatch.setitem(sys.modules, "googleapiclient.http", module)
+
+
+@pytest.mark.usefixtures("fake_media")
+def test_sync_google_docs_concurrent_in_listing_order(monkeypatch, tmp_path):
+    from alchemia.channels import google_docs
+
+    docs = [
+        {"id": "d1", "name": "One", "mimeType": GDOC_MIME, "modifiedTime": "2026-01-01T00:00:00Z"},
+        {"id": "d2", "name": "Two", "mimeType": GDOC_MIME, "modifiedTime": "2026-01-01T00:00:00Z"},
+        {"id": "d3", "name": "Old", "mimeType": GDOC_MIME, "modifiedTime": "2000-01-01T00:00:00Z"},
+        {"id": "d4", "name": "scan.pdf", "mimeType": "application/pdf", "modifiedTime": ""},
+    ]
+    (tmp_path / "Old.md").write_text("cached")
+    service = FakeDrive(FakeExportFiles({"d1": b"# One", "media:d4": b"%PDF"}))
+    monkeypatch.setattr(google_docs, "iter_docs", lambda **kw: iter(docs))
+    monkeypatch.setattr(google_docs, "_build_service", lambda: service)
+    monkeypatch.setattr(google_docs, "_folder_confirmed", lambda *a: True)
+    monkeypatch.setattr(google_docs, "_thread_http", object)
+
+    results = google_docs.sync_google_docs(output_dir=tmp_path)
+
+    assert [r["status"] for r in results] == ["synced", "failed", "up_to_date", "synced"]
+    assert (tmp_path / "One.md").read_bytes() == b"# One"
+    assert (tmp_path / "scan.pdf").read_bytes() == b"%PDF"
+    assert (tmp_path / "Old.md").read_text() == "cached"
+    assert not list(tmp_path.glob("*.part"))
+    # A failed Google Doc export is not retried as a plain download
+    assert service.api.media_ids == ["d4"]
+
+
+def test_export_gdoc_and_download_file_do_not_fall_back():
+    from alchemia.channels import google_docs
+
+    files = FakeExportFiles({"d1": b"# One", "media:d2": b"%PDF"})
+    service = FakeDrive(files)
+    assert google_docs.export_gdoc("d1", "text/markdown", service) == b"# One"
+    assert google_docs.export_gdoc("d2", "text/markdown", service) is None
+    assert google_docs.download_file("d2", service) == b"%PDF"
+    assert files.media_ids == ["d2"]
+
+
+def test_iter_docs_pages_lazily(monkeypatch):
+    from alchemia.channels import google_docs
+
+    class PagedFiles:
+        def __init__(self):
+            self.calls = []
+
+        def list(self, **kwargs):
+            self.calls.append(kwargs)
+            return self
+
+        def execute(self, num_retries=0):
+            kwargs = self.calls[-1]
+            if kwargs["fields"] == "files(id)":
+                return {"files": [{"id": "folder-1"}]}
+            if kwargs["pageToken"] is None:
+                return {"files": [{"id": "a"}, {"id": "b"}], "nextPageToken": "p2"}
+            return {"files": [{"id": "c"}]}
+
+    api = PagedFiles()
+    monkeypatch.setattr(google_docs, "_check_dependencies", lambda: True)
+    monkeypatch.setattr(google_docs, "_build_service", lambda: FakeDrive(api))
+
+    docs = google_docs.iter_docs()
+    assert next(docs)["id"] == "a"
+    assert len(api.calls) == 2  # folder lookup + first page only
+    assert [d["id"] for d in docs] == ["b", "c"]
+    assert api.calls[-1]["pageSize"] == 1000
+
+
+@pytest.mark.usefixtures("fake_media")
+def test_sync_google_docs_incremental_checkpoint(monkeypatch, tmp_path):
+    from alchemia.channels import google_docs
+
+    seen = []
+    contents = {"d1": b"# One"}
+    docs = [{"id": "d1", "name": "One", "mimeType": GDOC_MIME, "modifiedTime": ""}]
+
+    def fake_iter_docs(folder_name=None, modified_after=None):
+        seen.append(modified_after)
+        return iter(docs)
+
+    monkeypatch.setattr(google_docs, "iter_docs", fake_iter_docs)
+    monkeypatch.setattr(google_docs, "_build_service", lambda: FakeDrive(FakeExportFiles(contents)))
+    monkeypatch.setattr(google_docs, "_folder_confirmed", lambda *a: True)
+    monkeypatch.setattr(google_docs, "_thread_http", object)
+    out = tmp_path / "out"
+
+    google_docs.sync_google_docs(output_dir=out)
+    checkpoint = google_docs._sync_checkpoint("Alchemia", out)
+    assert checkpoint["files"] == ["One.md"]
+    google_docs.sync_google_docs(output_dir=out)
+    google_docs.sync_google_docs(output_dir=out, full=True)
+    assert seen == [None, checkpoint["started"], None]
+
+    # A failed export leaves the checkpoint where it was
+    contents.clear()
+    google_docs._write_last_sync("Alchemia", out, "2000-01-01T00:00:00Z", set())
+    (out / "One.md").unlink()
+    google_docs.sync_google_docs(output_dir=out)
+    assert google_docs._sync_checkpoint("Alchemia", out)["started"] == "2000-01-01T00:00:00Z"
+
+
+@pytest.mark.usefixtures("fake_media")
+def test_sync_google_docs_checkpoint_needs_local_copies(monkeypatch, tmp_path):
+    from alchemia.channels import google_docs
+
+    seen = []
+    docs = [
+        {"id": "d1", "name": "One", "mimeType": GDOC_MIME, "modifiedTime": ""},
+        {"id": "d2", "name": "Two", "mimeType": GDOC_MIME, "modifiedTime": ""},
+    ]
+
+    def fake_iter_docs(folder_name=None, modified_after=None):
+        seen.append(modified_after)
+        return iter(docs)
+
+    service = FakeDrive(FakeExportFiles({"d1": b"# One", "d2": b"# Two"}))
+    monkeypatch.setattr(google_docs, "iter_docs", fake_iter_docs)
+    monkeypatch.setattr(google_docs, "_build_service", lambda: service)
+    monkeypatch.setattr(google_docs, "_folder_confirmed", lambda *a: True)
+    monkeypatch.setattr(google_docs, "_thread_http", object)
+    out = tmp_path / "out"
+
+    google_docs.sync_google_docs(output_dir=out)
+    # Another output directory has no checkpoint of its own
+    google_docs.sync_google_docs(output_dir=tmp_path / "elsewhere")
+    # A deleted local copy brings back the full listing
+    (out / "Two.md").unlink()
+    google_docs.sync_google_docs(output_dir=out)
+    assert (out / "Two.md").exists()
+    started = google_docs._sync_checkpoint("Alchemia", out)["started"]
+    google_docs.sync_google_docs(output_dir=out)
+    assert seen == [None, None, None, started]
+
+
+def test_drive_timestamp_orders_like_drive():
+    from alchemia.channels.google_docs import _drive_timestamp, _is_drive_timestamp
+
+    local = _drive_timestamp(1767225600.5)
+    assert local == "2026-01-01T00:00:00.500Z"
+    assert local >= "2026-01-01T00:00:00.499Z"
+    assert local < "2026-01-01T00:00:01.000Z"
+    assert _is_drive_timestamp("2026-01-01T00:00:00Z")
+    assert not _is_drive_timestamp("")
+    assert not _is_drive_timestamp(None)
+
+
+def test_local_mtimes_lists_files_only(tmp_path):
+    import os
+
+    from alchemia.channels.google_docs import _local_mtimes
+
+    (tmp_path / "a.md").write_text("a")
+    os.utime(tmp_path / "a.md", (1000.0, 1000.0))
+    (tmp_path / "sub").mkdir()
+    assert _local_mtimes(tmp_path) == {"a.md": 1000.0}
+
+
+def test_sync_one_fails_doc_without_credentials(monkeypatch, tmp_path):
+    from alchemia.channels import google_docs
+
+    monkeypatch.setattr(google_docs, "_http_local", google_docs.threading.local())
+    monkeypatch.setattr(google_docs, "_get_credentials", lambda: None)
+    doc = {"id": "d1", "name": "One", "mimeType": GDOC_MIME}
+
+    result = google_docs._sync_one(None, doc, "text/markdown", tmp_path / "One.md")
+
+    assert result == {"name": "One", "status": "failed", "error": "No valid Google credentials"}
@@ -1,5 +1,7 @@
 """Tests for the INTAKE stage."""
 
+from pathlib import Path
+
 from alchemia.intake.crawler import crawl, file_metadata, sha256_file
 from alchemia.intake.dedup import mark_duplicates
 
@@ -61,7 +63,7 @@ def test_file_metadata_fields(tmp_path):
     assert meta["extension"] == ".md"
     assert meta["mime_type"] == "text/markdown"
     assert meta["size_bytes"] == len("# Hello World")
-    assert meta["sha256"]
+    assert meta["sha256"] is None  # hashed later, only when needed
     assert meta["depth"] == 0
 
 
@@ -78,6 +80,73 @@ def test_mark_duplicates():
     assert result[2]["duplicate"] is False  # unique
 
 
+def test_mark_duplicates_hashes_only_candidates(tmp_path, monkeypatch):
+    from alchemia.intake import crawler, dedup
+
+    monkeypatch.setattr(dedup, "PREFIX_BYTES", 4)
+    files = {
+        "a/deep/copy.txt": b"same-content",
+        "b/copy.txt": b"same-content",
+        "c/near.txt": b"same-CONTENT",  # same size and prefix, different tail
+        "d/other.txt": b"diff-content",  # same size, different prefix
+        "e/unique.txt": b"unique size",
+    }
+    for rel, data in files.items():
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_bytes(data)
+    entries = crawl([tmp_path], max_workers=1)
+
+    full_reads = []
+    real_sha256_file = dedup.sha256_file
+    monkeypatch.setattr(dedup, "sha256_file", lambda p: full_reads.append(p) or real_sha256_file(p))
+    by_name = {e["filename"]: e for e in mark_duplicates(entries)}
+
+    assert sorted(Path(p).name for p in full_reads) == ["copy.txt", "copy.txt", "near.txt"]
+    assert by_name["unique.txt"]["sha256"] is None
+    assert by_name["other.txt"]["sha256"] is None
+    assert by_name["near.txt"]["duplicate"] is False
+    dups = [e for e in entries if e["duplicate"]]
+    assert [e["relative_path"] for e in dups] == ["b/copy.txt"]
+    assert by_name["copy.txt"]["sha256"] == crawler.sha256_file(tmp_path / "b/copy.txt")
+
+
+def test_mark_duplicates_compares_known_digests(tmp_path, monkeypatch):
+    from alchemia.intake import dedup
+
+    monkeypatch.setattr(dedup, "PREFIX_BYTES", 4)
+    for rel in ("a/deep/old.txt", "b/new.txt", "c/other.txt"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+    (tmp_path / "a/deep/old.txt").write_bytes(b"same-content")
+    (tmp_path / "b/new.txt").write_bytes(b"same-content")
+    (tmp_path / "c/other.txt").write_bytes(b"else-content")
+    entries = crawl([tmp_path], max_workers=1)
+    by_name = {e["filename"]: e for e in entries}
+    # Hashed by an earlier run; only the other two are hashed now
+    by_name["old.txt"]["sha256"] = sha256_file(tmp_path / "a/deep/old.txt")
+
+    full_reads = []
+    real_sha256_file = dedup.sha256_file
+    monkeypatch.setattr(dedup, "sha256_file", lambda p: full_reads.append(p) or real_sha256_file(p))
+    mark_duplicates(entries)
+
+    assert [Path(p).name for p in full_reads] == ["new.txt"]
+    assert by_name["new.txt"]["duplicate_of"] == by_name["old.txt"]["path"]
+    assert by_name["other.txt"]["duplicate"] is False
+
+
+def test_hash_all_pooled_keeps_order(monkeypatch):
+    from alchemia.intake import dedup
+
+    paths = [f"p{i}" for i in range(5)]
+    monkeypatch.setattr(dedup, "PARALLEL_HASH_THRESHOLD", 2)
+    assert dedup._hash_all(str.upper, paths) == [p.upper() for p in paths]
+
+    # Below the threshold no pool is started at all
+    monkeypatch.setattr(dedup, "PARALLEL_HASH_THRESHOLD", 64)
+    monkeypatch.setattr(dedup, "ThreadPoolExecutor", None)
+    assert dedup._hash_all(str.upper, paths) == [p.upper() for p in paths]
+
+
 def test_crawl_nonexistent_dir(tmp_path, capsys):
     entries = crawl([tmp_path / "nonexistent"])
     assert entries == []
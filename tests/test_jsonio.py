@@ -0,0 +1,72 @@
+"""Tests for the shared JSON helpers."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from alchemia.common import jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_bytes_and_str(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    assert jsonio.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert jsonio.loads('{"é": 1.5}') == {"é": 1.5}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_decode_error_is_stdlib_type(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads(b"{not json")
+
+
+def test_load_path(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"title": "caf\\u00e9"}', encoding="utf-8")
+    assert jsonio.load_path(path) == {"title": "café"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_path_round_trip(monkeypatch, tmp_path, use_orjson):
+    from datetime import datetime, timezone
+
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    path = tmp_path / "out.json"
+    jsonio.dump_path({"entries": [{"path": Path("/a/b"), "when": when}], "title": "café"}, path)
+
+    data = jsonio.load_path(path)
+    assert data == {"entries": [{"path": "/a/b", "when": str(when)}], "title": "café"}
+    assert path.read_text(encoding="utf-8").startswith('{\n  "entries"')
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_path_compact(monkeypatch, tmp_path, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    path = tmp_path / "out.json"
+    jsonio.dump_path({"a": [1, 2]}, path, indent=False)
+    assert path.read_text() == '{"a":[1,2]}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_ndjson_round_trip(monkeypatch, tmp_path, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    records = [{"path": Path("/a"), "n": 1}, {"title": "café"}]
+    path = tmp_path / "out.jsonl"
+
+    assert jsonio.dump_ndjson(iter(records), path) == 2
+    assert path.read_bytes().count(b"\n") == 2
+    assert list(jsonio.iter_ndjson(path)) == [{"path": "/a", "n": 1}, {"title": "café"}]
+
+
+def test_iter_ndjson_skips_blank_lines(tmp_path):
+    path = tmp_path / "in.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n{"a": 2}\n')
+    assert list(jsonio.iter_ndjson(path)) == [{"a": 1}, {"a": 2}]
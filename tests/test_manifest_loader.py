@@ -19,6 +19,49 @@ def test_enrich_from_manifest_matches(tmp_path):
     assert result[0]["manifest"]["manifest_category"] == "Theory"
 
 
+def test_manifest_parsed_once_until_changed(tmp_path, monkeypatch):
+    from alchemia.intake import manifest_loader
+
+    monkeypatch.setattr(manifest_loader, "_manifest_cache", {})
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("ID,Title,Category\n1,report.md,Theory\n")
+    first = manifest_loader._load_manifest(manifest)
+    assert manifest_loader._load_manifest(manifest) is first
+
+    manifest.write_text("ID,Title,Category\n1,report.md,Strategy\n")
+    assert manifest_loader._load_manifest(manifest)["report.md"]["manifest_category"] == (
+        "Strategy"
+    )
+
+
+def test_manifest_tolerates_missing_columns_and_short_rows(tmp_path):
+    from alchemia.intake.manifest_loader import _load_manifest
+
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("Category,Title,ID\nTheory,a.md,1\nShort\n")
+    assert _load_manifest(manifest) == {
+        "a.md": {
+            "manifest_id": "1",
+            "manifest_category": "Theory",
+            "manifest_tags": "",
+            "manifest_type": "",
+            "manifest_status": "",
+            "manifest_primary_use": "",
+            "manifest_phase": "",
+            "manifest_dependencies": "",
+        },
+    }
+
+
+def test_stem_matches_pathlib():
+    from pathlib import Path
+
+    from alchemia.intake.manifest_loader import _stem
+
+    for name in ["a.md", "a.tar.gz", ".bashrc", "a.", "readme", "a..b"]:
+        assert _stem(name) == Path(name).stem
+
+
 def test_enrich_from_manifest_no_match(tmp_path):
     csv_content = (
         "ID,Category,Title,Size_KB,Type,Status,Primary_Tags,Key_Dependencies,Primary_Use,Phase\n"
@@ -0,0 +1,70 @@
+"""Tests for the mtime/size-keyed pickle cache."""
+
+import os
+import pickle
+
+import pytest
+
+from alchemia.common import pickle_cache
+from alchemia.common.pickle_cache import load_cached
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setattr(pickle_cache, "CACHE_DIR", path)
+    return path
+
+
+def test_second_load_skips_parse(tmp_path, cache_dir):
+    src = tmp_path / "data.json"
+    src.write_text("[1, 2]")
+    calls = []
+
+    def parse(path):
+        calls.append(path)
+        return {"size": len(path.read_text())}
+
+    assert load_cached(src, parse) == {"size": 6}
+    assert load_cached(src, parse) == {"size": 6}
+    assert len(calls) == 1
+    assert len(list(cache_dir.glob("data.json.*.pkl"))) == 1
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_changed_source_is_reparsed(tmp_path):
+    src = tmp_path / "data.json"
+    src.write_text("a")
+    load_cached(src, lambda p: p.read_text())
+
+    src.write_text("bb")
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_cached(src, lambda p: p.read_text()) == "bb"
+
+
+def test_same_name_in_other_dir_is_separate(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "data.json").write_text("a")
+    (tmp_path / "b" / "data.json").write_text("b")
+    assert load_cached(tmp_path / "a" / "data.json", lambda p: p.read_text()) == "a"
+    assert load_cached(tmp_path / "b" / "data.json", lambda p: p.read_text()) == "b"
+
+
+def test_pickle_next_to_source_is_never_loaded(tmp_path):
+    src = tmp_path / "data.json"
+    src.write_text("x")
+    st = src.stat()
+    planted = (st.st_mtime_ns, st.st_size), "planted"
+    (tmp_path / "data.json.pkl").write_bytes(pickle.dumps(planted))
+    assert load_cached(src, lambda p: p.read_text()) == "x"
+
+
+def test_corrupt_cache_falls_back_to_parse(tmp_path, cache_dir):
+    src = tmp_path / "data.json"
+    src.write_text("x")
+    load_cached(src, lambda p: p.read_text())
+    [cached] = cache_dir.glob("*.pkl")
+    cached.write_bytes(b"not a pickle")
+    assert load_cached(src, lambda p: p.read_text()) == "x"
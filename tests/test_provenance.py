@@ -3,6 +3,7 @@
 import yaml
 
 from alchemia.alchemize.provenance import (
+    generate_all_provenance_yaml,
     generate_provenance_registry,
     generate_provenance_yaml,
     get_deployment_plan,
@@ -48,7 +49,39 @@ def test_filters_by_repo(self):
         assert parsed["total_materials"] == 1
 
 
+class TestGenerateAllProvenanceYaml:
+    def test_one_document_per_repo(self):
+        entries = [
+            _entry(repo="repo-a"),
+            _entry(filename="b.md", repo="repo-b"),
+            _entry(filename="c.md", repo="repo-a"),
+            _entry(filename="d.md", repo=None),
+        ]
+        result = generate_all_provenance_yaml(entries)
+        assert sorted(result) == ["org-a/repo-a", "org-a/repo-b"]
+        parsed = yaml.safe_load(result["org-a/repo-a"])
+        assert [m["filename"] for m in parsed["materials"]] == ["test.md", "c.md"]
+
+    def test_matches_single_repo_output(self):
+        entries = [_entry(repo="repo-a"), _entry(filename="b.md", repo="repo-b")]
+        single = yaml.safe_load(generate_provenance_yaml(entries, "repo-b", "org-a"))
+        bulk = yaml.safe_load(generate_all_provenance_yaml(entries)["org-a/repo-b"])
+        single.pop("generated")
+        bulk.pop("generated")
+        assert bulk == single
+
+
 class TestGenerateProvenanceRegistry:
+    def test_shared_generated_at(self):
+        stamp = "2026-03-01T00:00:00+00:00"
+        registry = generate_provenance_registry([_entry()], generated_at=stamp)
+        (doc,) = generate_all_provenance_yaml([_entry()], generated_at=stamp).values()
+        assert registry["generated"] == stamp
+        assert yaml.safe_load(doc)["generated"] == stamp
+        assert yaml.safe_load(generate_provenance_yaml([_entry()], "repo-a", "org-a", stamp)) == (
+            yaml.safe_load(doc)
+        )
+
     def test_bidirectional_mapping(self):
         result = generate_provenance_registry([_entry()])
         assert result["total_classified"] == 1
@@ -82,6 +115,52 @@ def test_action_categories(self):
         ]
         plan = get_deployment_plan(entries)
         key = "org-a/repo-a"
-        assert len(plan[key]["deploy"]) >= 1
-        assert len(plan[key]["convert"]) == 1
-        assert len(plan[key]["reference"]) == 1
+        assert len(plan[key].deploy) >= 1
+        assert len(plan[key].convert) == 1
+        assert len(plan[key].reference) == 1
+
+    def test_deploy_entries_get_target_path(self):
+        plan = get_deployment_plan([_entry(ext=".md")])
+        (entry,) = plan["org-a/repo-a"].deploy
+        assert entry["_deploy_path"].endswith(entry["filename"])
+        assert plan["org-a/repo-a"].skip == []
+
+
+def test_unhashed_entry_hashed_on_demand(tmp_path):
+    import hashlib
+
+    src = tmp_path / "note.md"
+    src.write_bytes(b"# note")
+    entry = _entry(filename="note.md")
+    entry["path"] = str(src)
+    entry["sha256"] = None
+
+    registry = generate_provenance_registry([entry, _entry(filename="known.md")])
+    expected = hashlib.sha256(b"# note").hexdigest()
+    late, known = registry["repo_to_sources"]["org-a/repo-a"]
+    assert late["sha256"] == expected
+    assert late["hashed_at"] == "alchemize"
+    assert "hashed_at" not in known
+    assert entry["sha256"] == expected
+    (doc,) = generate_all_provenance_yaml([entry]).values()
+    assert yaml.safe_load(doc)["materials"][0]["hashed_at"] == "alchemize"
+
+
+def test_hash_missing_uses_dedup_pool(monkeypatch, tmp_path):
+    from alchemia.alchemize.provenance import hash_missing
+    from alchemia.intake import dedup
+
+    pools = []
+
+    def fake_hash_all(hash_fn, paths):
+        pools.append(paths)
+        return ["h"] * len(paths)
+
+    monkeypatch.setattr(dedup, "_hash_all", fake_hash_all)
+    entries = [_entry(filename=f"{i}.md") for i in range(3)]
+    entries[0]["sha256"] = None
+    entries[2]["sha256"] = None
+
+    assert hash_missing(entries) == 2
+    assert pools == [["/source/0.md", "/source/2.md"]]
+    assert [e.get("hashed_at") for e in entries] == ["alchemize", None, "alchemize"]
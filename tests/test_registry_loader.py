@@ -3,6 +3,7 @@
 import json
 
 from alchemia.absorb.registry_loader import load_registry
+from alchemia.common import jsonio
 
 
 def _write_registry(tmp_path, organs):
@@ -28,6 +29,7 @@ def test_load_registry_from_fixture(tmp_path):
     assert "by_name" in result
     assert "by_org" in result
     assert "archived" in result
+    assert result["toplevel_dispatch"]["repo-a"][0] == 1
     assert len(result["repos"]) == 1
 
 
@@ -76,3 +78,12 @@ def test_load_registry_by_org_grouping(tmp_path):
     )
     result = load_registry(path)
     assert len(result["by_org"]["shared-org"]) == 2
+
+
+def test_load_registry_stdlib_json_fallback(tmp_path, monkeypatch):
+    path = _write_registry(
+        tmp_path,
+        {"ORGAN-I": {"repositories": [{"name": "repo-a", "org": "org-a"}]}},
+    )
+    monkeypatch.setattr(jsonio, "orjson", None)
+    assert "repo-a" in load_registry(path)["by_name"]
@@ -1,5 +1,6 @@
 """Tests for synthesize.py — creative brief generation."""
 
+import os
 from unittest.mock import patch
 
 from alchemia.synthesize import (
@@ -58,6 +59,16 @@ def test_generate_creative_brief_unknown_organ(mock_fmt, mock_taste, mock_chain)
     assert "ORGAN-X" in brief  # Uses the key as name
 
 
+@patch("alchemia.synthesize.analyze_references")
+@patch("alchemia.synthesize.resolve_aesthetic_chain")
+@patch("alchemia.synthesize.load_taste")
+def test_generate_creative_brief_skips_reference_analysis(mock_taste, mock_chain, mock_analyze):
+    mock_taste.return_value = {"references": []}
+    mock_chain.return_value = {"references": []}
+    generate_creative_brief("ORGAN-I")
+    mock_analyze.assert_not_called()
+
+
 @patch("alchemia.synthesize.generate_creative_brief")
 def test_generate_all_briefs(mock_brief, tmp_path):
     mock_brief.return_value = "# Brief content"
@@ -67,6 +78,37 @@ def test_generate_all_briefs(mock_brief, tmp_path):
         assert p.exists()
 
 
+@patch("alchemia.synthesize.load_taste")
+def test_generate_all_briefs_loads_taste_once(mock_taste, tmp_path):
+    mock_taste.return_value = {"references": []}
+    generate_all_briefs(output_dir=tmp_path)
+    assert mock_taste.call_count == 1
+
+
+@patch("alchemia.synthesize.generate_creative_brief")
+def test_generate_all_briefs_skips_current(mock_brief, tmp_path):
+    mock_brief.return_value = "# Brief content"
+    taste = tmp_path / "taste.yaml"
+    taste.write_text("references: []\n")
+    out = tmp_path / "briefs"
+    outputs = generate_all_briefs(output_dir=out, taste_path=taste)
+    assert mock_brief.call_count == len(ORGAN_MAP)
+
+    mock_brief.reset_mock()
+    assert generate_all_briefs(output_dir=out, taste_path=taste) == outputs
+    mock_brief.assert_not_called()
+
+    generate_all_briefs(output_dir=out, taste_path=taste, force=True)
+    assert mock_brief.call_count == len(ORGAN_MAP)
+
+    # A taste.yaml newer than the briefs makes them all stale
+    mock_brief.reset_mock()
+    newer = outputs[0].stat().st_mtime_ns + 1_000_000_000
+    os.utime(taste, ns=(newer, newer))
+    generate_all_briefs(output_dir=out, taste_path=taste)
+    assert mock_brief.call_count == len(ORGAN_MAP)
+
+
 def test_workflow_integration_example():
     example = generate_workflow_integration_example()
     assert len(example) > 0
@@ -1,5 +1,9 @@
 """Tests for alchemia ALCHEMIZE transformer."""
 
+from pathlib import Path
+
+import pytest
+
 from alchemia.alchemize.transformer import classify_action, get_deploy_path, sanitize_filename
 
 
@@ -65,9 +69,49 @@ def test_collapse_dashes(self):
     def test_empty_returns_unnamed(self):
         assert sanitize_filename("...") == "unnamed"
 
+    def test_adjacent_unsafe_chars_collapse(self):
+        assert sanitize_filename("-notes:<draft>?.md") == "notes-draft-.md"
+
 
 class TestGetDeployPath:
     def test_correct_path(self):
         entry = _classified_entry(".md")
         result = get_deploy_path(entry)
         assert result == "docs/source-materials/test.md"
+
+
+class TestConvertDocxBatch:
+    @pytest.fixture(autouse=True)
+    def _reprobe_pandoc(self):
+        from alchemia.alchemize import transformer
+
+        transformer._pandoc_path.cache_clear()
+        yield
+        transformer._pandoc_path.cache_clear()
+
+    def test_converts_each_file(self, tmp_path, monkeypatch):
+        from alchemia.alchemize import transformer
+
+        def fake_run(cmd, **kwargs):
+            out = Path(cmd[cmd.index("-o") + 1])
+            if "bad" not in out.name:
+                out.write_text(f"# {out.stem}\n")
+
+        monkeypatch.setattr(transformer.shutil, "which", lambda name: "/usr/bin/pandoc")
+        monkeypatch.setattr(transformer.subprocess, "run", fake_run)
+        sources = [tmp_path / f"{name}.docx" for name in ("a", "bad", "c")]
+
+        result = transformer.convert_docx_batch(sources, tmp_path, max_workers=2)
+        monkeypatch.setattr(transformer.shutil, "which", lambda name: pytest.fail("re-probed"))
+        transformer.convert_docx_to_md(sources[0], tmp_path)
+        assert list(result) == sources
+        assert result[sources[0]] == tmp_path / "a.md"
+        assert result[sources[1]] is None
+        assert result[sources[2]].read_text() == "# c\n"
+
+    def test_without_pandoc(self, tmp_path, monkeypatch):
+        from alchemia.alchemize import transformer
+
+        monkeypatch.setattr(transformer.shutil, "which", lambda name: None)
+        source = tmp_path / "a.docx"
+        assert transformer.convert_docx_batch([source], tmp_path) == {source: None}